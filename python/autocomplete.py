@@ -0,0 +1,99 @@
+import heapq
+import math
+import threading
+import weakref
+from bisect import bisect_left
+
+from text_utils import normalize_name
+
+# 업체명 자동완성: norm과 초성(예: "대한전기" -> "ㄷㅎㅈㄱ")을 정렬한 배열에서
+# bisect로 접두어 구간을 찾음. DB를 불러올 때마다 한 번 만들어 둠.
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSEONG_SET = frozenset(CHOSEONG)
+_HANGUL_FIRST, _HANGUL_LAST = 0xAC00, 0xD7A3
+_SYLLABLES_PER_INITIAL = 21 * 28
+_END = "\U0010ffff"
+
+DEFAULT_LIMIT = 10
+
+# EntryStore -> CompletionIndex; dropped with the store, rebuilt when the store has grown.
+_CACHE = weakref.WeakKeyDictionary()
+_LOCK = threading.Lock()
+
+
+def choseong(text):
+    # Hangul syllables become their initial consonant; everything else is kept as is.
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_FIRST <= code <= _HANGUL_LAST:
+            out.append(CHOSEONG[(code - _HANGUL_FIRST) // _SYLLABLES_PER_INITIAL])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def is_choseong_query(q):
+    letters = q.replace(" ", "")
+    return bool(letters) and all(ch in _CHOSEONG_SET for ch in letters)
+
+
+class CompletionIndex:
+    # Two sorted arrays of (key, row index), split into parallel lists so bisect works on the
+    # plain key strings.
+    def __init__(self, data):
+        self.size = len(data)
+        norms = data.column("norm")
+        by_norm = sorted((norm, i) for i, norm in enumerate(norms) if norm)
+        by_initials = sorted((choseong(norm), i) for norm, i in by_norm)
+        self.norm_keys = [key for key, _ in by_norm]
+        self.norm_rows = [i for _, i in by_norm]
+        self.initial_keys = [key for key, _ in by_initials]
+        self.initial_rows = [i for _, i in by_initials]
+
+    def prefix_rows(self, q):
+        if is_choseong_query(q):
+            keys, rows = self.initial_keys, self.initial_rows
+        else:
+            keys, rows = self.norm_keys, self.norm_rows
+        lo = bisect_left(keys, q)
+        hi = bisect_left(keys, q + _END, lo)
+        return keys, rows, lo, hi
+
+
+def completion_index(data):
+    with _LOCK:
+        index = _CACHE.get(data)
+        if index is None or index.size != len(data):
+            index = CompletionIndex(data)
+            _CACHE[data] = index
+        return index
+
+
+def suggest(data, query, limit=DEFAULT_LIMIT):
+    # -> row indexes whose name (or 초성) starts with `query`: exact match first, then by 시평.
+    q = normalize_name(query)
+    if not q:
+        return []
+    keys, rows, lo, hi = completion_index(data).prefix_rows(q)
+    sipyung = data.column("sipyung")
+
+    def rank(n):
+        value = sipyung[rows[n]]
+        return keys[n] == q, 0.0 if math.isnan(value) else value
+
+    return [rows[n] for n in heapq.nlargest(limit, range(lo, hi), key=rank)]
+
+
+def suggest_all(stores, query, limit=DEFAULT_LIMIT):
+    # 전체 mode: [(industry, row)] merged across industries with the same ranking.
+    q = normalize_name(query)
+    picked = []
+    for order, (industry, data) in enumerate(stores.items()):
+        norms, sipyung = data.column("norm"), data.column("sipyung")
+        for i in suggest(data, q, limit):
+            exact = norms[i] == q or choseong(norms[i]) == q
+            value = 0.0 if math.isnan(sipyung[i]) else sipyung[i]
+            picked.append((exact, value, -order, industry, i))
+    picked = heapq.nlargest(limit, picked, key=lambda p: p[:3])
+    return [(industry, stores[industry][i]) for _, _, _, industry, i in picked]
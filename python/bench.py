@@ -0,0 +1,349 @@
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from synth_db import sample_names, write_workbook
+
+BUDGETS_PATH = Path(__file__).resolve().parent / "bench_budgets.json"
+
+_CASES = {}
+_WORKBOOKS = {}
+
+
+def bench(name):
+    def register(fn):
+        _CASES[name] = fn
+        return fn
+
+    return register
+
+
+def sample_entries(count, seed=7):
+    from notes_parser import parse_notes
+    from text_utils import normalize_names
+
+    rnd = random.Random(seed)
+    names = sample_names(count, seed)
+    regions = ["서울", "경기", "인천", "강원", "충북", "충남", "전북", "전남", "경북", "경남", "제주"]
+    grades = ["", "A0", "BBB+", "BB", "B-"]
+    entries = []
+    for name, norm in zip(names, normalize_names(names)):
+        notes = rnd.choice(["", "홍길동", "담당 김철수 010-1234-5678", "단독제외"])
+        entry = {
+            "name": name.split("\n")[0].strip(),
+            "norm": norm,
+            "region": str(rnd.choice(regions)),
+            "bizNo": f"{rnd.randint(100, 999)}-{rnd.randint(10, 99)}-{rnd.randint(10000, 99999)}",
+            "debtRatio": round(rnd.uniform(10, 400), 2),
+            "currentRatio": round(rnd.uniform(50, 900), 2),
+            "bizYears": float(rnd.randint(1, 40)),
+            "perf3y": float(rnd.randint(0, 12_000_000_000)),
+            "perf5y": float(rnd.randint(0, 20_000_000_000)),
+            "creditGrade": rnd.choice(grades),
+            "sipyung": float(rnd.randint(100_000_000, 50_000_000_000)),
+            "notes": notes,
+        }
+        entry.update(parse_notes(notes))
+        entries.append(entry)
+    return entries
+
+
+def measure_memory(build):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        keep = build()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del keep
+    return (after - before) / 1024
+
+
+def measure(fn, repeat=5):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
+
+
+@bench("normalize")
+def bench_normalize(size):
+    import text_utils
+
+    names = sample_names(size)
+    text_utils._normalize_cached.cache_clear()
+    queries = names[:200] * 20
+    return [
+        ("normalize_names (full DB)", measure(lambda: text_utils.normalize_names(names))[0], "ms"),
+        ("normalize_name per entry", measure(lambda: [text_utils._normalize(n) for n in names])[0], "ms"),
+        ("normalize_name repeated queries", measure(lambda: [text_utils.normalize_name(q) for q in queries])[0], "ms"),
+    ]
+
+
+@bench("memory")
+def bench_memory(size):
+    import pickle
+
+    from entry_store import EntryStore
+
+    blob = pickle.dumps(sample_entries(size))
+
+    def as_dicts():
+        return pickle.loads(blob)
+
+    def as_store():
+        store = EntryStore()
+        store.extend(pickle.loads(blob))
+        return store
+
+    return [
+        ("list of entry dicts", measure_memory(as_dicts), "KiB"),
+        ("EntryStore columns", measure_memory(as_store), "KiB"),
+    ]
+
+
+def synthetic_workbook(size):
+    path = _WORKBOOKS.get(size)
+    if path is None:
+        path = Path(tempfile.mkdtemp(prefix="bench_db_")) / f"synthetic_{size}.xlsx"
+        write_workbook(path, companies=size)
+        _WORKBOOKS[size] = path
+    return path
+
+
+@bench("load")
+def bench_load(size):
+    import db_loader
+
+    path = synthetic_workbook(size)
+    load_ms, data = measure(lambda: db_loader.load_db(path), repeat=3)
+    stats_ms, _ = measure(lambda: db_loader.load_db_stats(path), repeat=3)
+    db_loader.load_db_cached(path, force=True)
+    cached_ms, _ = measure(lambda: db_loader.load_db_cached(path))
+    return [
+        (f"load_db ({len(data)}건)", load_ms, "ms"),
+        ("load_db_stats", stats_ms, "ms"),
+        ("load_db_cached (warm)", cached_ms, "ms"),
+    ]
+
+
+@bench("progressive")
+def bench_progressive(size):
+    import db_loader
+
+    path = synthetic_workbook(size)
+    start = time.perf_counter()
+    first = None
+    sheets = 0
+    for _ in db_loader.iter_load_db(path):
+        if first is None:
+            first = (time.perf_counter() - start) * 1000
+        sheets += 1
+    total = (time.perf_counter() - start) * 1000
+    return [
+        ("iter_load_db first sheet", first or 0.0, "ms"),
+        (f"iter_load_db all sheets ({sheets})", total, "ms"),
+    ]
+
+
+def _search(data, query):
+    from text_utils import normalize_name
+
+    q = normalize_name(query)
+    return data.rows([i for i, norm in enumerate(data.column("norm")) if q in norm])
+
+
+@bench("search")
+def bench_search(size):
+    import db_loader
+
+    data = db_loader.load_db_cached(synthetic_workbook(size))
+    names = sample_names(size)
+    queries = [names[i].split("\n")[0][:4] for i in range(0, size, max(1, size // 50))]
+    per_query, _ = measure(lambda: [_search(data, q) for q in queries])
+    return [("do_search-style query", per_query / len(queries), "ms")]
+
+
+@bench("score")
+def bench_score(size):
+    import db_loader
+    import scoring
+    from config_store import get_industry_averages
+
+    data = db_loader.load_db_cached(synthetic_workbook(size))
+    averages = get_industry_averages()
+
+    def cold():
+        data.score_columns.clear()
+        return scoring.management_column(data, "mois", 0, "eung", averages)
+
+    cold_ms, _ = measure(cold, repeat=3)
+    rows = list(data)
+    warm_ms, _ = measure(lambda: [scoring.lookup_management(data, r, "mois", 0, "eung", averages) for r in rows])
+    return [
+        ("management column (cold)", cold_ms, "ms"),
+        ("management lookup per entry (warm)", warm_ms / max(1, len(rows)) * 1000, "us"),
+    ]
+
+
+@bench("resolve")
+def bench_resolve(size):
+    import db_loader
+    from search_core import resolve_biz_nos
+
+    data = db_loader.load_db_cached(synthetic_workbook(size))
+    biz_nos = [f"search:eung:{b}" for b in data.column("bizNo")]
+
+    def cold():
+        data._biz_index = None
+        return resolve_biz_nos(data, biz_nos)
+
+    cold_ms, _ = measure(cold, repeat=3)
+    warm_ms, _ = measure(lambda: resolve_biz_nos(data, biz_nos))
+    return [
+        (f"resolve_biz_nos cold ({len(biz_nos)}건)", cold_ms, "ms"),
+        ("resolve_biz_nos warm", warm_ms, "ms"),
+    ]
+
+
+@bench("filter")
+def bench_filter(size):
+    import db_loader
+    from query_filter import filter_indexes
+
+    data = db_loader.load_db_cached(synthetic_workbook(size))
+    queries = ["region:경기 sipyung>=30억", "debt<100% current>=150%", "perf5y>=10억 grade>=BBB-"]
+    per_query, _ = measure(lambda: [filter_indexes(data, q) for q in queries])
+    return [("filter query", per_query / len(queries), "ms")]
+
+
+@bench("autocomplete")
+def bench_autocomplete(size):
+    import autocomplete
+    import db_loader
+
+    data = db_loader.load_db_cached(synthetic_workbook(size))
+    norms = [norm for norm in data.column("norm") if norm]
+    queries = [norms[i][:n] for i in range(0, len(norms), max(1, len(norms) // 50)) for n in (2, 3)]
+    queries += [autocomplete.choseong(q) for q in queries[:20]]
+    build_ms, _ = measure(lambda: autocomplete.CompletionIndex(data), repeat=3)
+    autocomplete.completion_index(data)
+    per_key, _ = measure(lambda: [autocomplete.suggest(data, q) for q in queries])
+    return [
+        ("completion index build", build_ms, "ms"),
+        ("suggest per keystroke", per_key / len(queries), "ms"),
+    ]
+
+
+STARTUP_MODULES = ["search_app", "db_cli", "scoring", "ui_search", "swap_app"]
+
+_DIALOG_PROBE = (
+    "import sys, time\n"
+    "t = time.perf_counter()\n"
+    "import ui_search\n"
+    "from pathlib import Path\n"
+    "from db_loader import load_db_cached\n"
+    "load_db_cached(Path(sys.argv[1]))\n"
+    "print((time.perf_counter() - t) * 1000)\n"
+)
+
+
+def _importtime(code, *args):
+    # Sums the cumulative column of top-level rows from `python -X importtime`.
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code, *args],
+        cwd=str(Path(__file__).resolve().parent),
+        capture_output=True,
+        text=True,
+        env=dict(os.environ, PYTHONDONTWRITEBYTECODE="1"),
+    )
+    if proc.returncode != 0:
+        return None, proc
+    total_us = 0
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        parts = line.split("|")
+        if len(parts) == 3 and not parts[2].startswith("  "):
+            total_us += int(parts[1])
+    return total_us / 1000, proc
+
+
+@bench("startup")
+def bench_startup(size):
+    rows = []
+    for module in STARTUP_MODULES:
+        ms, _ = _importtime(f"import {module}")
+        rows.append((f"import {module}", float("nan") if ms is None else ms, "ms" if ms is not None else "ms (import 실패)"))
+    path = synthetic_workbook(size)
+    import db_loader
+
+    db_loader.load_db_cached(path)
+    _, proc = _importtime(_DIALOG_PROBE, str(path))
+    if proc.returncode == 0:
+        rows.append(("time-to-dialog (imports + snapshot)", float(proc.stdout.strip().splitlines()[-1]), "ms"))
+    else:
+        rows.append(("time-to-dialog (imports + snapshot)", float("nan"), "ms (import 실패)"))
+    return rows
+
+
+def load_budgets():
+    if not BUDGETS_PATH.exists():
+        return {}
+    return json.loads(BUDGETS_PATH.read_text(encoding="utf-8"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="업체 DB 성능 측정")
+    parser.add_argument("cases", nargs="*", help=f"실행할 항목 ({', '.join(_CASES)})")
+    parser.add_argument("--size", type=int, default=None, help="합성 업체 수")
+    parser.add_argument("--check", action="store_true", help="bench_budgets.json 기준 초과 시 실패")
+    args = parser.parse_args(argv)
+
+    budgets = load_budgets()
+    size = args.size or budgets.get("size", 3000)
+    limits = budgets.get("limits", {}) if args.check else {}
+    if args.check and size != budgets.get("size"):
+        parser.error(f"--check 는 예산 기준 크기({budgets.get('size')})에서만 의미가 있습니다.")
+
+    names = args.cases or list(_CASES)
+    failures = []
+    for name in names:
+        if name not in _CASES:
+            parser.error(f"알 수 없는 항목: {name}")
+        for label, value, unit in _CASES[name](size):
+            key = f"{name}/{label.split(' (')[0]}"
+            limit = limits.get(key)
+            mark = ""
+            if args.check and not math.isfinite(value):
+                # nan/inf means the measurement itself failed (e.g. an import broke); that
+                # must not pass just because nan > limit is False.
+                mark = "  측정 실패"
+                failures.append(key)
+            elif limit is not None:
+                mark = f"  (예산 {limit:g})"
+                if value > limit:
+                    mark += " 초과"
+                    failures.append(key)
+            print(f"{name:<12} {label:<40} {value:12.2f} {unit}{mark}")
+    if failures:
+        print(f"예산 초과 또는 측정 실패: {', '.join(failures)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
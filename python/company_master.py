@@ -0,0 +1,138 @@
+import argparse
+import json
+import os
+import pickle
+import sys
+import tempfile
+import threading
+
+from db_loader import SNAPSHOT_DIR
+from perf_trace import span
+from search_core import INDUSTRY_LABELS
+from text_utils import format_biz_no, normalize_biz_no
+
+MASTER_PATH = SNAPSHOT_DIR / "company_master.pickle"
+MASTER_FORMAT = 2
+
+SLOT_FIELDS = ("name", "region", "sipyung", "perf5y", "creditGrade", "managerName")
+
+_MASTER = {"data": None}
+_LOCK = threading.Lock()
+
+
+class CompanyMaster:
+    # bizNo digits -> {industry: slot}. Each industry's slots are replaced wholesale when that
+    # workbook's fingerprint changes, so the master only ever does work for the DB that loaded.
+    def __init__(self):
+        self.companies = {}
+        self.sources = {}
+
+    def update(self, industry, data):
+        if not data.fingerprint or self.sources.get(industry) == data.fingerprint:
+            return False
+        with span("master.update", industry=industry) as counts:
+            for slots in self.companies.values():
+                slots.pop(industry, None)
+            index, conflicts = data.biz_index()
+            for biz_no, i in index.items():
+                slot = {field: data.value(i, field) for field in SLOT_FIELDS}
+                if biz_no in conflicts:
+                    slot["duplicates"] = len(conflicts[biz_no])
+                self.companies.setdefault(biz_no, {})[industry] = slot
+            self.companies = {k: v for k, v in self.companies.items() if v}
+            self.sources[industry] = data.fingerprint
+            counts["companies"] = len(index)
+        return True
+
+    def lookup(self, biz_no):
+        return self.companies.get(normalize_biz_no(biz_no), {})
+
+    def industries(self, biz_no):
+        return [industry for industry in INDUSTRY_LABELS if industry in self.lookup(biz_no)]
+
+    def __len__(self):
+        return len(self.companies)
+
+
+def _read():
+    try:
+        with open(MASTER_PATH, "rb") as f:
+            payload = pickle.load(f)
+    except Exception:
+        return None
+    if payload.get("format") != MASTER_FORMAT:
+        return None
+    return payload.get("data")
+
+
+def _write(master):
+    try:
+        SNAPSHOT_DIR.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".master.", dir=str(SNAPSHOT_DIR))
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump({"format": MASTER_FORMAT, "data": master}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, MASTER_PATH)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def get_master():
+    with _LOCK:
+        if _MASTER["data"] is None:
+            _MASTER["data"] = _read() or CompanyMaster()
+        return _MASTER["data"]
+
+
+def register(industry, data):
+    # Called by load_db_cached(industry=...) whenever a workbook is (re)loaded.
+    master = get_master()
+    with _LOCK:
+        changed = master.update(industry, data)
+        if changed:
+            _write(master)
+    return master
+
+
+def build_master(industries=None, force=False):
+    from config_store import resolve_db_path
+    from db_loader import load_db_cached
+
+    for industry in industries or INDUSTRY_LABELS:
+        db_path = resolve_db_path(industry)
+        if db_path and db_path.exists():
+            load_db_cached(db_path, force=force, industry=industry)
+    return get_master()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="공종 통합 업체 마스터 조회")
+    parser.add_argument("biz_nos", nargs="*", help="사업자번호")
+    parser.add_argument("--reload", action="store_true", help="세 공종 DB를 다시 파싱")
+    args = parser.parse_args(argv)
+
+    master = build_master(force=args.reload)
+    if not args.biz_nos:
+        counts = {industry: 0 for industry in INDUSTRY_LABELS}
+        multi = 0
+        for slots in master.companies.values():
+            for industry in slots:
+                counts[industry] = counts.get(industry, 0) + 1
+            multi += len(slots) > 1
+        summary = {"companies": len(master), "byIndustry": counts, "multiIndustry": multi}
+        json.dump(summary, sys.stdout, ensure_ascii=False, indent=2)
+    else:
+        out = {format_biz_no(normalize_biz_no(b)): {INDUSTRY_LABELS.get(k, k): v for k, v in master.lookup(b).items()}
+               for b in args.biz_nos}
+        json.dump(out, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
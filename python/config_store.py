@@ -1,15 +1,137 @@
+import atexit
+import copy
 import json
+import os
+import tempfile
+import threading
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent
 CONFIG_PATH = BASE_DIR / "config.json"
 
+SAVE_DELAY_SECONDS = 0.5
+
+_CACHE = {"mtime": None, "data": None}
+_PENDING = {"cfg": None, "snapshot": None, "timer": None}
+_LOCK = threading.RLock()
+
+
+def _config_mtime():
+    try:
+        return CONFIG_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
+
 
 def load_config():
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with _LOCK:
+        if _PENDING["cfg"] is not None:
+            return _PENDING["cfg"]
+        mtime = _config_mtime()
+        if _CACHE["data"] is not None and _CACHE["mtime"] == mtime:
+            return _CACHE["data"]
+        with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        _CACHE["data"] = data
+        _CACHE["mtime"] = mtime
+        return data
+
+
+def _write_atomic(cfg):
+    fd, tmp_path = tempfile.mkstemp(prefix=".config.", suffix=".tmp", dir=str(CONFIG_PATH.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cfg, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, CONFIG_PATH)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _store(cfg, content):
+    _write_atomic(content)
+    _CACHE["data"] = cfg
+    _CACHE["mtime"] = _config_mtime()
 
 
 def save_config(cfg):
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        json.dump(cfg, f, ensure_ascii=False, indent=2)
+    with _LOCK:
+        _cancel_pending()
+        _store(cfg, cfg)
+
+
+def save_config_later(cfg, delay=SAVE_DELAY_SECONDS):
+    # Rapid edits (combobox changes, path picks) collapse into one write after `delay`. The
+    # caller keeps editing `cfg` on its own thread, so the timer writes a copy taken now.
+    with _LOCK:
+        _cancel_pending()
+        timer = threading.Timer(delay, flush_config)
+        timer.daemon = True
+        _PENDING["cfg"] = cfg
+        _PENDING["snapshot"] = copy.deepcopy(cfg)
+        _PENDING["timer"] = timer
+        timer.start()
+
+
+def _cancel_pending():
+    timer = _PENDING["timer"]
+    if timer is not None:
+        timer.cancel()
+    _PENDING["cfg"] = None
+    _PENDING["snapshot"] = None
+    _PENDING["timer"] = None
+
+
+def flush_config():
+    with _LOCK:
+        cfg, snapshot = _PENDING["cfg"], _PENDING["snapshot"]
+        if cfg is None:
+            return
+        _cancel_pending()
+        _store(cfg, snapshot)
+
+
+atexit.register(flush_config)
+
+
+def get_industry_averages() -> dict:
+    return load_config().get("industryAverages") or {}
+
+
+def get_industry_average(file_type: str) -> dict:
+    return get_industry_averages().get(file_type) or {}
+
+
+def get_mois_under30_settings() -> dict:
+    return load_config().get("mois_under30") or {}
+
+
+def get_mois_under30_columns() -> dict:
+    settings = get_mois_under30_settings()
+    return {
+        "nameCols": settings.get("nameCols") or [],
+        "managementCols": settings.get("managementCols") or [],
+        "performanceCols": settings.get("performanceCols") or [],
+        "sipyungCols": settings.get("sipyungCols") or [],
+    }
+
+
+def get_db_paths() -> dict:
+    return load_config().get("dbPaths") or {}
+
+
+def resolve_db_path(file_type: str) -> Path:
+    cfg = load_config()
+    db_paths = cfg.get("dbPaths") or {}
+    raw = db_paths.get(file_type, "") or cfg.get("dbPath", "")
+    if not raw:
+        return Path("")
+    p = Path(raw)
+    if not p.is_absolute():
+        p = (BASE_DIR / p).resolve()
+    return p
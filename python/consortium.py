@@ -0,0 +1,278 @@
+import argparse
+import json
+import math
+import sys
+from pathlib import Path
+
+from config_store import get_mois_under30_columns
+from perf_trace import span
+from recommend import load_industry_db, load_notice, normalize_notice, notice_performance_scorer, score_columns
+from search_core import row_record
+
+DEFAULT_ALTERNATIVES = 5
+DEFAULT_MIN_SHARE = 10.0
+DEFAULT_NODE_BUDGET = 1_000_000
+
+
+def slot_limit(notice):
+    # 협정보드 슬롯 수(mois_under30 nameCols, 보통 C~G 다섯 칸)와 공고의 구성원 수 제한 중 작은 값.
+    slots = len(get_mois_under30_columns().get("nameCols") or []) or 5
+    for key in ("groupSize", "participantLimit"):
+        try:
+            limit = int(notice.get(key) or 0)
+        except (TypeError, ValueError):
+            limit = 0
+        if limit > 0:
+            slots = min(slots, limit)
+    return slots
+
+
+def allocate_shares(values, duty_flags, duty_rate, min_share):
+    # Everyone gets min_share, the duty-region quota goes to the best duty-region member, and
+    # whatever is left goes to the best member overall. Returns fractions or None if the
+    # member count or quota cannot fit in 100%.
+    n = len(values)
+    base = min_share / 100
+    if n * base > 1 + 1e-9:
+        return None
+    shares = [base] * n
+    free = 1 - n * base
+    if duty_rate > 0:
+        duty = [i for i in range(n) if duty_flags[i]]
+        if not duty:
+            return None
+        need = duty_rate / 100 - base * len(duty)
+        if need > 0:
+            if need > free + 1e-9:
+                return None
+            shares[max(duty, key=lambda i: values[i])] += need
+            free -= need
+    shares[max(range(n), key=lambda i: values[i])] += free
+    return shares
+
+
+class _Pool:
+    # Candidate columns sorted by individual score, plus suffix maxima used as bounds.
+    def __init__(self, indexes, management, performance_amount, performance_3y, sipyung, duty, values, limit):
+        self.indexes = indexes
+        self.m = [management[i] for i in indexes]
+        self.p = [performance_amount[i] for i in indexes]
+        self.p3 = [performance_3y[i] for i in indexes]
+        self.s = [sipyung[i] for i in indexes]
+        self.duty = [duty[i] for i in indexes]
+        self.v = [values[i] for i in indexes]
+        n = len(indexes)
+        self.suf_m = [-math.inf] * (n + 1)
+        self.suf_p = [-math.inf] * (n + 1)
+        self.suf_p3 = [-math.inf] * (n + 1)
+        self.suf_s = [-math.inf] * (n + 1)
+        self.suf_duty = [0] * (n + 1)
+        # suf_top[j][r]: sum of the r largest 시평 at positions >= j, r = 0..limit
+        self.suf_top = [[0.0] * (limit + 1) for _ in range(n + 1)]
+        top = []
+        for j in range(n - 1, -1, -1):
+            self.suf_m[j] = max(self.m[j], self.suf_m[j + 1])
+            self.suf_p[j] = max(self.p[j], self.suf_p[j + 1])
+            self.suf_p3[j] = max(self.p3[j], self.suf_p3[j + 1])
+            self.suf_s[j] = max(self.s[j], self.suf_s[j + 1])
+            self.suf_duty[j] = self.suf_duty[j + 1] + bool(self.duty[j])
+            top = sorted(top + [self.s[j]], reverse=True)[:limit]
+            running = 0.0
+            for r in range(1, limit + 1):
+                running += top[r - 1] if r - 1 < len(top) else 0.0
+                self.suf_top[j][r] = running
+
+
+def optimize(notice, data=None, alternatives=DEFAULT_ALTERNATIVES, min_share=DEFAULT_MIN_SHARE,
+             node_budget=DEFAULT_NODE_BUDGET, pool_size=None, min_members=1):
+    notice = normalize_notice(notice)
+    file_type = notice["fileType"]
+    if data is None:
+        data = load_industry_db(file_type)
+    management, individual = score_columns(data, notice)
+    _, scorer = notice_performance_scorer(notice)
+
+    limit = slot_limit(notice)
+    duty_regions = notice["dutyRegions"]
+    duty_rate = notice["regionDutyRate"] if duty_regions else 0
+    entry_mode = notice.get("entryMode") or "ratio"
+    entry_amount = notice.get("entryAmount") or notice.get("estimatedAmount") or 0
+    if entry_mode == "none":
+        entry_amount = 0
+
+    regions = data.column("region")
+    perf_amount = [0.0 if math.isnan(v) else v for v in data.column("perf5y")]
+    perf_3y = [0.0 if math.isnan(v) else v for v in data.column("perf3y")]
+    sipyung = [0.0 if math.isnan(v) else v for v in data.column("sipyung")]
+    duty = [any(d in region for d in duty_regions) for region in regions]
+    values = [(m or 0) + p for m, p in zip(management, individual)]
+    indexes = [i for i in range(len(data)) if management[i] is not None and sipyung[i] > 0]
+    indexes.sort(key=lambda i: (values[i], sipyung[i]), reverse=True)
+    if pool_size:
+        indexes = indexes[:pool_size]
+
+    base = min_share / 100
+
+    def search_round(indexes):
+        # Best single consortium among `indexes`, or None.
+        pool = _Pool(indexes, management, perf_amount, perf_3y, sipyung, duty, values, limit)
+        n = len(indexes)
+        p3_top = pool.suf_p3[0]
+        best = {"item": None}
+
+        def threshold():
+            return best["item"][0] if best["item"] else -math.inf
+
+        def evaluate(members):
+            shares = allocate_shares([pool.v[j] for j in members], [pool.duty[j] for j in members], duty_rate,
+                                     min_share)
+            if shares is None:
+                return
+            if entry_mode == "sum":
+                qualification = sum(pool.s[j] for j in members)
+            else:
+                qualification = sum(w * pool.s[j] for w, j in zip(shares, members))
+            if qualification < entry_amount - 1e-6:
+                return
+            mgmt = sum(w * pool.m[j] for w, j in zip(shares, members))
+            amount = sum(w * pool.p[j] for w, j in zip(shares, members))
+            amount_3y = sum(w * pool.p3[j] for w, j in zip(shares, members))
+            score = round(mgmt + scorer(amount, amount_3y), 4)
+            if score > threshold():
+                best["item"] = (score, [pool.indexes[j] for j in members], shares, mgmt, amount, amount_3y)
+
+        # Whoever brings the largest performance amount also holds at least min_share, so its
+        # management score counts for at least that much of the average: with g = base * m +
+        # performance score of its own amount, no consortium beats (1 - base) * best m + best g.
+        # Unlike best m + performance of the best amount, this does not pair the best management
+        # score with somebody else's amount. perf3y is taken at its pool maximum.
+        g = [base * pool.m[j] + scorer(pool.p[j], p3_top) for j in range(n)]
+        suf_g = [-math.inf] * (n + 1)
+        for j in range(n - 1, -1, -1):
+            suf_g[j] = max(g[j], suf_g[j + 1])
+        perf_scores = {}
+
+        def bound(m_max, p_max, p3_max, g_max):
+            # No share-weighted average can beat the best member it contains. Rounded like the
+            # scores it is compared with.
+            key = (p_max, p3_max)
+            perf = perf_scores.get(key)
+            if perf is None:
+                perf = perf_scores[key] = scorer(p_max, p3_max)
+            return round(min(m_max + perf, (1 - base) * m_max + g_max), 4)
+
+        # Prefix -> position its branch was cut at by the score bound or a feasibility check that
+        # no larger size cap relaxes. The incumbent only improves, so later caps stop there too.
+        cut = {}
+
+        def search(members, start, m_max, p_max, p3_max, g_max, s_max, s_sum, has_duty, cap):
+            prefix = tuple(members)
+            for j in range(start, cut.get(prefix, n)):
+                if state["nodes"] >= node_budget:
+                    state["exhausted"] = True
+                    return
+                state["nodes"] += 1
+                left = cap - len(members) - 1
+                # Suffix maxima and top-시평 sums only shrink as j grows, so each of these ends
+                # the branch rather than skipping one candidate.
+                if (bound(max(m_max, pool.suf_m[j]), max(p_max, pool.suf_p[j]), max(p3_max, pool.suf_p3[j]),
+                          max(g_max, suf_g[j])) <= threshold()
+                        or entry_mode == "ratio" and max(s_max, pool.suf_s[j]) < entry_amount - 1e-6
+                        or duty_rate > 0 and not has_duty and pool.suf_duty[j] == 0):
+                    if cap < limit:
+                        cut[prefix] = j
+                    return
+                if entry_mode == "sum" and s_sum + pool.suf_top[j][left + 1] < entry_amount - 1e-6:
+                    return
+                if entry_mode == "sum" and s_sum + pool.s[j] + pool.suf_top[j + 1][left] < entry_amount - 1e-6:
+                    continue
+                if entry_mode == "ratio" and max(s_max, pool.s[j], pool.suf_s[j + 1]) < entry_amount - 1e-6:
+                    continue
+                duty_now = has_duty or pool.duty[j]
+                if duty_rate > 0 and not duty_now and (left == 0 or pool.suf_duty[j + 1] == 0):
+                    continue
+                chosen = members + [j]
+                maxima = max(m_max, pool.m[j]), max(p_max, pool.p[j]), max(p3_max, pool.p3[j]), max(g_max, g[j])
+                # Sharing out the scores is the expensive part; skip it when the members alone
+                # cannot beat the incumbent.
+                if len(chosen) == cap and bound(*maxima) > threshold():
+                    evaluate(chosen)
+                if left > 0:
+                    search(chosen, j + 1, *maxima, max(s_max, pool.s[j]), s_sum + pool.s[j], duty_now, cap)
+
+        # Growing the size cap one slot at a time means a larger consortium only wins when it
+        # scores strictly higher than every smaller one, and the first good small consortium
+        # prunes the larger searches. Each pass scores only consortia of exactly its size.
+        for cap in range(max(1, min_members), limit + 1):
+            search([], 0, -math.inf, -math.inf, -math.inf, -math.inf, -math.inf, 0.0, False, cap)
+        return best["item"]
+
+    # Alternatives are disjoint, like the rows of the agreement board: each round removes the
+    # members of the consortium it picked and searches again.
+    state = {"nodes": 0, "exhausted": False}
+    results = []
+    with span("consortium", pool=len(indexes), slots=limit) as counts:
+        remaining = indexes
+        while len(results) < alternatives and remaining and not state["exhausted"]:
+            item = search_round(remaining)
+            if item is None:
+                break
+            score, members, shares, mgmt, amount, amount_3y = item
+            used = set(members)
+            remaining = [i for i in remaining if i not in used]
+            order = sorted(range(len(members)), key=lambda k: shares[k], reverse=True)
+            results.append({
+                "score": score,
+                "management": round(mgmt, 4),
+                "performance": scorer(amount, amount_3y),
+                "performanceAmount": round(amount),
+                "sipyungSum": sum(sipyung[i] for i in members),
+                "dutyShare": round(sum(shares[k] for k in order if duty[members[k]]) * 100, 2),
+                "members": [
+                    row_record(data[members[k]], file_type, {
+                        "share": round(shares[k] * 100, 2),
+                        "dutyRegion": duty[members[k]],
+                        "management": management[members[k]],
+                    })
+                    for k in order
+                ],
+            })
+        counts["nodes"] = state["nodes"]
+    return {
+        "slots": limit,
+        "entryMode": entry_mode,
+        "entryAmount": entry_amount,
+        "regionDutyRate": duty_rate,
+        "pool": len(indexes),
+        "nodes": state["nodes"],
+        "exhaustive": not state["exhausted"],
+        "alternatives": results,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="공고 기준 협정 구성 최적화 (분기한정)")
+    parser.add_argument("notice", help="협정보드에서 저장한 공고 .json")
+    parser.add_argument("--db", help="config 대신 직접 지정할 .xlsx 경로")
+    parser.add_argument("--alternatives", type=int, default=DEFAULT_ALTERNATIVES, help="돌려줄 구성안 수")
+    parser.add_argument("--min-share", type=float, default=DEFAULT_MIN_SHARE, help="구성원 최소 지분(%%)")
+    parser.add_argument("--budget", type=int, default=DEFAULT_NODE_BUDGET, help="평가할 조합 수 상한")
+    parser.add_argument("--pool", type=int, default=None, help="개별 점수 상위 N개 업체만 후보로 사용")
+    parser.add_argument("--min-members", type=int, default=1, help="구성원 최소 수 (단독 제외는 2)")
+    args = parser.parse_args(argv)
+
+    notice = load_notice(args.notice)
+    data = None
+    if args.db:
+        from db_loader import load_db_cached
+
+        data = load_db_cached(Path(args.db))
+    result = optimize(notice, data, args.alternatives, args.min_share, args.budget, args.pool,
+                      args.min_members)
+    json.dump(result, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+import argparse
+import csv
+import json
+import sys
+from pathlib import Path
+
+from config_store import get_industry_averages, resolve_db_path
+from db_loader import load_db_cached
+from query_filter import FilterError, filter_indexes, looks_like_filter
+from search_core import INDUSTRY_LABELS, OUTPUT_FIELDS, resolve_biz_nos, row_record, search
+
+
+def _resolve(args):
+    if args.db:
+        return Path(args.db)
+    return resolve_db_path(args.industry)
+
+
+def _load(args):
+    db_path = _resolve(args)
+    if not db_path or not db_path.exists():
+        raise SystemExit(f"DB 파일을 찾을 수 없습니다: {db_path}")
+    # Only configured industry DBs feed the company master; an ad-hoc --db file does not.
+    return load_db_cached(db_path, force=args.reload, industry=None if args.db else args.industry)
+
+
+def _emit(records, fmt, fields):
+    if fmt == "csv":
+        writer = csv.DictWriter(sys.stdout, fieldnames=fields, extrasaction="ignore")
+        writer.writeheader()
+        for record in records:
+            writer.writerow(record)
+    else:
+        json.dump(records, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+
+
+def cmd_load(args):
+    data = _load(args)
+    regions = {}
+    for region in data.column("region"):
+        regions[region] = regions.get(region, 0) + 1
+    _, conflicts = data.biz_index()
+    summary = {
+        "industry": args.industry,
+        "path": data.path,
+        "fingerprint": data.fingerprint,
+        "entries": len(data),
+        "regions": regions,
+        "bizNoConflicts": {
+            biz_no: [f"{data.value(i, 'region')}/{data.value(i, 'name')}" for i in indexes]
+            for biz_no, indexes in conflicts.items()
+        },
+    }
+    json.dump(summary, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+
+
+def _via_worker(args, method, **params):
+    from worker import INVALID_PARAMS
+    from worker_client import WorkerError, call
+
+    params.update({"industry": args.industry, "query": args.query, "limit": args.limit, "reload": args.reload})
+    if args.db:
+        params["db"] = str(Path(args.db).resolve())
+    try:
+        return call(method, params)
+    except WorkerError as exc:
+        # Bad input (e.g. a filter typo) reads the same as without --worker.
+        if exc.code == INVALID_PARAMS:
+            raise SystemExit(str(exc))
+        raise
+
+
+def _query_rows(data, args):
+    if not looks_like_filter(args.query):
+        return search(data, args.query, args.limit)
+    try:
+        hits = filter_indexes(data, args.query)
+    except FilterError as exc:
+        raise SystemExit(f"검색 조건 오류: {exc}")
+    return data.rows(hits if args.limit is None else hits[:args.limit])
+
+
+def cmd_search(args):
+    if args.worker:
+        _emit(_via_worker(args, "search"), args.format, OUTPUT_FIELDS)
+        return
+    data = _load(args)
+    records = [row_record(row, args.industry) for row in _query_rows(data, args)]
+    _emit(records, args.format, OUTPUT_FIELDS)
+
+
+def cmd_score(args):
+    from scoring import lookup_management
+
+    if args.worker:
+        records = _via_worker(args, "score", agency=args.agency, amount=args.amount, noticeDate=args.notice_date)
+        _emit(records, args.format, OUTPUT_FIELDS + ["management"])
+        return
+    data = _load(args)
+    averages = get_industry_averages()
+    records = []
+    for row in _query_rows(data, args):
+        mgmt = lookup_management(data, row, args.agency, args.amount, args.industry, averages, args.notice_date)
+        records.append(row_record(row, args.industry, {"management": mgmt}))
+    _emit(records, args.format, OUTPUT_FIELDS + ["management"])
+
+
+def cmd_resolve(args):
+    biz_nos = list(args.biz_nos)
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            biz_nos += [line.strip() for line in f if line.strip()]
+    data = _load(args)
+    resolved = resolve_biz_nos(data, biz_nos)
+    records = [row_record(row, args.industry, {"status": "found"}) for row in resolved["found"].values()]
+    for rows in resolved["conflicts"].values():
+        records += [row_record(row, args.industry, {"status": "conflict"}) for row in rows]
+    records += [{"industry": args.industry, "bizNo": b, "status": "missing"} for b in resolved["missing"]]
+    _emit(records, args.format, OUTPUT_FIELDS + ["status"])
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m db_cli", description="업체 DB 조회/점수 계산 (GUI 없이)")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--industry", choices=sorted(INDUSTRY_LABELS), default="eung", help="공종 (config dbPaths 기준)")
+    common.add_argument("--db", help="config 대신 직접 지정할 .xlsx 경로")
+    common.add_argument("--reload", action="store_true", help="스냅샷 캐시를 무시하고 다시 파싱")
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--format", choices=["json", "csv"], default="json")
+    output.add_argument("--limit", type=int, default=None)
+    output.add_argument("--worker", action="store_true", help="상주 워커(worker.py)를 통해 조회, 없으면 띄움")
+
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("load", parents=[common], help="DB 로드 후 요약 출력")
+    p.set_defaults(func=cmd_load)
+    p = sub.add_parser("search", parents=[common, output],
+                       help="업체명 검색, 또는 조건 검색 (예: \"region:경기 sipyung>=30억 debt<100%%\")")
+    p.add_argument("query")
+    p.set_defaults(func=cmd_search)
+    p = sub.add_parser("score", parents=[common, output], help="검색 결과의 경영상태 점수 계산")
+    p.add_argument("query")
+    p.add_argument("--agency", default="mois", help="발주처 id (formulas.defaults.json)")
+    p.add_argument("--amount", type=float, default=0, help="추정가격/기초금액")
+    p.add_argument("--notice-date", default=None, help="공고일 (YYYY-MM-DD)")
+    p.set_defaults(func=cmd_score)
+    p = sub.add_parser("resolve", parents=[common, output], help="사업자번호로 업체 일괄 조회 (중복 번호는 conflict)")
+    p.add_argument("biz_nos", nargs="*")
+    p.add_argument("--file", help="사업자번호 목록 파일 (한 줄에 하나)")
+    p.set_defaults(func=cmd_resolve)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,30 @@
+import hashlib
 import math
+import os
+import pickle
+import sys
+import tempfile
 from pathlib import Path
 
-from openpyxl import load_workbook
+from entry_store import EntryStore
+from notes_parser import empty_notes, parse_notes
+from perf_trace import span
+from text_utils import normalize_biz_no, normalize_names
 
-from text_utils import extract_manager_name, normalize_name
+# Keyed by workbook path so one process (the worker) can keep several industries warm.
+_DB_CACHE = {}
 
-_DB_CACHE = {"path": None, "mtime": None, "data": []}
+SNAPSHOT_DIR = Path(__file__).resolve().parent / ".snapshots"
+SNAPSHOT_FORMAT = 5
+
+
+def file_fingerprint(db_path: Path):
+    try:
+        st = db_path.stat()
+    except OSError:
+        return ""
+    token = f"{db_path.resolve()}|{st.st_mtime_ns}|{st.st_size}"
+    return hashlib.sha1(token.encode("utf-8")).hexdigest()
 
 
 def _to_number(val):
@@ -69,18 +88,19 @@ def _load_sheet_entries(ws, sheet_name, relative_offsets):
             seen_keys.add(dedup_key)
             entry = {
                 "name": name,
-                "norm": normalize_name(name),
+                "norm": "",
                 "region": sheet_name.strip(),
                 "bizNo": "",
                 "debtRatio": None,
                 "currentRatio": None,
                 "bizYears": None,
+                "perf3y": None,
                 "perf5y": None,
                 "creditGrade": "",
                 "sipyung": None,
                 "notes": "",
-                "managerName": "",
             }
+            entry.update(empty_notes())
             for key, offset in relative_offsets.items():
                 r = header_row + offset
                 if r > max_row:
@@ -89,7 +109,7 @@ def _load_sheet_entries(ws, sheet_name, relative_offsets):
                 if key in {"부채비율", "유동비율"} and isinstance(val, (int, float)):
                     val = val * 100
                 if key == "사업자번호":
-                    entry["bizNo"] = "" if val is None else str(val).strip()
+                    entry["bizNo"] = normalize_biz_no(val)
                 elif key == "부채비율":
                     entry["debtRatio"] = _to_number(val)
                 elif key == "유동비율":
@@ -98,20 +118,31 @@ def _load_sheet_entries(ws, sheet_name, relative_offsets):
                     entry["bizYears"] = _to_number(val)
                 elif key == "시평":
                     entry["sipyung"] = _to_number(val)
+                elif key == "3년 실적":
+                    entry["perf3y"] = _to_number(val)
                 elif key == "5년 실적":
                     entry["perf5y"] = _to_number(val)
                 elif key == "신용평가":
                     entry["creditGrade"] = "" if val is None else str(val).strip()
                 elif key == "비고":
                     entry["notes"] = "" if val is None else str(val).strip()
-            entry["managerName"] = extract_manager_name(entry.get("notes", ""))
+            if entry["notes"]:
+                entry.update(parse_notes(entry["notes"]))
             entries.append(entry)
+    with span("normalize", names=len(entries)):
+        for entry, norm in zip(entries, normalize_names([e["name"] for e in entries])):
+            entry["norm"] = norm
     return entries
 
 
-def load_db(db_path: Path):
-    wb = load_workbook(db_path, data_only=False)
-    data = []
+def iter_load_db(db_path: Path, cancel=None):
+    # Yields (sheet_name, entries, sheet_number, sheet_count) as each sheet is parsed so a
+    # caller can show and search partial data. `cancel` is a threading.Event checked between
+    # sheets; once set the generator just stops.
+    from openpyxl import load_workbook
+
+    with span("workbook.open", path=str(db_path)):
+        wb = load_workbook(db_path, data_only=False)
     relative_offsets = {
         "대표자": 1,
         "사업자번호": 2,
@@ -130,30 +161,158 @@ def load_db(db_path: Path):
         "비고": 15,
     }
 
-    for sheet_name in wb.sheetnames:
+    sheet_names = wb.sheetnames
+    for number, sheet_name in enumerate(sheet_names, 1):
+        if cancel is not None and cancel.is_set():
+            return
         ws = wb[sheet_name]
-        entries = _load_sheet_entries(ws, sheet_name, relative_offsets)
+        with span("sheet.parse", sheet=sheet_name) as counts:
+            entries = _load_sheet_entries(ws, sheet_name, relative_offsets)
+            counts["entries"] = len(entries)
+        yield sheet_name, entries, number, len(sheet_names)
+
+
+def load_db(db_path: Path):
+    data = EntryStore(path=str(db_path), fingerprint=file_fingerprint(db_path))
+    for _, entries, _, _ in iter_load_db(db_path):
         data.extend(entries)
     return data
 
 
-def load_db_cached(db_path: Path, force=False):
-    mtime = db_path.stat().st_mtime if db_path.exists() else None
-    if (
-        not force
-        and _DB_CACHE["path"] == str(db_path)
-        and _DB_CACHE["mtime"] == mtime
-    ):
-        return _DB_CACHE["data"]
-    data = load_db(db_path)
-    _DB_CACHE["path"] = str(db_path)
-    _DB_CACHE["mtime"] = mtime
-    _DB_CACHE["data"] = data
+def _snapshot_file(db_path: Path):
+    key = hashlib.sha1(str(db_path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return SNAPSHOT_DIR / f"{key}.pickle"
+
+
+def read_snapshot(db_path: Path):
+    # Parsed entries pickled next to this module, reused while the workbook fingerprint
+    # (path, mtime, size) is unchanged. Any read problem just means a normal load.
+    fingerprint = file_fingerprint(db_path)
+    target = _snapshot_file(db_path)
+    if not fingerprint or not target.exists():
+        return None
+    try:
+        with span("snapshot.read", path=str(db_path)):
+            with open(target, "rb") as f:
+                payload = pickle.load(f)
+    except Exception:
+        return None
+    if payload.get("format") != SNAPSHOT_FORMAT or payload.get("fingerprint") != fingerprint:
+        return None
+    return payload.get("data")
+
+
+def write_snapshot(db_path: Path, data):
+    if not data.fingerprint:
+        return
+    try:
+        SNAPSHOT_DIR.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".snapshot.", dir=str(SNAPSHOT_DIR))
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(
+                {"format": SNAPSHOT_FORMAT, "fingerprint": data.fingerprint, "data": data},
+                f,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, _snapshot_file(db_path))
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _mtime(db_path: Path):
+    return db_path.stat().st_mtime if db_path.exists() else None
+
+
+def peek_cached(db_path: Path, use_snapshot=True, industry=None):
+    # The in-memory or snapshot copy when one is current, else None; never parses the workbook.
+    cached = _DB_CACHE.get(str(db_path))
+    if cached is not None and cached["mtime"] == _mtime(db_path):
+        if industry and industry not in cached["industries"]:
+            _register(industry, cached)
+        return cached["data"]
+    data = read_snapshot(db_path) if use_snapshot else None
+    if data is None:
+        return None
+    return remember(db_path, data, industry=industry, snapshot=False)
+
+
+def persist(db_path: Path, data, industry=None):
+    # The slow half of remember(): snapshot, company master and SQLite store. Progressive loads
+    # run it on their loader thread and pass the result to remember(registered=...) on the UI
+    # thread. -> whether the industry was registered.
+    write_snapshot(db_path, data)
+    return bool(industry) and _register_data(industry, data)
+
+
+def remember(db_path: Path, data, industry=None, snapshot=True, mtime=None, registered=None):
+    # Makes a fully loaded store the cached copy for db_path (used by progressive loads).
+    # mtime: taken before parsing started, so an edit made mid-load still looks changed.
+    # registered: persist()'s result when the caller already ran it; None registers here.
+    if snapshot:
+        write_snapshot(db_path, data)
+    cached = {"mtime": _mtime(db_path) if mtime is None else mtime, "data": data, "industries": set()}
+    _DB_CACHE[str(db_path)] = cached
+    if industry and registered is None:
+        _register(industry, cached)
+    elif industry and registered:
+        cached["industries"].add(industry)
     return data
 
 
+def load_db_cached(db_path: Path, force=False, use_snapshot=True, industry=None):
+    # industry: when the caller knows which 공종 this workbook is, the cross-industry company
+    # master is refreshed from it (only does work when the workbook changed).
+    if not force:
+        data = peek_cached(db_path, use_snapshot=use_snapshot, industry=industry)
+        if data is not None:
+            return data
+    mtime = _mtime(db_path)
+    return remember(db_path, load_db(db_path), industry=industry, snapshot=use_snapshot, mtime=mtime)
+
+
+def _register(industry, cached):
+    if _register_data(industry, cached["data"]):
+        cached["industries"].add(industry)
+
+
+def _register_data(industry, data):
+    # A failed master update or SQLite sync must not fail the load, but it is reported (stderr,
+    # and the trace when enabled) so a locked or broken store does not quietly go stale.
+    # -> False when the master update failed, so the next load retries it.
+    import sqlite3
+
+    from company_master import register
+    from sqlite_store import sync
+
+    try:
+        with span("master.register", industry=industry):
+            register(industry, data)
+    except OSError as exc:
+        print(f"업체 마스터 갱신 실패 ({industry}): {exc}", file=sys.stderr)
+        return False
+    try:
+        with span("sqlite.sync", industry=industry):
+            sync(industry, data)
+    except (sqlite3.Error, OSError) as exc:
+        print(f"SQLite 동기화 실패 ({industry}): {exc}", file=sys.stderr)
+    return True
+
+
+def cached_paths():
+    return list(_DB_CACHE)
+
+
 def load_db_stats(db_path: Path):
-    wb = load_workbook(db_path, data_only=False)
+    from openpyxl import load_workbook
+
+    with span("workbook.open", path=str(db_path)):
+        wb = load_workbook(db_path, data_only=False)
     relative_offsets = {
         "대표자": 1,
         "사업자번호": 2,
@@ -0,0 +1,148 @@
+import math
+import sys
+from array import array
+
+NUMERIC_FIELDS = ("debtRatio", "currentRatio", "bizYears", "perf3y", "perf5y", "sipyung")
+INTERNED_FIELDS = ("region", "creditGrade")
+TEXT_FIELDS = ("name", "norm", "bizNo", "notes", "managerName", "phone", "certExpiry")
+FLAG_FIELDS = {"managerConfident": "b", "noteFlags": "l"}
+
+FIELDS = ("name", "norm", "region", "bizNo", "debtRatio", "currentRatio", "bizYears", "perf3y",
+          "perf5y", "creditGrade", "sipyung", "notes", "managerName", "managerConfident", "phone",
+          "certExpiry", "noteFlags")
+
+_NAN = float("nan")
+
+
+class EntryRow:
+    __slots__ = ("_store", "index")
+
+    def __init__(self, store, index):
+        self._store = store
+        self.index = index
+
+    def __getitem__(self, key):
+        return self._store.value(self.index, key)
+
+    def get(self, key, default=None):
+        try:
+            return self._store.value(self.index, key)
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return key in self._store.columns
+
+    def keys(self):
+        return self._store.columns.keys()
+
+    def items(self):
+        return [(key, self[key]) for key in self._store.columns]
+
+    def to_dict(self):
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, EntryRow):
+            return self._store is other._store and self.index == other.index
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((id(self._store), self.index))
+
+    def __repr__(self):
+        return f"EntryRow({self.index}, {self.get('name')!r}, {self.get('region')!r})"
+
+
+class EntryStore:
+    # Column-oriented storage for one loaded workbook. Numbers live in array("d") with NaN for
+    # missing values, repeated strings (region, grade) are interned, and rows are handed out as
+    # EntryRow views that read like the old entry dicts.
+    def __init__(self, path="", fingerprint=""):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.score_columns = {}
+        self._biz_index = None
+        self.columns = {}
+        for field in FIELDS:
+            if field in NUMERIC_FIELDS:
+                self.columns[field] = array("d")
+            elif field in FLAG_FIELDS:
+                self.columns[field] = array(FLAG_FIELDS[field])
+            else:
+                self.columns[field] = []
+        self._size = 0
+
+    def append(self, entry):
+        columns = self.columns
+        for field in NUMERIC_FIELDS:
+            value = entry.get(field)
+            columns[field].append(_NAN if value is None else float(value))
+        for field in INTERNED_FIELDS:
+            columns[field].append(sys.intern(entry.get(field) or ""))
+        for field in TEXT_FIELDS:
+            columns[field].append(entry.get(field) or "")
+        for field in FLAG_FIELDS:
+            columns[field].append(int(entry.get(field) or 0))
+        self._size += 1
+        # Derived data is rebuilt on next use; a store can grow while it is being searched
+        # (progressive load), so nothing sized to the old length may survive an append.
+        self._biz_index = None
+        if self.score_columns:
+            self.score_columns.clear()
+
+    def extend(self, entries):
+        for entry in entries:
+            self.append(entry)
+
+    def value(self, index, field):
+        column = self.columns[field]
+        value = column[index]
+        if field in NUMERIC_FIELDS:
+            return None if math.isnan(value) else value
+        if field == "managerConfident":
+            return bool(value)
+        return value
+
+    def column(self, field):
+        return self.columns[field]
+
+    def position(self, row):
+        if isinstance(row, EntryRow) and row._store is self:
+            return row.index
+        return -1
+
+    def biz_index(self):
+        # bizNo digits -> row index, plus {bizNo: [indexes]} for numbers that occur more than
+        # once. Built on first use and kept until the store changes.
+        if self._biz_index is None:
+            index = {}
+            conflicts = {}
+            for i, biz_no in enumerate(self.columns["bizNo"]):
+                if not biz_no:
+                    continue
+                first = index.setdefault(biz_no, i)
+                if first != i:
+                    conflicts.setdefault(biz_no, [first]).append(i)
+            self._biz_index = (index, conflicts)
+        return self._biz_index
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        return EntryRow(self, index)
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield EntryRow(self, index)
+
+    def rows(self, indexes):
+        return [EntryRow(self, i) for i in indexes]
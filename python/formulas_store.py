@@ -1,52 +1,142 @@
+import bisect
+import datetime as dt
+import hashlib
 import json
 from pathlib import Path
 
 BASE_DIR = Path(__file__).resolve().parent
 FORMULAS_PATH = BASE_DIR / "formulas.defaults.json"
 
-_CACHE = {"data": None}
+_CACHE = {"data": None, "version": None, "mtime": None, "index": {}}
+
+_MIN_DAY = dt.date.min.toordinal()
+_MAX_DAY = dt.date.max.toordinal()
+
+
+def _formulas_mtime():
+    try:
+        return FORMULAS_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
 
 
 def load_formulas():
-    if _CACHE["data"] is None:
-        _CACHE["data"] = json.loads(FORMULAS_PATH.read_text(encoding="utf-8"))
+    mtime = _formulas_mtime()
+    if _CACHE["data"] is None or _CACHE["mtime"] != mtime:
+        text = FORMULAS_PATH.read_text(encoding="utf-8")
+        data = json.loads(text)
+        _CACHE["data"] = data
+        _CACHE["version"] = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        _CACHE["mtime"] = mtime
+        _CACHE["index"] = _build_index(data)
     return _CACHE["data"]
 
 
-def get_agency(agency_id):
-    data = load_formulas()
-    token = str(agency_id or "").strip().lower()
+def get_formulas_version():
+    load_formulas()
+    return _CACHE["version"]
+
+
+def _to_day(value, default):
+    if value is None or value == "":
+        return default
+    if isinstance(value, dt.datetime):
+        return value.date().toordinal()
+    if isinstance(value, dt.date):
+        return value.toordinal()
+    text = str(value).strip()[:10].replace(".", "-").replace("/", "-")
+    try:
+        return dt.date.fromisoformat(text).toordinal()
+    except ValueError:
+        return default
+
+
+def _tier_period(tier):
+    # effectiveFrom/To sit next to the rules in the defaults file; accept either level.
+    rules = tier.get("rules") or {}
+    start = tier.get("effectiveFrom") or rules.get("effectiveFrom")
+    end = tier.get("effectiveTo") or rules.get("effectiveTo")
+    return _to_day(start, _MIN_DAY), _to_day(end, _MAX_DAY)
+
+
+def tier_key(tier):
+    return (tier.get("minAmount"), tier.get("maxAmount")) + _tier_period(tier)
+
+
+def _build_index(data):
+    # agency id -> {"starts": [...], "versions": [{"start", "end", "mins", "tiers"}]}
+    # Tiers sharing an effective period form one rule version; versions are sorted by start
+    # and tiers inside a version by minAmount, so a lookup is two bisects.
+    index = {}
     for agency in data.get("agencies", []):
-        if str(agency.get("id", "")).strip().lower() == token:
-            return agency
+        token = str(agency.get("id", "")).strip().lower()
+        periods = {}
+        for tier in agency.get("tiers", []) or []:
+            periods.setdefault(_tier_period(tier), []).append(tier)
+        versions = []
+        for (start, end), tiers in sorted(periods.items()):
+            tiers = sorted(tiers, key=lambda t: t.get("minAmount", 0) or 0)
+            versions.append(
+                {
+                    "start": start,
+                    "end": end,
+                    "mins": [t.get("minAmount", 0) or 0 for t in tiers],
+                    "tiers": tiers,
+                }
+            )
+        index[token] = {"agency": agency, "starts": [v["start"] for v in versions], "versions": versions}
+    return index
+
+
+def _agency_index(agency_id):
+    load_formulas()
+    token = str(agency_id or "").strip().lower()
+    return _CACHE["index"].get(token)
+
+
+def get_agency(agency_id):
+    entry = _agency_index(agency_id)
+    return entry["agency"] if entry else None
+
+
+def _select_version(entry, notice_date):
+    day = _to_day(notice_date, None)
+    if day is None:
+        day = dt.date.today().toordinal()
+    pos = bisect.bisect_right(entry["starts"], day) - 1
+    while pos >= 0:
+        version = entry["versions"][pos]
+        if day <= version["end"]:
+            return version
+        pos -= 1
     return None
 
 
-def get_tier_by_amount(agency_id, amount):
-    agency = get_agency(agency_id)
-    if not agency:
+def get_tier_by_amount(agency_id, amount, notice_date=None):
+    entry = _agency_index(agency_id)
+    if not entry:
         return None
-    tiers = agency.get("tiers", [])
+    tiers = entry["agency"].get("tiers", [])
     if not tiers:
         return None
     try:
         amount = float(amount)
     except Exception:
         amount = 0
-    for tier in tiers:
-        min_amount = tier.get("minAmount", 0) or 0
+    version = _select_version(entry, notice_date)
+    if version is None:
+        return tiers[0]
+    pos = bisect.bisect_right(version["mins"], amount) - 1
+    if pos >= 0:
+        tier = version["tiers"][pos]
         max_amount = tier.get("maxAmount", None)
-        if max_amount is None:
-            if amount >= min_amount:
-                return tier
-        else:
-            if amount >= min_amount and amount < max_amount:
-                return tier
+        if max_amount is None or amount < max_amount:
+            return tier
     return tiers[0]
 
 
-def get_management_rules(agency_id, amount):
-    tier = get_tier_by_amount(agency_id, amount)
+def get_management_rules(agency_id, amount, notice_date=None):
+    tier = get_tier_by_amount(agency_id, amount, notice_date)
     if not tier:
         return None
     return (tier.get("rules") or {}).get("management")
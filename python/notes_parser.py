@@ -0,0 +1,145 @@
+import re
+
+FLAG_SOLO_EXCLUDED = 1
+FLAG_SOLO_ALLOWED = 2
+FLAG_ASK_FIRST = 4
+FLAG_WOMEN_OWNED = 8
+
+FLAG_LABELS = {
+    FLAG_SOLO_EXCLUDED: "단독제외",
+    FLAG_SOLO_ALLOWED: "단독가능",
+    FLAG_ASK_FIRST: "물어보고사용",
+    FLAG_WOMEN_OWNED: "여성기업",
+}
+
+_TITLES = "과장|팀장|차장|대리|사원|부장|대표|실장|소장"
+# Flag words and field labels that look like a 2-4 syllable name but never are one.
+_NOT_NAMES = set(FLAG_LABELS.values()) | {
+    "단독", "제외", "가능", "단독이어도", "단독이여도", "물어보고", "사용",
+    "확인서", "등록증", "증명서", "평가", "서류", "제출", "첨부", "완료", "확인", "미비", "필요", "예정", "없음",
+    "담당", "담당자", "연락처", "연락", "전화", "휴대폰", "핸드폰", "팩스", "메일", "이메일",
+    "만료", "만료일", "유효기간", "까지",
+}
+# Sheet (region) names: notes often lead with the office's region ("서울 박철수 부장").
+_REGIONS = {
+    "서울", "부산", "대구", "인천", "광주", "대전", "울산", "세종", "경기", "강원",
+    "충북", "충남", "전북", "전남", "경북", "경남", "제주", "전국", "본사", "지사",
+    "서울시", "부산시", "대구시", "인천시", "광주시", "대전시", "울산시", "세종시",
+    "경기도", "강원도", "제주도", "충청북도", "충청남도", "전라북도", "전라남도", "경상북도", "경상남도",
+}
+_NOT_NAMES |= _REGIONS
+
+# One alternation for the whole note. Alternatives that start at the same position are tried
+# in order, so flags and marked names come before the bare-name fallback.
+_NOTES_RE = re.compile(
+    r"(?P<solo_ex>단독\s*제외)"
+    r"|(?P<solo_ok>단독(?:이여도|이어도)?\s*가능)"
+    r"|(?P<ask>물어보고)"
+    r"|(?P<women>여성기업)"
+    r"|(?P<phone>(?<!\d)0\d{1,2}[-.)\s]?\d{3,4}[-.\s]?\d{4}(?!\d))"
+    r"|(?P<exp_pre>만료(?:일)?\s*[:：]?\s*|~\s*)?"
+    r"(?P<date>(?:19|20)\d{2}\s?[.\-/]\s?\d{1,2}\s?[.\-/]\s?\d{1,2})\.?"
+    r"(?P<exp_post>\s*(?:까지|만료))?"
+    r"|담당자?\s*[:：-]?\s*(?P<charge>[가-힣]{2,4})"
+    r"|(?P<titled>[가-힣]{2,4})\s*(?:" + _TITLES + r")"
+    r"|\b(?!확인서|등록증|증명서|평가|서류)(?P<bare>[가-힣]{2,4})\b\s*(?=,|\/|\(|\d|$)"
+)
+_FIRST_TOKEN_SPLIT_RE = re.compile(r"[ ,\/\|·\-]+")
+_BRACKETED_RE = re.compile(r"^[\[\(（【]([^\]\)）】]+)[\]\)】]?$")
+_HANGUL_NAME_RE = re.compile(r"^[가-힣]{2,4}$")
+_TITLE_RE = re.compile(r"^(?:" + _TITLES + r")")
+_DIGITS_RE = re.compile(r"\D")
+
+_FLAG_GROUPS = (
+    ("solo_ex", FLAG_SOLO_EXCLUDED),
+    ("solo_ok", FLAG_SOLO_ALLOWED),
+    ("ask", FLAG_ASK_FIRST),
+    ("women", FLAG_WOMEN_OWNED),
+)
+
+
+def empty_notes():
+    return {
+        "managerName": "",
+        "managerConfident": False,
+        "phone": "",
+        "certExpiry": "",
+        "noteFlags": 0,
+    }
+
+
+def _format_phone(raw):
+    digits = _DIGITS_RE.sub("", raw)
+    if digits.startswith("02"):
+        return f"{digits[:2]}-{digits[2:-4]}-{digits[-4:]}"
+    return f"{digits[:3]}-{digits[3:-4]}-{digits[-4:]}"
+
+
+def _format_date(raw):
+    parts = [p for p in re.split(r"[.\-/\s]+", raw) if p]
+    if len(parts) != 3:
+        return ""
+    year, month, day = parts
+    return f"{year}-{int(month):02d}-{int(day):02d}"
+
+
+def parse_notes(notes):
+    result = empty_notes()
+    if not notes:
+        return result
+    text = " ".join(str(notes).split())
+    if not text:
+        return result
+
+    # The note leads with the manager's name, possibly after flag words or labels
+    # ("물어보고 사용 홍길동", "연락처 김민수 010-...").
+    # A title-less leading name followed by another name-like word ("강남 홍길동") may be a
+    # place or office label, so it is kept but not marked confident.
+    first_name = ""
+    first_ambiguous = False
+    tokens = [_BRACKETED_RE.sub(r"\1", token) for token in _FIRST_TOKEN_SPLIT_RE.split(text) if token]
+    for n, token in enumerate(tokens):
+        if token in _NOT_NAMES:
+            continue
+        if _HANGUL_NAME_RE.match(token):
+            first_name = token
+            following = tokens[n + 1] if n + 1 < len(tokens) else ""
+            first_ambiguous = (bool(_HANGUL_NAME_RE.match(following)) and following not in _NOT_NAMES
+                               and not _TITLE_RE.match(following))
+        break
+
+    flags = 0
+    charge = titled = bare = ""
+    for m in _NOTES_RE.finditer(text):
+        kind = m.lastgroup
+        if kind == "phone":
+            if not result["phone"]:
+                result["phone"] = _format_phone(m.group("phone"))
+        elif m.group("date") is not None:
+            if not result["certExpiry"] and (m.group("exp_pre") or m.group("exp_post")):
+                result["certExpiry"] = _format_date(m.group("date"))
+        elif m.group("charge") is not None:
+            charge = charge or m.group("charge")
+        elif kind == "titled":
+            titled = titled or m.group("titled")
+        elif kind == "bare":
+            if m.group("bare") not in _NOT_NAMES:
+                bare = bare or m.group("bare")
+        else:
+            for group, bit in _FLAG_GROUPS:
+                if m.group(group) is not None:
+                    flags |= bit
+                    break
+    result["noteFlags"] = flags
+
+    name = first_name or charge or titled
+    if name:
+        result["managerName"] = name
+        result["managerConfident"] = not (name == first_name and first_ambiguous and name not in (charge, titled))
+    elif bare:
+        result["managerName"] = bare
+    return result
+
+
+def flag_labels(flags):
+    return [label for bit, label in FLAG_LABELS.items() if flags & bit]
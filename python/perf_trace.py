@@ -0,0 +1,127 @@
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+TRACE_ENV = "COMPANY_SEARCH_TRACE"
+DEFAULT_TRACE_PATH = BASE_DIR / "trace.jsonl"
+
+_STATE = {"resolved": False, "path": None}
+_LOCK = threading.Lock()
+
+
+def _resolve_path():
+    # COMPANY_SEARCH_TRACE=1 writes next to this file, any other value is taken as a path.
+    # Without the env var, config.json may carry {"trace": {"enabled": true, "path": "..."}}.
+    raw = os.environ.get(TRACE_ENV, "").strip()
+    if raw:
+        if raw.lower() in {"0", "false", "off"}:
+            return None
+        return DEFAULT_TRACE_PATH if raw.lower() in {"1", "true", "on"} else Path(raw)
+    try:
+        from config_store import load_config
+
+        cfg = load_config().get("trace") or {}
+    except Exception:
+        return None
+    if not cfg.get("enabled"):
+        return None
+    path = Path(cfg.get("path") or DEFAULT_TRACE_PATH)
+    return path if path.is_absolute() else BASE_DIR / path
+
+
+def trace_path():
+    if not _STATE["resolved"]:
+        _STATE["path"] = _resolve_path()
+        _STATE["resolved"] = True
+    return _STATE["path"]
+
+
+def enabled():
+    return trace_path() is not None
+
+
+def _write(record):
+    path = trace_path()
+    line = json.dumps(record, ensure_ascii=False)
+    with _LOCK:
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        except OSError:
+            pass
+
+
+@contextmanager
+def span(stage, **counts):
+    # Yields a dict the caller may add counts to (hits, rows, ...); nothing is timed or
+    # written unless tracing is enabled.
+    if trace_path() is None:
+        yield counts
+        return
+    start = time.perf_counter()
+    error = None
+    try:
+        yield counts
+    except BaseException as exc:
+        error = type(exc).__name__
+        raise
+    finally:
+        record = {
+            "ts": round(time.time(), 3),
+            "pid": os.getpid(),
+            "stage": stage,
+            "ms": round((time.perf_counter() - start) * 1000, 3),
+        }
+        record.update(counts)
+        if error:
+            record["error"] = error
+        _write(record)
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def summarize(path):
+    stages = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            stages.setdefault(record.get("stage", "?"), []).append(float(record.get("ms", 0)))
+    rows = []
+    for stage, values in sorted(stages.items()):
+        values.sort()
+        rows.append((stage, len(values), _percentile(values, 50), _percentile(values, 95), values[-1]))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="trace.jsonl 단계별 소요시간 요약")
+    parser.add_argument("path", nargs="?", default=str(DEFAULT_TRACE_PATH))
+    args = parser.parse_args(argv)
+    rows = summarize(args.path)
+    print(f"{'stage':<24} {'count':>7} {'p50 ms':>10} {'p95 ms':>10} {'max ms':>10}")
+    for stage, count, p50, p95, worst in rows:
+        print(f"{stage:<24} {count:>7} {p50:>10.2f} {p95:>10.2f} {worst:>10.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
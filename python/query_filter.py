@@ -0,0 +1,174 @@
+import math
+import re
+
+from notes_parser import FLAG_LABELS
+from text_utils import normalize_name
+
+# 검색창 필터 문법: 공백으로 구분한 조건을 모두 만족하는 업체만 남김.
+#   region:경기,서울   sipyung>=30억   perf5y>=10억   debt<100%   current>=150
+#   years>=5   grade>=BBB-   grade:A0(등급 정확히 일치)   flag:여성기업   -flag:단독제외
+#   금액은 단위를 섞어도 됨(sipyung>=1조2000억). 그 외 단어는 업체명(AB=C건설 포함)
+FIELD_ALIASES = {
+    "region": "region", "지역": "region",
+    "sipyung": "sipyung", "시평": "sipyung",
+    "perf5y": "perf5y", "perf": "perf5y", "실적": "perf5y", "5년실적": "perf5y",
+    "debt": "debtRatio", "부채": "debtRatio", "부채비율": "debtRatio",
+    "current": "currentRatio", "유동": "currentRatio", "유동비율": "currentRatio",
+    "years": "bizYears", "영업기간": "bizYears",
+    "grade": "creditGrade", "신용": "creditGrade", "신용평가": "creditGrade",
+    "flag": "noteFlags", "비고": "noteFlags",
+}
+
+GRADE_ORDER = ["AAA", "AA+", "AA0", "AA-", "A+", "A0", "A-", "BBB+", "BBB0", "BBB-", "BB+", "BB0", "BB-",
+               "B+", "B0", "B-", "CCC+", "CCC0", "CCC-", "CC", "C", "D"]
+_GRADE_RANK = {grade: len(GRADE_ORDER) - n for n, grade in enumerate(GRADE_ORDER)}
+
+_UNITS = {"조": 1e12, "억": 1e8, "천만": 1e7, "백만": 1e6, "만": 1e4, "원": 1, "%": 1, "년": 1}
+_TERM_RE = re.compile(r"^(-?)([^\s:<>=!]+)\s*(>=|<=|!=|:|>|<|=)\s*(.*)$")
+_NUMBER_RE = re.compile(r"^([0-9][0-9,]*(?:\.[0-9]+)?)\s*(?:(조|억|천만|백만|만)?\s*원?|(%|년))$")
+# Mixed units, largest first: 1조2000억, 3억 5천만원
+_MIXED_RE = re.compile(r"^(?:[0-9][0-9,]*(?:\.[0-9]+)?\s*(?:조|억|천만|백만|만)\s*)+원?$")
+_PART_RE = re.compile(r"([0-9][0-9,]*(?:\.[0-9]+)?)\s*(조|억|천만|백만|만)")
+_OPS = {
+    ">=": lambda a, b: a >= b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    "<": lambda a, b: a < b,
+    "=": lambda a, b: a == b,
+    ":": lambda a, b: a == b,
+    "!=": lambda a, b: a != b,
+}
+
+
+class FilterError(ValueError):
+    pass
+
+
+def parse_amount(text):
+    m = _NUMBER_RE.match(text.strip())
+    if m:
+        return float(m.group(1).replace(",", "")) * _UNITS.get(m.group(2) or m.group(3) or "", 1)
+    if not _MIXED_RE.match(text.strip()):
+        raise FilterError(f"숫자를 읽을 수 없습니다: {text}")
+    total = 0.0
+    previous = math.inf
+    for number, unit in _PART_RE.findall(text):
+        if _UNITS[unit] >= previous:
+            raise FilterError(f"단위는 큰 것부터 적습니다: {text}")
+        previous = _UNITS[unit]
+        total += float(number.replace(",", "")) * previous
+    return total
+
+
+def canonical_grade(grade):
+    g = str(grade or "").strip().upper()
+    # "AA" / "BBB" without a notch read as the middle (0) notch
+    if g not in _GRADE_RANK and g + "0" in _GRADE_RANK:
+        return g + "0"
+    return g
+
+
+def grade_rank(grade):
+    # 0 for blank or unknown grades, which then fail every grade comparison.
+    return _GRADE_RANK.get(canonical_grade(grade), 0)
+
+
+def _field_term(token):
+    # -> (negate, field, op, raw) when the token is a condition on a known field. Anything else,
+    # "AB=C건설" included, is part of the company name.
+    m = _TERM_RE.match(token)
+    if not m:
+        return None
+    negate, key, op, raw = m.groups()
+    field = FIELD_ALIASES.get(key.lower()) or FIELD_ALIASES.get(key)
+    return None if field is None else (negate, field, op, raw)
+
+
+def looks_like_filter(text):
+    return any(_field_term(token) for token in str(text or "").split())
+
+
+def parse_filter(text):
+    # -> (name_query, [(field, op, value, negate)]).
+    name_words = []
+    terms = []
+    for token in str(text or "").split():
+        term = _field_term(token)
+        if term is None:
+            name_words.append(token)
+            continue
+        negate, field, op, raw = term
+        raw = raw.strip()
+        if not raw:
+            raise FilterError(f"조건 값이 없습니다: {token}")
+        if field == "region":
+            if op not in (":", "=", "!="):
+                raise FilterError("지역은 region:경기 형태로 지정합니다")
+            terms.append((field, ":", [v for v in raw.split(",") if v], bool(negate) or op == "!="))
+        elif field == "noteFlags":
+            bits = 0
+            for label in raw.split(","):
+                matches = [b for b, name in FLAG_LABELS.items() if label and label in name]
+                exact = [b for b, name in FLAG_LABELS.items() if label == name]
+                if not matches:
+                    raise FilterError(f"알 수 없는 비고 표시: {label}")
+                if len(matches) > 1 and not exact:
+                    names = ", ".join(FLAG_LABELS[b] for b in matches)
+                    raise FilterError(f"비고 표시가 모호합니다: {label} ({names})")
+                bits |= (exact or matches)[0]
+            terms.append((field, ":", bits, bool(negate) or op == "!="))
+        elif field == "creditGrade":
+            grade = canonical_grade(raw)
+            if grade not in _GRADE_RANK:
+                raise FilterError(f"알 수 없는 신용등급: {raw}")
+            if op == ":":
+                terms.append((field, ":", grade, bool(negate)))
+            else:
+                terms.append((field, op, _GRADE_RANK[grade], bool(negate)))
+        else:
+            terms.append((field, op, parse_amount(raw), bool(negate)))
+    return normalize_name(" ".join(name_words)), terms
+
+
+def _term_predicate(data, field, op, value):
+    column = data.column(field)
+    if field == "region":
+        return lambda i: any(v in column[i] for v in value)
+    if field == "noteFlags":
+        return lambda i: (column[i] & value) == value
+    if field == "creditGrade":
+        if op in (":", "="):
+            return lambda i: canonical_grade(column[i]) == value
+        if op == "!=":
+            return lambda i: canonical_grade(column[i]) != value
+        compare = _OPS[op]
+        return lambda i: bool(column[i]) and compare(grade_rank(column[i]), value)
+    compare = _OPS[op]
+    # NaN (missing) never satisfies a comparison, so blank cells drop out of numeric filters.
+    return lambda i: not math.isnan(column[i]) and compare(column[i], value)
+
+
+def filter_indexes(data, text):
+    name_query, terms = parse_filter(text)
+    norms = data.column("norm")
+    if name_query:
+        candidates = [i for i, norm in enumerate(norms) if name_query in norm]
+    else:
+        candidates = range(len(data))
+    # Cheap equality-style terms first so the numeric comparisons see fewer rows.
+    terms = sorted(terms, key=lambda t: t[0] not in ("region", "noteFlags"))
+    for field, op, value, negate in terms:
+        predicate = _term_predicate(data, field, op, value)
+        if negate:
+            candidates = [i for i in candidates if not predicate(i)]
+        else:
+            candidates = [i for i in candidates if predicate(i)]
+    return list(candidates)
+
+
+def filter_all(stores, text, limit=None):
+    # 전체 mode: every industry's matches in industry order, each tagged with its industry.
+    found = []
+    for industry, data in stores.items():
+        found.extend((industry, row) for row in data.rows(filter_indexes(data, text)))
+    return found[:limit] if limit is not None else found
@@ -0,0 +1,148 @@
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from text_utils import normalize_name
+
+# 자주 선택하는 업체 기록. 선택할 때마다 점수 +1, 점수는 반감기마다 절반으로 줄어듦.
+# 파일: {"version": 1, "entries": {entry id: [score, last picked (epoch s), name, region]}}
+QUICK_PICKS_PATH = Path(__file__).resolve().parent / ".quick_picks.json"
+QUICK_PICKS_VERSION = 1
+HALF_LIFE_DAYS = 30
+MAX_ENTRIES = 500
+SHORT_QUERY_LENGTH = 2
+
+_STATE = {"entries": None}
+_LOCK = threading.Lock()
+
+
+def entry_id(file_type, row):
+    # bizNo digits when the row has one, else region + normalized name; both survive reloads
+    # and row reordering, unlike a position. Worker records (row_record) carry no "norm".
+    biz_no = row.get("bizNo") or ""
+    if biz_no:
+        return f"{file_type}:{biz_no}"
+    norm = row.get("norm") or normalize_name(row.get("name") or "")
+    return f"{file_type}:{row.get('region') or ''}:{norm}"
+
+
+def _decayed(score, last, now):
+    return score * math.pow(0.5, max(0.0, now - last) / (HALF_LIFE_DAYS * 86400))
+
+
+def load(path=None):
+    with _LOCK:
+        if _STATE["entries"] is None:
+            try:
+                with open(path or QUICK_PICKS_PATH, "r", encoding="utf-8") as f:
+                    payload = json.load(f)
+                entries = payload.get("entries") if payload.get("version") == QUICK_PICKS_VERSION else None
+            except (OSError, ValueError, AttributeError):
+                entries = None
+            _STATE["entries"] = entries if isinstance(entries, dict) else {}
+        return _STATE["entries"]
+
+
+def save(path=None):
+    path = Path(path or QUICK_PICKS_PATH)
+    with _LOCK:
+        entries = _STATE["entries"] or {}
+        now = time.time()
+        if len(entries) > MAX_ENTRIES:
+            keep = sorted(entries, key=lambda k: _decayed(entries[k][0], entries[k][1], now), reverse=True)
+            entries = {k: entries[k] for k in keep[:MAX_ENTRIES]}
+            _STATE["entries"] = entries
+        payload = {"version": QUICK_PICKS_VERSION, "entries": entries}
+    try:
+        fd, tmp_path = tempfile.mkstemp(prefix=".quick_picks.", dir=str(path.parent))
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def record(file_type, row, now=None):
+    entries = load()
+    now = time.time() if now is None else now
+    key = entry_id(file_type, row)
+    with _LOCK:
+        score, last = entries.get(key, (0.0, now))[:2]
+        entries[key] = [round(_decayed(score, last, now) + 1.0, 4), int(now), row.get("name") or "",
+                        row.get("region") or ""]
+    save()
+
+
+def top(file_types, limit=20, now=None):
+    # -> [(file_type, entry id, score)] best first, for the given industries.
+    entries = load()
+    now = time.time() if now is None else now
+    wanted = set(file_types)
+    picks = []
+    for key, item in entries.items():
+        file_type = key.split(":", 1)[0]
+        if file_type in wanted:
+            picks.append((file_type, key, _decayed(item[0], item[1], now)))
+    picks.sort(key=lambda p: p[2], reverse=True)
+    return picks[:limit]
+
+
+def resolve(data, file_type, keys):
+    # entry ids -> rows of `data`, skipping ids not present (e.g. a load still in progress).
+    index, _ = data.biz_index()
+    by_name = None
+    rows = []
+    for key in keys:
+        rest = key.split(":", 1)[1]
+        if ":" not in rest:
+            i = index.get(rest)
+        else:
+            if by_name is None:
+                regions, norms = data.column("region"), data.column("norm")
+                by_name = {}
+                for n in range(len(data)):
+                    by_name.setdefault(f"{regions[n]}:{norms[n]}", n)
+            i = by_name.get(rest)
+        if i is not None:
+            rows.append(data[i])
+    return rows
+
+
+def quick_picks(stores, query="", limit=20):
+    # [(file_type, row)] of the most-picked entries in `stores` whose name contains `query`
+    # (already normalized); used for the empty / one-letter search box.
+    found = []
+    ranked = top(stores, limit=MAX_ENTRIES)
+    for file_type, data in stores.items():
+        keys = [key for ft, key, _ in ranked if ft == file_type]
+        found.extend((file_type, row) for row in resolve(data, file_type, keys) if query in row["norm"])
+    order = {key: n for n, (_, key, _) in enumerate(ranked)}
+    found.sort(key=lambda item: order.get(entry_id(item[0], item[1]), len(order)))
+    return found[:limit]
+
+
+def boost(found, now=None):
+    # Stable re-rank of [(file_type, row)]: frequently picked entries first, the original order
+    # otherwise.
+    entries = load()
+    if not entries or not found:
+        return found
+    now = time.time() if now is None else now
+    scores = []
+    for file_type, row in found:
+        item = entries.get(entry_id(file_type, row))
+        scores.append(_decayed(item[0], item[1], now) if item else 0.0)
+    if not any(scores):
+        return found
+    order = sorted(range(len(found)), key=lambda n: -scores[n])
+    return [found[n] for n in order]
@@ -0,0 +1,419 @@
+import argparse
+import csv
+import heapq
+import json
+import math
+import re
+import sys
+from pathlib import Path
+
+from config_store import get_industry_averages, resolve_db_path
+from formulas_store import get_formulas_version, get_tier_by_amount, tier_key
+from perf_trace import span
+from scoring import management_column
+from search_core import INDUSTRY_CODES, OUTPUT_FIELDS, row_record
+
+DEFAULT_TOP_K = 10
+SCORE_FIELDS = ["management", "performance", "total"]
+
+# 공고 JSON(협정보드 저장 파일)에서 추천에 쓰는 값만 꺼냄. payload 가 우선, meta 는 보조.
+_NOTICE_KEYS = ("ownerId", "rangeId", "estimatedAmount", "baseAmount", "dutyRegions", "fileType",
+                "industryLabel", "noticeDate", "noticeTitle", "entryAmount", "entryMode", "regionDutyRate",
+                "participantLimit", "groupSize")
+
+# 협정보드 범위 메뉴 key: "<발주처>-<하한>to<상한>" 또는 "<발주처>-under<상한>" (억 단위)
+_RANGE_RE = re.compile(r"^[a-z]+-(?:(\d+)to(\d+)|under(\d+))$")
+
+
+def _to_amount(value):
+    if value is None or value == "":
+        return None
+    try:
+        return float(str(value).replace(",", "").strip())
+    except ValueError:
+        return None
+
+
+def load_notice(path):
+    with open(path, "r", encoding="utf-8") as f:
+        doc = json.load(f)
+    meta = doc.get("meta") or {}
+    payload = doc.get("payload") or doc
+    notice = {key: payload.get(key) if payload.get(key) not in (None, "") else meta.get(key) for key in _NOTICE_KEYS}
+    return normalize_notice(notice)
+
+
+def normalize_notice(notice):
+    notice = dict(notice)
+    notice["ownerId"] = str(notice.get("ownerId") or "").strip().lower()
+    notice["rangeId"] = str(notice.get("rangeId") or "").strip().lower()
+    notice["estimatedAmount"] = _to_amount(notice.get("estimatedAmount"))
+    notice["baseAmount"] = _to_amount(notice.get("baseAmount"))
+    notice["entryAmount"] = _to_amount(notice.get("entryAmount"))
+    notice["regionDutyRate"] = _to_amount(notice.get("regionDutyRate")) or 0
+    notice["dutyRegions"] = [r for r in (notice.get("dutyRegions") or []) if r]
+    if not notice.get("fileType"):
+        notice["fileType"] = INDUSTRY_CODES.get(str(notice.get("industryLabel") or "").strip())
+    return notice
+
+
+def performance_base(notice):
+    # Same choice as the agreement board: PPS 50억 미만 and LH 50~100억 score against the base
+    # amount, EX prefers base over estimated, everything else prefers the estimated amount.
+    base = notice.get("baseAmount") or 0
+    estimated = notice.get("estimatedAmount") or 0
+    owner, range_id = notice["ownerId"], notice["rangeId"]
+    if range_id in ("pps-under50", "lh-50to100"):
+        return base if base > 0 else None
+    if owner == "ex":
+        return base if base > 0 else (estimated if estimated > 0 else None)
+    return estimated if estimated > 0 else (base if base > 0 else None)
+
+
+# --- JS 실적 수식 (formulas.defaults.json "formula") → 파이썬 함수 ----------------------------
+# evaluator.js 는 new Function 으로 실행한다. 여기서는 허용된 토큰(숫자, 변수, Math 함수, 연산자)만
+# 파싱해 파이썬 식으로 다시 쓰고, 그 식을 builtins 없는 전역으로 eval 해 람다로 만든다.
+
+FORMULA_VARIABLES = ("perf5y", "perf3y", "baseAmount", "estimatedAmount", "perfCoefficient")
+
+_TOKEN_RE = re.compile(r"\s*(?:(\d+(?:\.\d*)?|\.\d+)|(Math\.[a-z]+|[A-Za-z_]\w*)|(===|!==|==|!=|>=|<=|&&|\|\||[-+*/%()?:<>!,]))")
+_MATH = {"Math.round": "_js_round", "Math.floor": "_floor", "Math.ceil": "_ceil", "Math.trunc": "_trunc",
+         "Math.abs": "abs", "Math.min": "min", "Math.max": "max"}
+# Binary operators by precedence, loosest first: JS token -> Python operator.
+_BINARY = [
+    {"||": "or"},
+    {"&&": "and"},
+    {"===": "==", "==": "==", "!==": "!=", "!=": "!=", ">=": ">=", "<=": "<=", ">": ">", "<": "<"},
+    {"+": "+", "-": "-"},
+    {"*": "*", "/": "/", "%": "%"},
+]
+
+
+def _js_round(value):
+    # Math.round rounds halves toward +infinity, unlike Python's banker's rounding.
+    return math.floor(value + 0.5)
+
+
+_FORMULA_GLOBALS = {"__builtins__": {}, "_js_round": _js_round, "_floor": math.floor, "_ceil": math.ceil,
+                    "_trunc": math.trunc, "abs": abs, "min": min, "max": max}
+
+
+class FormulaError(ValueError):
+    pass
+
+
+class _FormulaParser:
+    def __init__(self, text):
+        self.tokens = []
+        pos = 0
+        text = text.strip()
+        while pos < len(text):
+            m = _TOKEN_RE.match(text, pos)
+            if not m or m.end() == pos:
+                raise FormulaError(f"수식을 읽을 수 없습니다: {text[pos:pos + 10]}")
+            number, name, op = m.groups()
+            self.tokens.append(("num", number) if number else ("name", name) if name else ("op", op))
+            pos = m.end()
+        self.pos = 0
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else (None, None)
+
+    def take(self, op=None):
+        kind, value = self.peek()
+        if op is not None and (kind != "op" or value != op):
+            raise FormulaError(f"'{op}' 가 필요합니다")
+        self.pos += 1
+        return kind, value
+
+    def parse(self):
+        source = self.ternary()
+        if self.pos != len(self.tokens):
+            raise FormulaError(f"남는 토큰: {self.peek()[1]}")
+        return source
+
+    def ternary(self):
+        cond = self.binary(0)
+        if self.peek() == ("op", "?"):
+            self.take("?")
+            yes = self.ternary()
+            self.take(":")
+            no = self.ternary()
+            return f"(({yes}) if ({cond}) else ({no}))"
+        return cond
+
+    def binary(self, level):
+        if level == len(_BINARY):
+            return self.unary()
+        ops = _BINARY[level]
+        left = self.binary(level + 1)
+        while self.peek()[0] == "op" and self.peek()[1] in ops:
+            _, op = self.take()
+            right = self.binary(level + 1)
+            # Parenthesize every step so Python's comparison chaining never kicks in.
+            left = f"({left} {ops[op]} {right})"
+        return left
+
+    def unary(self):
+        kind, value = self.peek()
+        if kind == "op" and value in ("-", "+", "!"):
+            self.take()
+            operand = self.unary()
+            return f"(not {operand})" if value == "!" else f"({value}{operand})"
+        return self.primary()
+
+    def primary(self):
+        kind, value = self.take()
+        if kind == "num":
+            return repr(float(value))
+        if kind == "op" and value == "(":
+            inner = self.ternary()
+            self.take(")")
+            return f"({inner})"
+        if kind == "name" and value in _MATH:
+            self.take("(")
+            args = [self.ternary()]
+            while self.peek() == ("op", ","):
+                self.take(",")
+                args.append(self.ternary())
+            self.take(")")
+            return f"{_MATH[value]}({', '.join(args)})"
+        if kind == "name" and value in FORMULA_VARIABLES:
+            return value
+        raise FormulaError(f"허용되지 않은 이름: {value}")
+
+
+_COMPILED = {}
+
+
+def compile_formula(text):
+    # -> callable(perf5y, perf3y, baseAmount, estimatedAmount, perfCoefficient) returning a
+    # finite float or None, mirroring evalPerformanceFormula (errors and NaN/Infinity -> None).
+    if not text or not isinstance(text, str):
+        return None
+    if text not in _COMPILED:
+        source = _FormulaParser(text).parse()
+        fn = eval(f"lambda {', '.join(FORMULA_VARIABLES)}: {source}", _FORMULA_GLOBALS)
+
+        def run(*args, _fn=fn):
+            try:
+                value = float(_fn(*args))
+            except (ArithmeticError, TypeError, ValueError):
+                return None
+            return value if math.isfinite(value) else None
+
+        _COMPILED[text] = run
+    return _COMPILED[text]
+
+
+# --- evaluator.js evalPerformance 포팅 ------------------------------------------------------
+
+
+def apply_rounding(value, rounding):
+    if not rounding:
+        return value
+    factor = 10 ** int(rounding.get("digits") or 0)
+    method = rounding.get("method") or "round"
+    if method == "truncate":
+        return math.trunc(value * factor) / factor
+    if method == "floor":
+        return math.floor(value * factor) / factor
+    if method == "ceil":
+        return math.ceil(value * factor) / factor
+    return _js_round(value * factor) / factor
+
+
+def resolve_performance_variant(perf, file_type, estimated_amount):
+    for variant in perf.get("variants") or []:
+        when = variant.get("when") or {}
+        allowed = [str(v or "").strip().lower() for v in when.get("fileTypes") or []]
+        if allowed and (file_type or "") not in allowed:
+            continue
+        lt = when.get("estimatedAmountLt")
+        if lt is not None and (estimated_amount is None or not estimated_amount < lt):
+            continue
+        gte = when.get("estimatedAmountGte")
+        if gte is not None and (estimated_amount is None or not estimated_amount >= gte):
+            continue
+        merged = dict(perf)
+        merged.update({k: v for k, v in variant.items() if k != "when"})
+        return merged
+    return perf
+
+
+def _max_score(perf):
+    config_max = perf.get("maxScore")
+    config_max = float(config_max) if isinstance(config_max, (int, float)) else None
+    if perf.get("mode") == "ratio-bands":
+        band_max = max([float(t.get("score") or 0) for t in perf.get("thresholds") or []] + [0])
+        best = max(band_max, config_max or 0)
+        return best if best > 0 else None
+    if config_max is not None:
+        return config_max if config_max > 0 else None
+    return 13.0
+
+
+def performance_scorer(perf, base, estimated_amount):
+    # -> function(perf5y, perf3y) -> score, with the rule lookups done once per column. Bands and
+    # the fallback ratio use the 5-year figure; formulas get both.
+    perf = perf or {}
+    max_score = _max_score(perf)
+    rounding = perf.get("rounding")
+    base = base or 0
+    estimated = estimated_amount or 0
+
+    def finish(value):
+        capped = min(value, max_score) if max_score is not None else value
+        return apply_rounding(capped, rounding)
+
+    bands = sorted(
+        (float(t.get("minRatio")), float(t.get("score")))
+        for t in perf.get("thresholds") or []
+        if isinstance(t.get("minRatio"), (int, float)) and isinstance(t.get("score"), (int, float))
+    )
+    if perf.get("mode") == "ratio-bands" and bands:
+        def score(perf5y, perf3y):
+            ratio = perf5y / base if base > 0 else 0
+            usable = 0
+            for min_ratio, band_score in bands:
+                if ratio < min_ratio:
+                    break
+                usable = band_score
+            return finish(usable)
+        return score
+
+    try:
+        formula = compile_formula(perf.get("formula"))
+    except FormulaError:
+        formula = None
+
+    def score(perf5y, perf3y):
+        raw = formula(perf5y, perf3y, base, estimated, 0.0) if formula else None
+        if raw is None:
+            raw = (perf5y / base) * (max_score or 0) if base > 0 else 0
+        return finish(raw)
+    return score
+
+
+def tier_amount(notice):
+    # The agreement board picks the tier from its range menu (parseRangeAmountHint): the middle
+    # of "50억~100억", 90% of "50억 미만". Range ids carry the same bounds ("mois-50to100",
+    # "pps-under50"); without a range the estimated amount decides.
+    m = _RANGE_RE.match(notice.get("rangeId") or "")
+    if m:
+        low, high, under = m.groups()
+        if under:
+            return round(float(under) * 1e8 * 0.9)
+        return round((float(low) + float(high)) / 2 * 1e8)
+    return notice.get("estimatedAmount") or 0
+
+
+def notice_performance_scorer(notice):
+    # -> (tier, scorer) for the notice's agency/range, or (None, None) when no tier applies.
+    estimated = notice.get("estimatedAmount")
+    tier = get_tier_by_amount(notice["ownerId"], tier_amount(notice), notice.get("noticeDate"))
+    if not tier:
+        return None, None
+    perf = resolve_performance_variant((tier.get("rules") or {}).get("performance") or {}, notice["fileType"], estimated)
+    return tier, performance_scorer(perf, performance_base(notice), estimated)
+
+
+def performance_column(data, notice):
+    # Cached next to the management columns on the loaded snapshot.
+    agency, file_type = notice["ownerId"], notice["fileType"]
+    tier, scorer = notice_performance_scorer(notice)
+    if not tier:
+        return None
+    key = ("performance", agency, tier_key(tier), file_type, performance_base(notice), notice.get("estimatedAmount"))
+    deps = (get_formulas_version(),)
+    cached = data.score_columns.get(key)
+    if cached is not None and cached["deps"] == deps:
+        return cached["values"]
+    with span("score.performance", agency=agency, fileType=file_type, rows=len(data)):
+        values = [scorer(0.0 if math.isnan(p5) else p5, 0.0 if math.isnan(p3) else p3)
+                  for p5, p3 in zip(data.column("perf5y"), data.column("perf3y"))]
+    data.score_columns[key] = {"deps": deps, "values": values}
+    return values
+
+
+def load_industry_db(file_type):
+    from db_loader import load_db_cached
+
+    db_path = resolve_db_path(file_type)
+    if not db_path or not db_path.is_file():
+        raise FileNotFoundError(f"DB 파일을 찾을 수 없습니다: {db_path}")
+    return load_db_cached(db_path, industry=file_type)
+
+
+def score_columns(data, notice):
+    # -> (management column, performance column) for a normalized notice.
+    management = management_column(data, notice["ownerId"], tier_amount(notice), notice["fileType"], get_industry_averages(),
+                                   notice.get("noticeDate"))
+    performance = performance_column(data, notice)
+    if management is None or performance is None:
+        raise ValueError(f"발주처 기준을 찾을 수 없습니다: {notice['ownerId']}")
+    return management, performance
+
+
+def recommend(notice, data=None, k=DEFAULT_TOP_K):
+    # -> {duty region: [records best first]}; with no duty regions every entry competes under "전체".
+    notice = normalize_notice(notice)
+    file_type = notice["fileType"]
+    if file_type not in INDUSTRY_CODES.values():
+        raise ValueError(f"공고의 공종을 알 수 없습니다: {notice.get('fileType') or notice.get('industryLabel')}")
+    if data is None:
+        data = load_industry_db(file_type)
+    management, performance = score_columns(data, notice)
+
+    with span("recommend", entries=len(data), regions=len(notice["dutyRegions"])) as counts:
+        totals = [(m or 0) + p for m, p in zip(management, performance)]
+        sipyung = data.column("sipyung")
+        regions = data.column("region")
+        # Ties on total go to the larger 시평 (NaN sorts last).
+        key = lambda i: (totals[i], -math.inf if math.isnan(sipyung[i]) else sipyung[i])
+        shortlist = {}
+        for duty in notice["dutyRegions"] or ["전체"]:
+            if duty == "전체":
+                indexes = range(len(data))
+            else:
+                indexes = [i for i, region in enumerate(regions) if duty in region]
+            best = heapq.nlargest(k, indexes, key=key)
+            shortlist[duty] = [
+                row_record(data[i], file_type,
+                           {"management": management[i], "performance": performance[i], "total": round(totals[i], 4)})
+                for i in best
+            ]
+        counts["picked"] = sum(len(v) for v in shortlist.values())
+    return shortlist
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="공고 기준 협정 후보 업체 추천 (지역의무별 상위 K)")
+    parser.add_argument("notice", help="협정보드에서 저장한 공고 .json")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP_K)
+    parser.add_argument("--db", help="config 대신 직접 지정할 .xlsx 경로")
+    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    args = parser.parse_args(argv)
+
+    notice = load_notice(args.notice)
+    data = None
+    if args.db:
+        from db_loader import load_db_cached
+
+        data = load_db_cached(Path(args.db))
+    shortlist = recommend(notice, data, args.top)
+    if args.format == "csv":
+        writer = csv.DictWriter(sys.stdout, fieldnames=["dutyRegion"] + OUTPUT_FIELDS + SCORE_FIELDS,
+                                extrasaction="ignore")
+        writer.writeheader()
+        for duty, records in shortlist.items():
+            for record in records:
+                writer.writerow(dict(record, dutyRegion=duty))
+    else:
+        json.dump(shortlist, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+import hashlib
+import json
+import re
+
+from entry_store import EntryStore
+from formulas_store import get_formulas_version, get_management_rules, get_tier_by_amount, tier_key
+from perf_trace import span
+
+
+def _truncate(value, digits=2):
+    factor = 10 ** digits
+    return int(value * factor) / factor
+
+
+def score_credit_from_table(grade: str, grade_table):
+    g = str(grade).strip().upper()
+    match = re.match(r"^([A-Z]{1,3}[0-9]?(?:[+-])?)", g)
+    if match:
+        g = match.group(1)
+    for row in grade_table or []:
+        if str(row.get("grade", "")).strip().upper() == g:
+            return row.get("score")
+    return None
+
+
+def score_by_thresholds(value, thresholds, scale):
+    if value is None:
+        return None
+    try:
+        value = float(value)
+    except Exception:
+        return None
+    for rule in thresholds or []:
+        if "lt" in rule and value < rule["lt"]:
+            return rule["score"]
+        if "lte" in rule and value <= rule["lte"]:
+            return rule["score"]
+        if "gt" in rule and value > rule["gt"]:
+            return rule["score"]
+        if "gte" in rule and value >= rule["gte"]:
+            return rule["score"]
+        if "ltYears" in rule and value < rule["ltYears"]:
+            return rule["score"]
+        if "gteYears" in rule and value >= rule["gteYears"]:
+            return rule["score"]
+    return None
+
+
+def compute_management(row, file_type, industry_avg, rules):
+    if not rules:
+        return None
+    method_selection = rules.get("methodSelection", "max")
+    rounding = rules.get("rounding", {}) or {}
+    methods = rules.get("methods", [])
+
+    composite_score = None
+    credit_score = None
+
+    for method in methods:
+        if method.get("id") == "composite":
+            components = (method.get("components") or {})
+            total = 0.0
+            has_any = False
+            for key, spec in components.items():
+                if key == "debtRatio":
+                    val = row.get("debtRatio")
+                    avg = industry_avg[file_type]["debtRatio"]
+                    base = (val / avg) if (val is not None and avg) else None
+                    score = score_by_thresholds(base, spec.get("thresholds"), spec.get("scale"))
+                elif key == "currentRatio":
+                    val = row.get("currentRatio")
+                    avg = industry_avg[file_type]["currentRatio"]
+                    base = (val / avg) if (val is not None and avg) else None
+                    score = score_by_thresholds(base, spec.get("thresholds"), spec.get("scale"))
+                elif key == "bizYears":
+                    score = score_by_thresholds(row.get("bizYears"), spec.get("thresholds"), spec.get("scale"))
+                else:
+                    score = None
+                if score is not None:
+                    total += float(score)
+                    has_any = True
+            if has_any:
+                composite_score = total
+        elif method.get("id") == "credit":
+            grade_table = method.get("gradeTable", [])
+            credit_score = score_credit_from_table(row.get("creditGrade", ""), grade_table)
+
+    candidates = []
+    if composite_score is not None:
+        candidates.append(composite_score)
+    if credit_score is not None:
+        candidates.append(credit_score)
+    if not candidates:
+        return None
+    if method_selection == "max":
+        best = max(candidates)
+    else:
+        best = sum(candidates)
+    best = min(15.0, max(0.0, best))
+    digits = rounding.get("digits", 2)
+    if rounding.get("method") == "truncate":
+        return _truncate(best, digits)
+    return round(best, digits)
+
+
+def _digest(value):
+    text = json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def management_column(data, agency_id, amount, file_type, industry_avg, notice_date=None):
+    # Columns hang off the loaded snapshot, so a reloaded workbook starts empty; within one
+    # snapshot a column is only recomputed when its industry average or the formulas change.
+    tier = get_tier_by_amount(agency_id, amount, notice_date)
+    if not tier:
+        return None
+    rules = (tier.get("rules") or {}).get("management")
+    key = (
+        str(agency_id or "").strip().lower(),
+        tier_key(tier),
+        file_type,
+    )
+    average = (industry_avg or {}).get(file_type)
+    version = get_formulas_version()
+    columns = data.score_columns
+    cached = columns.get(key)
+    if cached is not None and cached["version"] == version:
+        # load_config hands back the same dict until config.json changes, so the average only
+        # has to be hashed again when a different object comes in.
+        if cached["average"] is average:
+            return cached["values"]
+        if cached["digest"] == _digest(average):
+            cached["average"] = average
+            return cached["values"]
+    with span("score.column", agency=key[0], fileType=file_type, rows=len(data)):
+        values = [compute_management(row, file_type, industry_avg, rules) for row in data]
+    columns[key] = {"version": version, "digest": _digest(average), "average": average, "values": values}
+    return values
+
+
+def lookup_management(data, row, agency_id, amount, file_type, industry_avg, notice_date=None):
+    position = data.position(row) if isinstance(data, EntryStore) else -1
+    if position < 0:
+        rules = get_management_rules(agency_id, amount, notice_date)
+        return compute_management(row, file_type, industry_avg, rules)
+    values = management_column(data, agency_id, amount, file_type, industry_avg, notice_date)
+    return values[position] if values is not None else None
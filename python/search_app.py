@@ -1,3 +1,8 @@
-from ui_search import open_modal
+def open_modal():
+    # PySide6 and the dialog module load only when the macro actually opens the dialog.
+    from ui_search import open_modal as _open_modal
+
+    return _open_modal()
+
 
 __all__ = ["open_modal"]
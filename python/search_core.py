@@ -0,0 +1,80 @@
+from text_utils import normalize_biz_no, normalize_name
+
+INDUSTRY_LABELS = {"eung": "전기", "tongsin": "통신", "sobang": "소방"}
+INDUSTRY_CODES = {label: code for code, label in INDUSTRY_LABELS.items()}
+ALL_INDUSTRIES_LABEL = "전체"
+
+OUTPUT_FIELDS = ["industry", "name", "region", "bizNo", "managerName", "sipyung", "perf5y",
+                 "debtRatio", "currentRatio", "bizYears", "creditGrade"]
+
+
+def find_indexes(data, query):
+    q = normalize_name(query)
+    if not q:
+        return []
+    return [i for i, norm in enumerate(data.column("norm")) if q in norm]
+
+
+def search(data, query, limit=None):
+    hits = find_indexes(data, query)
+    if limit is not None:
+        hits = hits[:limit]
+    return data.rows(hits)
+
+
+def rank_key(norm, q):
+    # Exact name first, then names starting with the query, then anywhere; shorter names
+    # (closer to what was typed) ahead of longer ones.
+    tier = 0 if norm == q else 1 if norm.startswith(q) else 2
+    return tier, len(norm)
+
+
+def search_all(stores, query, limit=None):
+    # stores: {industry: EntryStore}. Hits from every industry are merged into one ranking;
+    # returns [(industry, row)] tagged with the source industry.
+    q = normalize_name(query)
+    if not q:
+        return []
+    merged = []
+    for order, (industry, data) in enumerate(stores.items()):
+        norms = data.column("norm")
+        merged.extend((rank_key(norms[i], q), order, i, industry) for i in find_indexes(data, q))
+    merged.sort()
+    if limit is not None:
+        merged = merged[:limit]
+    return [(industry, stores[industry][i]) for _, _, i, industry in merged]
+
+
+def resolve_biz_nos(data, biz_nos):
+    # Bulk lookup for notice candidates and batch scripts. Numbers shared by several entries
+    # are returned under "conflicts" with every row instead of picking one.
+    index, duplicates = data.biz_index()
+    found = {}
+    conflicts = {}
+    missing = []
+    seen = set()
+    for raw in biz_nos:
+        key = normalize_biz_no(raw)
+        if not key:
+            # No digits at all: echo what was sent so the caller can tell its inputs apart.
+            missing.append(str(raw))
+            continue
+        if key in seen:
+            continue
+        seen.add(key)
+        if key in duplicates:
+            conflicts[key] = data.rows(duplicates[key])
+        elif key in index:
+            found[key] = data[index[key]]
+        else:
+            missing.append(key)
+    return {"found": found, "conflicts": conflicts, "missing": missing}
+
+
+def row_record(row, industry, extra=None):
+    record = {"industry": industry}
+    for field in OUTPUT_FIELDS[1:]:
+        record[field] = row.get(field)
+    if extra:
+        record.update(extra)
+    return record
@@ -0,0 +1,203 @@
+import argparse
+import json
+import sqlite3
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from db_loader import SNAPSHOT_DIR, file_fingerprint
+from entry_store import FIELDS, NUMERIC_FIELDS
+from search_core import INDUSTRY_LABELS, rank_key
+from text_utils import normalize_biz_no, normalize_name
+
+DEFAULT_SQLITE_PATH = SNAPSHOT_DIR / "partners.sqlite3"
+SCHEMA_VERSION = 3
+
+_COLUMNS = ", ".join(f"{field} REAL" if field in NUMERIC_FIELDS else f"{field}" for field in FIELDS)
+_INDEXED = ("bizNo", "region", "sipyung", "perf5y", "debtRatio", "currentRatio", "creditGrade")
+
+
+def _fts_tokenizer(conn):
+    # trigram (SQLite 3.34+) matches any 3+ character substring, which is what name search
+    # needs; older builds fall back to unicode61 word tokens.
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp._probe USING fts5(x, tokenize='trigram')")
+        conn.execute("DROP TABLE temp._probe")
+        return "trigram"
+    except sqlite3.OperationalError:
+        return "unicode61"
+
+
+def connect(path=None, readonly=False):
+    path = Path(path or DEFAULT_SQLITE_PATH)
+    if readonly:
+        conn = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True, timeout=10, check_same_thread=False)
+    else:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), timeout=10, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        _ensure_schema(conn)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _ensure_schema(conn):
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version == SCHEMA_VERSION:
+        return
+    tokenizer = _fts_tokenizer(conn)
+    with conn:
+        conn.execute("DROP TABLE IF EXISTS entries")
+        conn.execute("DROP TABLE IF EXISTS entries_fts")
+        conn.execute("DROP TABLE IF EXISTS meta")
+        conn.execute(
+            "CREATE TABLE meta (industry TEXT PRIMARY KEY, path TEXT, fingerprint TEXT,"
+            " entries INTEGER, tokenizer TEXT, updated_at TEXT)"
+        )
+        conn.execute(f"CREATE TABLE entries (id INTEGER PRIMARY KEY, industry TEXT NOT NULL, position INTEGER, {_COLUMNS})")
+        for field in _INDEXED:
+            conn.execute(f"CREATE INDEX idx_entries_{field} ON entries (industry, {field})")
+        conn.execute(f"CREATE VIRTUAL TABLE entries_fts USING fts5(norm, tokenize='{tokenizer}')")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def tokenizer(conn):
+    row = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'entries_fts'").fetchone()
+    return "trigram" if row and "trigram" in row[0] else "unicode61"
+
+
+def export(conn, industry, data):
+    ids = [row[0] for row in conn.execute("SELECT id FROM entries WHERE industry = ?", (industry,))]
+    values = []
+    for i in range(len(data)):
+        values.append((industry, i, *(data.value(i, field) for field in FIELDS)))
+    placeholders = ", ".join("?" for _ in range(len(FIELDS) + 2))
+    with conn:
+        conn.executemany("DELETE FROM entries_fts WHERE rowid = ?", ((i,) for i in ids))
+        conn.execute("DELETE FROM entries WHERE industry = ?", (industry,))
+        conn.executemany(f"INSERT INTO entries (industry, position, {', '.join(FIELDS)}) VALUES ({placeholders})", values)
+        conn.execute(
+            "INSERT INTO entries_fts (rowid, norm) SELECT id, norm FROM entries WHERE industry = ?", (industry,)
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO meta VALUES (?, ?, ?, ?, ?, ?)",
+            (industry, data.path, data.fingerprint, len(data), tokenizer(conn),
+             datetime.now().isoformat(timespec="seconds")),
+        )
+
+
+def sync(industry, data, path=None):
+    # Called by db_loader whenever a workbook is (re)loaded for an industry, so an existing
+    # store follows workbook edits. Nothing is created for users who never ran export.
+    path = Path(path or DEFAULT_SQLITE_PATH)
+    if not data.fingerprint or not path.exists():
+        return False
+    conn = connect(path)
+    try:
+        row = conn.execute("SELECT fingerprint FROM meta WHERE industry = ?", (industry,)).fetchone()
+        if row is not None and row["fingerprint"] == data.fingerprint:
+            return False
+        export(conn, industry, data)
+        return True
+    finally:
+        conn.close()
+
+
+def refresh(conn, industries=None, force=False):
+    # Re-exports only the industries whose workbook fingerprint differs from meta. Returns the
+    # list of industries that were written.
+    from config_store import resolve_db_path
+    from db_loader import load_db_cached
+
+    known = {row["industry"]: row["fingerprint"] for row in conn.execute("SELECT industry, fingerprint FROM meta")}
+    written = []
+    for industry in industries or INDUSTRY_LABELS:
+        db_path = resolve_db_path(industry)
+        if not db_path or not db_path.is_file():
+            continue
+        if not force and known.get(industry) == file_fingerprint(db_path):
+            continue
+        export(conn, industry, load_db_cached(db_path, industry=industry))
+        written.append(industry)
+    return written
+
+
+def _record(row):
+    record = dict(row)
+    record.pop("id", None)
+    record["managerConfident"] = bool(record.get("managerConfident"))
+    return record
+
+
+def search(conn, query, industry=None, limit=50):
+    q = normalize_name(query)
+    if not q:
+        return []
+    where = "industry = ? AND " if industry else ""
+    args = [industry] if industry else []
+    if tokenizer(conn) == "trigram" and len(q) >= 3:
+        sql = (f"SELECT e.* FROM entries_fts f JOIN entries e ON e.id = f.rowid "
+               f"WHERE {where.replace('industry', 'e.industry')}entries_fts MATCH ?")
+        args.append('"' + q.replace('"', '""') + '"')
+    else:
+        # trigram needs three characters; short queries (and unicode61 builds) scan norm.
+        sql = f"SELECT * FROM entries WHERE {where}instr(norm, ?) > 0"
+        args.append(q)
+    rows = conn.execute(sql, args).fetchall()
+    rows.sort(key=lambda r: (rank_key(r["norm"], q), r["industry"], r["position"]))
+    if limit is not None:
+        rows = rows[:limit]
+    return [_record(r) for r in rows]
+
+
+def by_biz_no(conn, biz_nos, industry=None):
+    keys = sorted({normalize_biz_no(b) for b in biz_nos} - {""})
+    found = {}
+    for start in range(0, len(keys), 500):
+        chunk = keys[start:start + 500]
+        marks = ", ".join("?" for _ in chunk)
+        sql = f"SELECT * FROM entries WHERE bizNo IN ({marks})"
+        args = list(chunk)
+        if industry:
+            sql += " AND industry = ?"
+            args.append(industry)
+        for row in conn.execute(sql, args):
+            found.setdefault(row["bizNo"], []).append(_record(row))
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="업체 DB SQLite 내보내기/조회")
+    parser.add_argument("--db", default=str(DEFAULT_SQLITE_PATH), help="SQLite 파일 경로")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("export", help="바뀐 공종 DB만 다시 내보내기")
+    p.add_argument("--industry", choices=sorted(INDUSTRY_LABELS), action="append")
+    p.add_argument("--force", action="store_true")
+    p = sub.add_parser("search", help="업체명 검색")
+    p.add_argument("query")
+    p.add_argument("--industry", choices=sorted(INDUSTRY_LABELS))
+    p.add_argument("--limit", type=int, default=50)
+    p = sub.add_parser("bizno", help="사업자번호 조회")
+    p.add_argument("biz_nos", nargs="+")
+    p.add_argument("--industry", choices=sorted(INDUSTRY_LABELS))
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        conn = connect(args.db)
+        written = refresh(conn, args.industry, force=args.force)
+        meta = [dict(row) for row in conn.execute("SELECT * FROM meta ORDER BY industry")]
+        json.dump({"written": written, "meta": meta}, sys.stdout, ensure_ascii=False, indent=2)
+    else:
+        conn = connect(args.db, readonly=True)
+        if args.command == "search":
+            result = search(conn, args.query, args.industry, args.limit)
+        else:
+            result = by_biz_no(conn, args.biz_nos, args.industry)
+        json.dump(result, sys.stdout, ensure_ascii=False, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox, font
 from contextlib import contextmanager
 
-import xlwings as xw
+from perf_trace import span
 
 import ctypes
 import sys
@@ -396,6 +396,8 @@ class SwapApp:
     # Excel selection helpers
     # ------------------------------------------------------------
     def get_current_selection(self):
+        import xlwings as xw
+
         app = xw.apps.active
         if not app:
             raise Exception("열려 있는 Excel 인스턴스를 찾을 수 없습니다.")
@@ -589,6 +591,8 @@ class SwapApp:
                     seen.add(offset)
                     unique_offsets.append(offset)
 
+            import xlwings as xw
+
             app = xw.apps.active
             if not app:
                 raise Exception("Excel을 찾을 수 없습니다.")
@@ -604,7 +608,7 @@ class SwapApp:
             if not pairs:
                 raise Exception("교환할 셀을 찾을 수 없습니다.")
 
-            with suspend_excel(app):
+            with span("swap", pairs=len(pairs)), suspend_excel(app):
                 snaps = []
                 for a, b in pairs:
                     snaps.append(
@@ -0,0 +1,124 @@
+import argparse
+import random
+import sys
+from pathlib import Path
+
+REGIONS = ["서울", "경기", "인천", "강원", "충북", "충남", "대전", "세종", "전북", "전남", "광주",
+           "경북", "경남", "대구", "울산", "부산", "제주"]
+
+ROW_LABELS = ["대표자", "사업자번호", "지역", "시평", "3년 실적", "5년 실적", "부채비율", "유동비율",
+              "영업기간", "신용평가", "여성기업", "중소기업", "일자리창출", "품질평가", "비고"]
+
+_PREFIXES = ["(주)", "㈜", "주식회사 ", "", "", ""]
+_SUFFIXES = ["", "", " 1,234", " 55.3%", "\n(대표 홍길동)"]
+_SYLLABLES = "가나다라마바사아자차카타파하한국대동서남북신성우진영광명현"
+_KINDS = ["전기", "통신", "소방", "이앤씨", "건설", "산업", "기술", "엔지니어링"]
+_SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+_GRADES = ["", "", "A0", "A-", "BBB+", "BBB0", "BB+", "BB-", "B+", "B0", "CCC"]
+_NOTES = ["", "", "{manager}", "담당 {manager} 010-{a}-{b}", "{manager} 과장 / 단독제외",
+          "여성기업 만료 2027.03.31 {manager}", "물어보고 사용", "({manager})"]
+
+
+def sample_names(count, seed=7):
+    rnd = random.Random(seed)
+    names = []
+    for _ in range(count):
+        stem = "".join(rnd.choice(_SYLLABLES) for _ in range(rnd.randint(2, 4)))
+        names.append(f"{rnd.choice(_PREFIXES)}{stem}{rnd.choice(_KINDS)}{rnd.choice(_SUFFIXES)}")
+    return names
+
+
+def _person(rnd):
+    return rnd.choice(_SURNAMES) + "".join(rnd.choice(_SYLLABLES) for _ in range(2))
+
+
+def _company_values(rnd, region):
+    manager = _person(rnd)
+    notes = rnd.choice(_NOTES).format(manager=manager, a=rnd.randint(1000, 9999), b=rnd.randint(1000, 9999))
+    return [
+        _person(rnd),
+        f"{rnd.randint(100, 999)}-{rnd.randint(10, 99)}-{rnd.randint(10000, 99999)}",
+        f"{region} {rnd.choice(['중구', '남구', '북구', '동구', '서구'])}",
+        rnd.randint(100_000_000, 50_000_000_000),
+        rnd.randint(0, 15_000_000_000),
+        rnd.randint(0, 25_000_000_000),
+        round(rnd.uniform(0.05, 4.0), 4),
+        round(rnd.uniform(0.3, 9.0), 4),
+        round(rnd.uniform(1, 35), 1),
+        rnd.choice(_GRADES),
+        rnd.choice(["", "", "", "O"]),
+        rnd.choice(["", "O"]),
+        "",
+        rnd.choice(["", "85", "88", "90"]),
+        notes or None,
+    ]
+
+
+def build_workbook(companies=3000, sheets=len(REGIONS), per_block=40, seed=7):
+    # Mirrors the 협력업체요약 layout _load_sheet_entries expects: a "회사명" label column with
+    # companies laid out to the right, the 15 offset rows below it, merged title/caption cells,
+    # and several header blocks stacked on each region sheet.
+    from openpyxl import Workbook
+    from openpyxl.utils import get_column_letter
+
+    rnd = random.Random(seed)
+    names = sample_names(companies, seed)
+    wb = Workbook()
+    wb.remove(wb.active)
+    regions = [REGIONS[i % len(REGIONS)] + ("" if i < len(REGIONS) else str(i // len(REGIONS) + 1))
+               for i in range(max(1, sheets))]
+    per_sheet = [companies // len(regions)] * len(regions)
+    for i in range(companies % len(regions)):
+        per_sheet[i] += 1
+
+    cursor = 0
+    block_height = len(ROW_LABELS) + 3
+    for region, count in zip(regions, per_sheet):
+        ws = wb.create_sheet(region)
+        width = min(per_block, max(count, 1)) + 1
+        ws.cell(1, 1, f"{region} 협력업체 요약")
+        ws.merge_cells(start_row=1, start_column=1, end_row=1, end_column=width)
+        header_row = 3
+        remaining = count
+        while remaining > 0:
+            in_block = min(per_block, remaining)
+            ws.cell(header_row - 1, 1, f"{region} ({in_block}개사)")
+            ws.merge_cells(start_row=header_row - 1, start_column=1, end_row=header_row - 1,
+                           end_column=in_block + 1)
+            ws.cell(header_row, 1, "회사명")
+            for offset, label in enumerate(ROW_LABELS, start=1):
+                ws.cell(header_row + offset, 1, label)
+            for col in range(2, in_block + 2):
+                ws.cell(header_row, col, names[cursor])
+                cursor += 1
+                for offset, value in enumerate(_company_values(rnd, region), start=1):
+                    if value is not None:
+                        ws.cell(header_row + offset, col, value)
+            remaining -= in_block
+            header_row += block_height
+        for col in range(1, width + 1):
+            ws.column_dimensions[get_column_letter(col)].width = 16
+    return wb
+
+
+def write_workbook(path, companies=3000, sheets=len(REGIONS), per_block=40, seed=7):
+    path = Path(path)
+    build_workbook(companies, sheets, per_block, seed).save(path)
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="합성 협력업체요약 워크북 생성")
+    parser.add_argument("output", help="저장할 .xlsx 경로")
+    parser.add_argument("--companies", type=int, default=3000)
+    parser.add_argument("--sheets", type=int, default=len(REGIONS))
+    parser.add_argument("--per-block", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args(argv)
+    path = write_workbook(args.output, args.companies, args.sheets, args.per_block, args.seed)
+    print(f"{path} ({args.companies}개사, {args.sheets}개 시트)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
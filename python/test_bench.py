@@ -0,0 +1,17 @@
+"""
+bench.py 의 각 항목을 bench_budgets.json 예산으로 돌려보는 스모크 테스트.
+
+    python -m pytest -q python
+"""
+
+import pytest
+
+import bench
+
+
+@pytest.mark.parametrize("case", list(bench._CASES))
+def test_case_within_budget(case):
+    if case == "startup":
+        # time-to-dialog 와 import ui_search 는 Qt 가 있어야 잴 수 있음
+        pytest.importorskip("PySide6")
+    assert bench.main([case, "--check"]) == 0
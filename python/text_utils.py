@@ -1,41 +1,68 @@
 import re
+from functools import lru_cache
 
+from notes_parser import parse_notes
 
-def normalize_name(name: str) -> str:
+_CORP_MARK_TABLE = str.maketrans({"㈜": None})
+_FIGURE_RE = re.compile(r"[0-9.,%]")
+_NON_DIGIT_RE = re.compile(r"\D")
+
+NORMALIZE_CACHE_SIZE = 4096
+
+
+def _strip_corp_marks(text: str) -> str:
+    return text.replace("(주)", "").translate(_CORP_MARK_TABLE).replace("주식회사", "")
+
+
+def _normalize(name) -> str:
     if not name:
         return ""
-    name = str(name).strip().split("\n")[0]
-    name = name.replace("(주)", "").replace("㈜", "").replace("주식회사", "")
-    name = re.sub(r"\s*[0-9.,%].*$", "", name)
-    return re.sub(r"\s+", " ", name).strip().lower()
+    text = _strip_corp_marks(str(name).strip().split("\n")[0])
+    # Everything from the first figure on (sipyung, ratios) is dropped; whitespace before it
+    # goes with the final split/join.
+    m = _FIGURE_RE.search(text)
+    if m:
+        text = text[: m.start()]
+    return " ".join(text.split()).lower()
+
+
+_normalize_cached = lru_cache(maxsize=NORMALIZE_CACHE_SIZE)(_normalize)
+
+
+def normalize_name(name: str) -> str:
+    if isinstance(name, str):
+        return _normalize_cached(name)
+    return _normalize(name)
+
+
+def normalize_names(names):
+    # Batch form for whole DB columns. It bypasses the memo: load-time names are mostly unique
+    # and would only evict query entries.
+    return [_normalize(name) for name in names]
+
+
+def normalize_biz_no(value) -> str:
+    # Digits only, so "123-81-99799 ", 1238199799 (numeric cell) and notice ids like
+    # "search:sobang:1238199799" all meet on the same key.
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return _NON_DIGIT_RE.sub("", str(value))
+
+
+def format_biz_no(digits: str) -> str:
+    if len(digits) == 10:
+        return f"{digits[:3]}-{digits[3:5]}-{digits[5:]}"
+    return digits
 
 
 def sanitize_company_name(name: str) -> str:
     if not name:
         return ""
     text = str(name).strip().split("\n")[0]
-    text = text.replace("(주)", "").replace("㈜", "").replace("주식회사", "")
-    return re.sub(r"\s+", " ", text).strip()
+    return " ".join(_strip_corp_marks(text).split())
 
 
 def extract_manager_name(notes: str):
-    if not notes:
-        return None
-    text = re.sub(r"\s+", " ", str(notes)).strip()
-    if not text:
-        return None
-    first_token = re.split(r"[ ,\/\|·\-]+", text)
-    first_token = next((t for t in first_token if t), "")
-    cleaned_first = re.sub(r"^[\[\(（【]([^\]\)）】]+)[\]\)】]?$", r"\1", first_token)
-    if re.match(r"^[가-힣]{2,4}$", cleaned_first):
-        return cleaned_first
-    m = re.search(r"담당자?\s*[:：-]?\s*([가-힣]{2,4})", text)
-    if m:
-        return m.group(1)
-    m = re.search(r"([가-힣]{2,4})\s*(과장|팀장|차장|대리|사원|부장|대표|실장|소장)", text)
-    if m:
-        return m.group(1)
-    m = re.search(r"\b(?!확인서|등록증|증명서|평가|서류)([가-힣]{2,4})\b\s*(?:,|\/|\(|\d|$)", text)
-    if m:
-        return m.group(1)
-    return None
+    return parse_notes(notes)["managerName"] or None
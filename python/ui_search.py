@@ -1,26 +1,38 @@
 import os
+import queue
+import threading
 from pathlib import Path
 
-import xlwings as xw
-import ctypes
 from PySide6 import QtWidgets, QtCore
 
-from config_store import BASE_DIR, load_config, save_config
-from db_loader import load_db_cached, load_db_stats
-from mois_under30 import apply_mois_under30
-from text_utils import normalize_name, sanitize_company_name
+import quick_picks
+import worker_client
+from autocomplete import completion_index, suggest_all
+from config_store import BASE_DIR, flush_config, load_config, save_config_later
+from db_loader import file_fingerprint, iter_load_db, load_db_stats, peek_cached, persist, remember
+from entry_store import EntryStore
+from perf_trace import span
+from query_filter import FilterError, filter_all, filter_indexes, looks_like_filter
+from search_core import ALL_INDUSTRIES_LABEL, INDUSTRY_CODES, INDUSTRY_LABELS, find_indexes, search_all
+from text_utils import format_biz_no, normalize_name, sanitize_company_name
 
 
 def write_to_active_cell(value):
-    book = xw.Book.caller()
-    rng = book.app.selection
-    rng.value = value
+    import xlwings as xw
+
+    with span("com.write", cell="selection"):
+        book = xw.Book.caller()
+        rng = book.app.selection
+        rng.value = value
 
 
 def write_to_cell(address, value):
-    book = xw.Book.caller()
-    sht = book.sheets.active
-    sht.range(address).value = value
+    import xlwings as xw
+
+    with span("com.write", cell=address):
+        book = xw.Book.caller()
+        sht = book.sheets.active
+        sht.range(address).value = value
 
 
 _DIALOG = None
@@ -38,13 +50,14 @@ def open_modal():
         return
 
     cfg = load_config()
+    quick_picks.load()
     db_paths = cfg.get("dbPaths") or {}
     legacy_path = cfg.get("dbPath", "")
     if legacy_path and (not db_paths or not any(db_paths.values())):
         db_paths = {"eung": legacy_path, "tongsin": legacy_path, "sobang": legacy_path}
         cfg["dbPaths"] = db_paths
         cfg["lastIndustry"] = cfg.get("lastIndustry", "eung")
-        save_config(cfg)
+        save_config_later(cfg)
 
     def resolve_db_path(file_type):
         raw = db_paths.get(file_type, "")
@@ -71,7 +84,7 @@ def open_modal():
             return Path("")
         db_paths[file_type] = os.path.relpath(picked, BASE_DIR)
         cfg["dbPaths"] = db_paths
-        save_config(cfg)
+        save_config_later(cfg)
         return Path(picked)
 
     file_type_initial = cfg.get("lastIndustry", "eung")
@@ -79,7 +92,17 @@ def open_modal():
     if not db_path:
         return
 
-    data = load_db_cached(db_path)
+    # Every industry DB loaded so far, for 전체 search and for applying a row from any of them.
+    # A workbook without a current snapshot starts as an empty store that a background thread
+    # fills sheet by sheet (see open_store), so the dialog is usable right away.
+    stores = {}
+    loads = {}
+    partial = set()
+    data = peek_cached(db_path, industry=file_type_initial)
+    initial_pending = data is None
+    if data is None:
+        data = EntryStore(path=str(db_path), fingerprint=file_fingerprint(db_path))
+    stores[file_type_initial] = data
 
     dialog = QtWidgets.QDialog()
     dialog.setWindowTitle("업체 검색")
@@ -144,19 +167,148 @@ def open_modal():
     title_label.setObjectName("titleLabel")
     status_label = QtWidgets.QLabel(f"공종 DB: {db_path} (로드 {len(data)}건)")
     status_label.setObjectName("statusLabel")
+    cancel_load_btn = QtWidgets.QPushButton("불러오기 취소")
+    cancel_load_btn.setObjectName("ghostBtn")
+    cancel_load_btn.setVisible(False)
     cell_label = QtWidgets.QLabel("셀: -")
     cell_label.setObjectName("cellLabel")
     header.addWidget(title_label)
     header.addStretch(1)
     header.addWidget(cell_label)
     layout.addLayout(header)
-    layout.addWidget(status_label)
+    status_row = QtWidgets.QHBoxLayout()
+    status_row.addWidget(status_label)
+    status_row.addStretch(1)
+    status_row.addWidget(cancel_load_btn)
+    layout.addLayout(status_row)
 
     form = QtWidgets.QHBoxLayout()
     form.setSpacing(8)
     industry_box = QtWidgets.QComboBox()
-    industry_box.addItems(["전기", "통신", "소방"])
+    industry_box.addItems(["전기", "통신", "소방", ALL_INDUSTRIES_LABEL])
     industry_box.setCurrentIndex({"eung": 0, "tongsin": 1, "sobang": 2}.get(file_type_initial, 0))
+
+    def current_file_type():
+        # None while 전체 is selected
+        return INDUSTRY_CODES.get(industry_box.currentText())
+
+    def start_load(file_type, path, store):
+        job = {
+            "path": path,
+            "store": store,
+            "queue": queue.Queue(),
+            "cancel": threading.Event(),
+            "mtime": path.stat().st_mtime if path.exists() else None,
+            "sheets": (0, 0),
+        }
+
+        def run():
+            # The UI thread fills `store`; this thread keeps its own copy so the snapshot, company
+            # master and SQLite writes happen here and the UI only swaps in the cached copy.
+            try:
+                copy = EntryStore(path=store.path, fingerprint=store.fingerprint)
+                for item in iter_load_db(path, job["cancel"]):
+                    copy.extend(item[1])
+                    job["queue"].put(("sheet",) + item)
+                if job["cancel"].is_set():
+                    job["queue"].put(("cancelled",))
+                    return
+                job["queue"].put(("done", persist(path, copy, industry=file_type)))
+            except Exception as exc:
+                job["queue"].put(("error", exc))
+
+        loads[file_type] = job
+        partial.discard(file_type)
+        threading.Thread(target=run, daemon=True).start()
+        cancel_load_btn.setVisible(True)
+        load_timer.start()
+
+    def stop_load(file_type):
+        job = loads.pop(file_type, None)
+        if job is not None:
+            job["cancel"].set()
+        return job
+
+    def open_store(file_type, path, force=False):
+        # -> the store for file_type: the cached copy, or one that is still filling in.
+        job = loads.get(file_type)
+        if job is not None and job["path"] == path and not force:
+            return job["store"]
+        stop_load(file_type)
+        store = None if force else peek_cached(path, industry=file_type)
+        if store is None:
+            store = EntryStore(path=str(path), fingerprint=file_fingerprint(path))
+            start_load(file_type, path, store)
+        else:
+            partial.discard(file_type)
+            completion_index(store)
+        stores[file_type] = store
+        return store
+
+    def drain_loads():
+        grew = False
+        for file_type, job in list(loads.items()):
+            while loads.get(file_type) is job:
+                try:
+                    item = job["queue"].get_nowait()
+                except queue.Empty:
+                    break
+                if item[0] == "sheet":
+                    _, _, entries, number, total = item
+                    job["store"].extend(entries)
+                    job["sheets"] = (number, total)
+                    grew = grew or bool(entries)
+                    continue
+                loads.pop(file_type, None)
+                if item[0] == "done":
+                    remember(job["path"], job["store"], industry=file_type, snapshot=False, mtime=job["mtime"],
+                             registered=item[1])
+                    completion_index(job["store"])
+                elif item[0] == "error":
+                    partial.add(file_type)
+                    QtWidgets.QMessageBox.warning(
+                        dialog, "DB 로드", f"{INDUSTRY_LABELS[file_type]} DB를 읽지 못했습니다:\n{item[1]}"
+                    )
+                else:
+                    partial.add(file_type)
+        if not loads:
+            load_timer.stop()
+            cancel_load_btn.setVisible(False)
+        status_label.setText(status_text())
+        # Re-run the current query on the grown data unless the user already picked a row or
+        # the results came from the worker, which already covers the whole DB.
+        if grew and not search_source["remote"] and resolve_checked_row() < 0:
+            refresh_results()
+
+    def cancel_loads():
+        for file_type in list(loads):
+            stop_load(file_type)
+            partial.add(file_type)
+        load_timer.stop()
+        cancel_load_btn.setVisible(False)
+        status_label.setText(status_text())
+
+    def load_all_industries():
+        for file_type in INDUSTRY_LABELS:
+            p = resolve_db_path(file_type)
+            if p.is_file():
+                open_store(file_type, p)
+        return stores
+
+    def load_state(file_type):
+        job = loads.get(file_type)
+        if job is not None:
+            number, total = job["sheets"]
+            return f", 불러오는 중 {number}/{total or '?'} 시트"
+        if file_type in partial:
+            return ", 일부만 로드됨"
+        return ""
+
+    def status_text():
+        if current_file_type() is None:
+            loaded = ", ".join(f"{INDUSTRY_LABELS[ft]} {len(d)}건{load_state(ft)}" for ft, d in stores.items())
+            return f"공종 DB: 전체 ({loaded})"
+        return f"공종 DB: {db_path} (로드 {len(data)}건{load_state(current_file_type())})"
     form.addWidget(QtWidgets.QLabel("공종"))
     form.addWidget(industry_box)
 
@@ -164,6 +316,15 @@ def open_modal():
     form.addWidget(QtWidgets.QLabel("업체명"))
     form.addWidget(query_input)
 
+    # Attached with setWidget rather than setCompleter so picking a suggestion does not paste the
+    # display text into the search box; on_suggestion_picked handles it instead.
+    suggestion_model = QtCore.QStringListModel(dialog)
+    completer = QtWidgets.QCompleter(suggestion_model, dialog)
+    completer.setCompletionMode(QtWidgets.QCompleter.UnfilteredPopupCompletion)
+    completer.setMaxVisibleItems(10)
+    completer.setWidget(query_input)
+    suggestions = []
+
     search_btn = QtWidgets.QPushButton("검색")
     form.addWidget(search_btn)
 
@@ -252,26 +413,132 @@ def open_modal():
         layout.addWidget(cb)
         table.setCellWidget(row, 0, wrapper)
 
+    results = []
+
+    def remote_search(file_type, path, q):
+        # While this dialog is still parsing a workbook that the worker (worker.py) already
+        # holds warm, ask the worker instead. None when it is not running or lacks that DB, so
+        # the caller falls back to the partial in-process store.
+        try:
+            info = worker_client.ping(timeout=0.3)
+            target = Path(path).resolve()
+            loaded = next((p for p in (info or {}).get("loaded", []) if Path(p).resolve() == target), None)
+            if loaded is None:
+                return None
+            records = worker_client.call(
+                "score", {"industry": file_type, "db": loaded, "query": q, "agency": "mois", "amount": 0},
+                timeout=5.0, autostart=False,
+            )
+        except (OSError, ValueError, worker_client.WorkerError):
+            return None
+        return [(file_type, record) for record in records]
+
+    search_source = {"remote": False}
+
     def do_search():
-        q = normalize_name(query_input.text())
-        table.setRowCount(0)
+        text = query_input.text()
+        q = normalize_name(text)
         if not q:
+            show_quick_picks()
+            return
+        file_type = current_file_type()
+        search_source["remote"] = False
+        if looks_like_filter(text):
+            try:
+                with span("filter", entries=sum(len(d) for d in stores.values())) as counts:
+                    if file_type is None:
+                        found = filter_all(stores, text)
+                    else:
+                        found = [(file_type, row) for row in data.rows(filter_indexes(data, text))]
+                    counts["hits"] = len(found)
+            except FilterError as exc:
+                fill_table([])
+                status_label.setText(f"검색 조건 오류: {exc}")
+                return
+            status_label.setText(f"{status_text()} · 조건 검색 {len(found)}건")
+        elif file_type is None:
+            with span("search", entries=sum(len(d) for d in stores.values()), industries=len(stores)) as counts:
+                found = search_all(stores, q)
+                counts["hits"] = len(found)
+        else:
+            found = remote_search(file_type, db_path, q) if file_type in loads else None
+            search_source["remote"] = found is not None
+            if found is None:
+                with span("search", entries=len(data)) as counts:
+                    hits = find_indexes(data, q)
+                    counts["hits"] = len(hits)
+                found = [(file_type, row) for row in data.rows(hits)]
+        fill_table(quick_picks.boost(found))
+
+    def show_quick_picks():
+        # Most-picked entries for an empty box, or for a one-letter query while typing; an explicit
+        # search (Enter / 검색) still runs the full name search.
+        q = normalize_name(query_input.text())
+        file_type = current_file_type()
+        picks = quick_picks.quick_picks(stores if file_type is None else {file_type: data}, q)
+        fill_table(picks)
+        if picks:
+            status_label.setText(f"{status_text()} · 자주 선택 {len(picks)}건")
+
+    def on_query_edited(text):
+        if len(normalize_name(text)) < quick_picks.SHORT_QUERY_LENGTH and not looks_like_filter(text):
+            show_quick_picks()
+
+    def refresh_results():
+        # Re-run after the data changed, keeping whichever view the box shows: quick picks while
+        # a short query is being typed, the search results otherwise.
+        text = query_input.text()
+        if len(normalize_name(text)) < quick_picks.SHORT_QUERY_LENGTH and not looks_like_filter(text):
+            show_quick_picks()
+        else:
+            do_search()
+
+    def update_suggestions(text):
+        suggestions.clear()
+        q = normalize_name(text)
+        file_type = current_file_type()
+        if len(q) >= quick_picks.SHORT_QUERY_LENGTH and not looks_like_filter(text):
+            suggestions.extend(suggest_all(stores if file_type is None else {file_type: data}, q))
+        labels = []
+        for row_industry, row in suggestions:
+            label = f"{row['name']} · {row['region']} · 시평 {format_amount(row.get('sipyung'))}"
+            labels.append(f"[{INDUSTRY_LABELS[row_industry]}] {label}" if file_type is None else label)
+        suggestion_model.setStringList(labels)
+        if suggestions:
+            completer.complete()
+        else:
+            completer.popup().hide()
+
+    def on_suggestion_picked(index):
+        # Keyboard pick: show just that company, checked, with 선택 focused so Enter applies it.
+        if not 0 <= index.row() < len(suggestions):
             return
-        current_industry = industry_box.currentText()
-        for row in data:
-            if q in row["norm"]:
-                r = table.rowCount()
-                table.insertRow(r)
-                create_checkbox_cell(r)
-                table.setItem(r, 1, QtWidgets.QTableWidgetItem(current_industry))
-                table.setItem(r, 2, QtWidgets.QTableWidgetItem(row["name"]))
-                table.setItem(r, 3, QtWidgets.QTableWidgetItem(row.get("managerName", "")))
-                table.setItem(r, 4, QtWidgets.QTableWidgetItem(row["region"]))
-                table.setItem(r, 5, QtWidgets.QTableWidgetItem(row.get("bizNo", "")))
-                perf_val = row.get("perf5y")
-                sipyung_val = row.get("sipyung")
-                table.setItem(r, 6, QtWidgets.QTableWidgetItem(format_amount(perf_val)))
-                table.setItem(r, 7, QtWidgets.QTableWidgetItem(format_amount(sipyung_val)))
+        file_type, row = suggestions[index.row()]
+        query_input.blockSignals(True)
+        query_input.setText(row["name"])
+        query_input.blockSignals(False)
+        fill_table([(file_type, row)])
+        set_checkbox(0, True)
+        status_label.setText(f"{status_text()} · 자동완성 선택")
+        apply_btn.setFocus()
+
+    def fill_table(found):
+        table.setRowCount(0)
+        results.clear()
+        for row_industry, row in found:
+            r = table.rowCount()
+            results.append((row_industry, row))
+            table.insertRow(r)
+            create_checkbox_cell(r)
+            table.setItem(r, 1, QtWidgets.QTableWidgetItem(INDUSTRY_LABELS[row_industry]))
+            table.setItem(r, 2, QtWidgets.QTableWidgetItem(row["name"]))
+            table.setItem(r, 3, QtWidgets.QTableWidgetItem(row.get("managerName", "")))
+            table.setItem(r, 4, QtWidgets.QTableWidgetItem(row["region"]))
+            table.setItem(r, 5, QtWidgets.QTableWidgetItem(format_biz_no(row.get("bizNo", ""))))
+            perf_val = row.get("perf5y")
+            sipyung_val = row.get("sipyung")
+            table.setItem(r, 6, QtWidgets.QTableWidgetItem(format_amount(perf_val)))
+            table.setItem(r, 7, QtWidgets.QTableWidgetItem(format_amount(sipyung_val)))
 
     def resolve_checked_row():
         for r in range(table.rowCount()):
@@ -284,6 +551,8 @@ def open_modal():
 
     def get_active_address():
         try:
+            import xlwings as xw
+
             book = xw.Book.caller()
             rng = book.app.selection
             return rng.address.replace("$", "")
@@ -291,15 +560,18 @@ def open_modal():
             return ""
 
     def apply_selected():
+        with span("apply"):
+            _apply_selected()
+
+    def _apply_selected():
         selected = resolve_checked_row()
         if selected < 0:
             QtWidgets.QMessageBox.information(dialog, "선택", "선택 체크박스를 먼저 체크하세요.")
             return
-        name_val = table.item(selected, 2).text()
-        region_val = table.item(selected, 4).text()
-        row_data = next((r for r in data if r["name"] == name_val and r["region"] == region_val), None)
-        if not row_data:
+        if selected >= len(results):
             return
+        file_type, row_data = results[selected]
+        name_val = row_data["name"]
         clean_name = sanitize_company_name(name_val) or name_val
         manager_name = row_data.get("managerName", "")
         display_name = f"{clean_name}\n{manager_name}".strip() if manager_name else clean_name
@@ -309,17 +581,19 @@ def open_modal():
         else:
             write_to_active_cell(display_name)
 
-        file_type = {
-            "전기": "eung",
-            "통신": "tongsin",
-            "소방": "sobang",
-        }[industry_box.currentText()]
-        apply_mois_under30(row_data, file_type, target_address=target_address or None)
+        from mois_under30 import apply_mois_under30
+
+        apply_mois_under30(row_data, file_type, target_address=target_address or None, data=stores.get(file_type))
         last_target_address["value"] = target_address or last_target_address["value"]
+        quick_picks.record(file_type, row_data)
         focus_excel()
 
     def focus_excel():
         try:
+            import ctypes
+
+            import xlwings as xw
+
             app = xw.apps.active if xw.apps.count > 0 else xw.Book.caller().app
             hwnd = app.api.Hwnd
             ctypes.windll.user32.ShowWindow(hwnd, 5)
@@ -330,24 +604,27 @@ def open_modal():
 
     def set_db_path():
         nonlocal data, db_path, db_paths
+        file_type = current_file_type()
+        if file_type is None:
+            QtWidgets.QMessageBox.information(dialog, "DB 경로", "경로를 설정할 공종을 먼저 선택하세요.")
+            return
         path, _ = QtWidgets.QFileDialog.getOpenFileName(dialog, "업체 DB 선택", str(BASE_DIR), "Excel Files (*.xlsx)")
         if not path:
             return
-        file_type = {
-            "전기": "eung",
-            "통신": "tongsin",
-            "소방": "sobang",
-        }[industry_box.currentText()]
         db_paths[file_type] = os.path.relpath(path, BASE_DIR)
         cfg["dbPaths"] = db_paths
         cfg["lastIndustry"] = file_type
-        save_config(cfg)
+        save_config_later(cfg)
         db_path = Path(path)
-        data = load_db_cached(db_path, force=True)
-        status_label.setText(f"공종 DB: {db_path} (로드 {len(data)}건)")
-        QtWidgets.QMessageBox.information(dialog, "DB 경로", f"설정됨:\n{db_path}\n로드 {len(data)}건")
+        data = open_store(file_type, db_path, force=True)
+        status_label.setText(status_text())
+        QtWidgets.QMessageBox.information(dialog, "DB 경로", f"설정됨:\n{db_path}")
 
     def verify_db_path():
+        if current_file_type() is None:
+            lines = [f"{INDUSTRY_LABELS[ft]}: {resolve_db_path(ft)} (로드 {len(d)}건)" for ft, d in stores.items()]
+            QtWidgets.QMessageBox.information(dialog, "DB 경로 확인", "\n".join(lines))
+            return
         exists = db_path.exists()
         mtime = db_path.stat().st_mtime if exists else None
         msg = f"공종: {industry_box.currentText()}\n경로: {db_path}\n존재: {'예' if exists else '아니오'}\n로드 {len(data)}건"
@@ -357,12 +634,19 @@ def open_modal():
 
     def reload_db():
         nonlocal data
+        # Reloads run in the background like the first load; progress shows in the status line.
+        if current_file_type() is None:
+            for file_type in list(stores):
+                open_store(file_type, resolve_db_path(file_type), force=True)
+            status_label.setText(status_text())
+            refresh_results()
+            return
         if not db_path.exists():
             QtWidgets.QMessageBox.warning(dialog, "DB 재로드", "DB 파일 경로가 유효하지 않습니다.")
             return
-        data = load_db_cached(db_path, force=True)
-        status_label.setText(f"공종 DB: {db_path} (로드 {len(data)}건)")
-        QtWidgets.QMessageBox.information(dialog, "DB 재로드", f"재로드 완료\n로드 {len(data)}건")
+        data = open_store(current_file_type(), db_path, force=True)
+        status_label.setText(status_text())
+        refresh_results()
 
     def run_db_diagnosis():
         if not db_path.exists():
@@ -385,13 +669,21 @@ def open_modal():
         QtWidgets.QMessageBox.information(dialog, "DB 진단", msg)
 
     def auto_reload_if_changed():
-        nonlocal data, db_path
-        if not db_path.exists():
-            return
-        latest = load_db_cached(db_path)
-        if latest is not data:
-            data = latest
-            status_label.setText(f"공종 DB: {db_path} (로드 {len(data)}건)")
+        nonlocal data
+        changed = False
+        for file_type in list(stores):
+            p = resolve_db_path(file_type)
+            # Loads in flight, and ones the user cancelled, are left alone.
+            if not p.is_file() or file_type in loads or file_type in partial:
+                continue
+            previous = stores[file_type]
+            if open_store(file_type, p) is not previous:
+                changed = True
+        current = current_file_type()
+        if current is not None and stores.get(current) is not None and stores[current] is not data:
+            data = stores[current]
+        if changed:
+            status_label.setText(status_text())
 
     def update_active_cell_label():
         try:
@@ -403,19 +695,20 @@ def open_modal():
 
     def on_industry_change():
         nonlocal data, db_path
-        file_type = {
-            "전기": "eung",
-            "통신": "tongsin",
-            "소방": "sobang",
-        }[industry_box.currentText()]
+        file_type = current_file_type()
+        if file_type is None:
+            load_all_industries()
+            status_label.setText(status_text())
+            refresh_results()
+            return
         cfg["lastIndustry"] = file_type
-        save_config(cfg)
+        save_config_later(cfg)
         next_path = ensure_db_path(file_type)
         if not next_path:
             return
         db_path = next_path
-        data = load_db_cached(db_path, force=True)
-        status_label.setText(f"공종 DB: {db_path} (로드 {len(data)}건)")
+        data = open_store(file_type, db_path)
+        status_label.setText(status_text())
 
     def toggle_check_at(row):
         cb = get_checkbox(row)
@@ -426,6 +719,9 @@ def open_modal():
     search_btn.clicked.connect(do_search)
     focus_btn.clicked.connect(focus_excel)
     query_input.returnPressed.connect(do_search)
+    query_input.textChanged.connect(on_query_edited)
+    query_input.textEdited.connect(update_suggestions)
+    completer.activated[QtCore.QModelIndex].connect(on_suggestion_picked)
     config_btn.clicked.connect(set_db_path)
     verify_btn.clicked.connect(verify_db_path)
     reload_btn.clicked.connect(reload_db)
@@ -452,11 +748,20 @@ def open_modal():
     timer.timeout.connect(auto_reload_if_changed)
     timer.start()
 
+    load_timer = QtCore.QTimer(dialog)
+    load_timer.setInterval(50)
+    load_timer.timeout.connect(drain_loads)
+    cancel_load_btn.clicked.connect(cancel_loads)
+    if initial_pending:
+        start_load(file_type_initial, db_path, data)
+
     cell_timer = QtCore.QTimer(dialog)
     cell_timer.setInterval(300)
     cell_timer.timeout.connect(update_active_cell_label)
     cell_timer.start()
 
+    show_quick_picks()
+    dialog.finished.connect(lambda _: cancel_loads())
     dialog.finished.connect(lambda _: _clear_dialog())
     dialog.show()
     if not _APP_EXEC_STARTED:
@@ -468,3 +773,4 @@ def open_modal():
 def _clear_dialog():
     global _DIALOG
     _DIALOG = None
+    flush_config()
@@ -0,0 +1,343 @@
+import argparse
+import json
+import os
+import secrets
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+
+from worker_client import STATE_PATH
+
+# Clients: db_cli --worker, and the search dialog (ui_search) while its own copy of a
+# workbook is still loading. swap_app never reads the DB.
+DEFAULT_IDLE_SECONDS = 900
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+_METHODS = {}
+_STATE = {"started": time.time(), "last": time.monotonic(), "token": "", "server": None}
+_LOAD_LOCK = threading.Lock()
+
+
+class RpcError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+def method(name):
+    def register(fn):
+        _METHODS[name] = fn
+        return fn
+
+    return register
+
+
+def _data(params):
+    from config_store import resolve_db_path
+    from db_loader import load_db_cached
+
+    industry = params.get("industry") or "eung"
+    db_path = Path(params["db"]) if params.get("db") else resolve_db_path(industry)
+    if not db_path or not db_path.exists():
+        raise RpcError(INVALID_PARAMS, f"DB 파일을 찾을 수 없습니다: {db_path}")
+    # Snapshot reads and reparses are not thread-safe against each other; lookups after that are.
+    with _LOAD_LOCK:
+        master_industry = None if params.get("db") else industry
+        return industry, load_db_cached(db_path, force=bool(params.get("reload")), industry=master_industry)
+
+
+@method("ping")
+def rpc_ping(params):
+    from db_loader import cached_paths
+
+    return {
+        "pid": os.getpid(),
+        "uptime": round(time.time() - _STATE["started"], 1),
+        "loaded": cached_paths(),
+    }
+
+
+def _matching_rows(data, params):
+    # Same query handling as db_cli and the search dialog: filter syntax when the query has
+    # conditions, a plain name search otherwise.
+    from query_filter import FilterError, filter_indexes, looks_like_filter
+    from search_core import search
+
+    query, limit = params.get("query", ""), params.get("limit")
+    if not looks_like_filter(query):
+        return search(data, query, limit)
+    try:
+        hits = filter_indexes(data, query)
+    except FilterError as exc:
+        raise RpcError(INVALID_PARAMS, f"검색 조건 오류: {exc}")
+    return data.rows(hits if limit is None else hits[:limit])
+
+
+@method("search")
+def rpc_search(params):
+    from search_core import row_record
+
+    industry, data = _data(params)
+    return [row_record(row, industry) for row in _matching_rows(data, params)]
+
+
+@method("score")
+def rpc_score(params):
+    from config_store import get_industry_averages
+    from scoring import lookup_management
+    from search_core import row_record
+
+    industry, data = _data(params)
+    agency = params.get("agency") or "mois"
+    amount = float(params.get("amount") or 0)
+    notice_date = params.get("noticeDate")
+    averages = get_industry_averages()
+    records = []
+    for row in _matching_rows(data, params):
+        mgmt = lookup_management(data, row, agency, amount, industry, averages, notice_date)
+        records.append(row_record(row, industry, {"management": mgmt}))
+    return records
+
+
+@method("resolve")
+def rpc_resolve(params):
+    # names: each company name maps to one entry (exact normalized match first, then the
+    # first partial match, else null). bizNos: bulk lookup with duplicate numbers reported
+    # under "conflicts" instead of being shadowed.
+    from search_core import find_indexes, resolve_biz_nos, row_record
+    from text_utils import normalize_name
+
+    industry, data = _data(params)
+    if params.get("bizNos") is not None:
+        resolved = resolve_biz_nos(data, params["bizNos"])
+        return {
+            "found": {k: row_record(row, industry) for k, row in resolved["found"].items()},
+            "conflicts": {k: [row_record(row, industry) for row in rows] for k, rows in resolved["conflicts"].items()},
+            "missing": resolved["missing"],
+        }
+    norms = data.column("norm")
+    resolved = {}
+    for name in params.get("names") or []:
+        q = normalize_name(name)
+        hits = find_indexes(data, name)
+        exact = [i for i in hits if norms[i] == q]
+        pick = (exact or hits or [None])[0]
+        resolved[name] = None if pick is None else row_record(data[pick], industry)
+    return resolved
+
+
+@method("recommend")
+def rpc_recommend(params):
+    # params: notice fields (ownerId, rangeId, estimatedAmount, baseAmount, dutyRegions, fileType)
+    # plus optional "k"; the industry DB follows the notice's fileType.
+    from recommend import DEFAULT_TOP_K, normalize_notice, recommend
+
+    notice = normalize_notice(params.get("notice") or {})
+    if not notice["fileType"]:
+        raise RpcError(INVALID_PARAMS, "공고의 공종(fileType)이 없습니다")
+    _, data = _data(dict(params, industry=notice["fileType"]))
+    try:
+        return recommend(notice, data, int(params.get("k") or DEFAULT_TOP_K))
+    except ValueError as exc:
+        raise RpcError(INVALID_PARAMS, str(exc))
+
+
+@method("consortium")
+def rpc_consortium(params):
+    # params: notice fields as for "recommend" plus entryAmount/entryMode/regionDutyRate/groupSize,
+    # and optional alternatives, minShare, minMembers, budget.
+    from consortium import DEFAULT_ALTERNATIVES, DEFAULT_MIN_SHARE, DEFAULT_NODE_BUDGET, optimize
+    from recommend import normalize_notice
+
+    notice = normalize_notice(params.get("notice") or {})
+    if not notice["fileType"]:
+        raise RpcError(INVALID_PARAMS, "공고의 공종(fileType)이 없습니다")
+    _, data = _data(dict(params, industry=notice["fileType"]))
+    try:
+        return optimize(
+            notice,
+            data,
+            alternatives=int(params.get("alternatives") or DEFAULT_ALTERNATIVES),
+            min_share=float(params.get("minShare") or DEFAULT_MIN_SHARE),
+            node_budget=int(params.get("budget") or DEFAULT_NODE_BUDGET),
+            min_members=int(params.get("minMembers") or 1),
+        )
+    except ValueError as exc:
+        raise RpcError(INVALID_PARAMS, str(exc))
+
+
+@method("company")
+def rpc_company(params):
+    # Cross-industry view of each bizNo: {bizNo: {industry: slot}}; loads every configured
+    # industry DB first so the master is complete.
+    from company_master import build_master
+    from text_utils import normalize_biz_no
+
+    with _LOAD_LOCK:
+        master = build_master()
+    return {normalize_biz_no(b): master.lookup(b) for b in params.get("bizNos") or []}
+
+
+@method("shutdown")
+def rpc_shutdown(params):
+    server = _STATE["server"]
+    if server is not None:
+        threading.Thread(target=server.shutdown, daemon=True).start()
+    return True
+
+
+def handle_request(request, require_token=False):
+    req_id = request.get("id") if isinstance(request, dict) else None
+    try:
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            raise RpcError(INVALID_REQUEST, "잘못된 요청")
+        if require_token and request.get("auth") != _STATE["token"]:
+            raise RpcError(INVALID_REQUEST, "인증 실패")
+        fn = _METHODS.get(request["method"])
+        if fn is None:
+            raise RpcError(METHOD_NOT_FOUND, f"알 수 없는 메서드: {request['method']}")
+        params = request.get("params") or {}
+        if not isinstance(params, dict):
+            raise RpcError(INVALID_PARAMS, "params 는 객체여야 합니다")
+        result = fn(params)
+        return {"jsonrpc": "2.0", "id": req_id, "result": result}
+    except RpcError as exc:
+        return {"jsonrpc": "2.0", "id": req_id, "error": {"code": exc.code, "message": str(exc)}}
+    except Exception as exc:
+        return {"jsonrpc": "2.0", "id": req_id, "error": {"code": SERVER_ERROR, "message": f"{type(exc).__name__}: {exc}"}}
+    finally:
+        _STATE["last"] = time.monotonic()
+
+
+def _handle_line(line, require_token):
+    try:
+        request = json.loads(line)
+    except ValueError:
+        request = None
+        response = {"jsonrpc": "2.0", "id": None, "error": {"code": PARSE_ERROR, "message": "JSON 파싱 실패"}}
+    else:
+        response = handle_request(request, require_token)
+    method_name = request.get("method") if isinstance(request, dict) else None
+    return json.dumps(response, ensure_ascii=False) + "\n", method_name
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for raw in self.rfile:
+            line = raw.decode("utf-8").strip()
+            if not line:
+                continue
+            text, _ = _handle_line(line, require_token=True)
+            self.wfile.write(text.encode("utf-8"))
+            self.wfile.flush()
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def read_state():
+    try:
+        return json.loads(STATE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_state(port):
+    state = {"pid": os.getpid(), "port": port, "token": _STATE["token"]}
+    tmp = STATE_PATH.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state), encoding="utf-8")
+    os.replace(tmp, STATE_PATH)
+
+
+def _clear_state():
+    state = read_state()
+    if state and state.get("pid") == os.getpid():
+        try:
+            STATE_PATH.unlink()
+        except OSError:
+            pass
+
+
+def _watch_idle(server, idle_seconds):
+    while True:
+        time.sleep(min(5.0, idle_seconds))
+        if time.monotonic() - _STATE["last"] >= idle_seconds:
+            server.shutdown()
+            return
+
+
+def _warm():
+    # Config and formulas are cheap but every request touches them; load them before the
+    # first caller waits.
+    try:
+        from config_store import load_config
+        from formulas_store import load_formulas
+
+        load_config()
+        load_formulas()
+    except Exception:
+        pass
+
+
+def serve(port=0, idle_seconds=DEFAULT_IDLE_SECONDS):
+    _STATE["token"] = secrets.token_hex(16)
+    server = _Server(("127.0.0.1", port), _Handler)
+    _STATE["server"] = server
+    _warm()
+    _write_state(server.server_address[1])
+    _STATE["last"] = time.monotonic()
+    if idle_seconds > 0:
+        threading.Thread(target=_watch_idle, args=(server, idle_seconds), daemon=True).start()
+    try:
+        server.serve_forever(poll_interval=0.5)
+    finally:
+        server.server_close()
+        _clear_state()
+
+
+def serve_stdio(stdin=None, stdout=None):
+    # One request per line on stdin, one response per line on stdout, for a parent process
+    # (e.g. Electron's child_process) that owns the worker's lifetime.
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    _warm()
+    for line in stdin:
+        line = line.strip()
+        if not line:
+            continue
+        text, method_name = _handle_line(line, require_token=False)
+        stdout.write(text)
+        stdout.flush()
+        if method_name == "shutdown":
+            break
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="업체 DB 상주 워커 (JSON-RPC)")
+    parser.add_argument("--stdio", action="store_true", help="소켓 대신 표준입출력으로 응답")
+    parser.add_argument("--port", type=int, default=0, help="127.0.0.1 포트 (0 = 자동)")
+    parser.add_argument("--idle", type=float, default=DEFAULT_IDLE_SECONDS, help="유휴 종료 시간(초), 0 = 무제한")
+    args = parser.parse_args(argv)
+    if args.stdio:
+        serve_stdio()
+        return 0
+    from worker_client import ping
+
+    # A second launcher racing the first just leaves the running worker alone.
+    if ping() is not None:
+        return 0
+    serve(args.port, args.idle)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
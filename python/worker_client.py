@@ -0,0 +1,123 @@
+import itertools
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent
+WORKER_PATH = BASE_DIR / "worker.py"
+STATE_PATH = BASE_DIR / ".worker.json"
+START_TIMEOUT = 15.0
+
+_IDS = itertools.count(1)
+
+
+class WorkerError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+def _read_state():
+    try:
+        return json.loads(STATE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _send(state, method, params, timeout):
+    request = {"jsonrpc": "2.0", "id": next(_IDS), "method": method, "params": params,
+               "auth": state.get("token")}
+    with socket.create_connection(("127.0.0.1", int(state["port"])), timeout=timeout) as sock:
+        sock.sendall((json.dumps(request, ensure_ascii=False) + "\n").encode("utf-8"))
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError("worker closed the connection")
+    response = json.loads(line.decode("utf-8"))
+    error = response.get("error")
+    if error:
+        raise WorkerError(error.get("code"), error.get("message"))
+    return response.get("result")
+
+
+def _python_for_worker():
+    # Under Excel/xlwings a console python would flash a window; pythonw has none.
+    exe = Path(sys.executable)
+    if os.name == "nt":
+        candidate = exe.with_name("pythonw.exe")
+        if candidate.exists():
+            return str(candidate)
+    return str(exe)
+
+
+def start_worker(idle_seconds=None):
+    cmd = [_python_for_worker(), str(WORKER_PATH)]
+    if idle_seconds is not None:
+        cmd += ["--idle", str(idle_seconds)]
+    kwargs = {
+        "cwd": str(BASE_DIR),
+        "stdin": subprocess.DEVNULL,
+        "stdout": subprocess.DEVNULL,
+        "stderr": subprocess.DEVNULL,
+        "close_fds": True,
+    }
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.CREATE_NO_WINDOW | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+    return subprocess.Popen(cmd, **kwargs)
+
+
+def ping(timeout=1.0):
+    state = _read_state()
+    if not state:
+        return None
+    try:
+        return _send(state, "ping", {}, timeout)
+    except (OSError, ValueError, WorkerError):
+        return None
+
+
+def ensure_worker(timeout=START_TIMEOUT):
+    state = _read_state()
+    if state and ping() is not None:
+        return state
+    proc = start_worker()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc.poll() is not None and ping() is None:
+            raise WorkerError(None, f"worker exited with code {proc.returncode}")
+        if ping() is not None:
+            return _read_state()
+        time.sleep(0.1)
+    raise WorkerError(None, "worker did not start in time")
+
+
+def call(method, params=None, timeout=60.0, autostart=True):
+    # Starts the worker on first use; a stale state file (worker gone) gets one restart.
+    state = _read_state()
+    if state:
+        try:
+            return _send(state, method, params or {}, timeout)
+        except (ConnectionError, socket.timeout, OSError) as exc:
+            if not autostart or isinstance(exc, socket.timeout):
+                raise
+    elif not autostart:
+        raise WorkerError(None, "worker is not running")
+    state = ensure_worker()
+    return _send(state, method, params or {}, timeout)
+
+
+def stop():
+    state = _read_state()
+    if not state:
+        return False
+    try:
+        _send(state, "shutdown", {}, 2.0)
+    except (OSError, ValueError, WorkerError):
+        return False
+    return True
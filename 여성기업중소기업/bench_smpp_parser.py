@@ -0,0 +1,58 @@
+"""
+저장된 SMPP 페이지로 파서 속도 비교 (빠른 경로 vs BeautifulSoup).
+
+    python bench_smpp_parser.py                  # summary_debug.html
+    python bench_smpp_parser.py page1.html ...   # 직접 저장한 페이지들
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import smpp_parser
+
+FIXTURE_DIR = Path(__file__).resolve().parent
+DEFAULT_FIXTURES = [FIXTURE_DIR / "summary_debug.html"]
+
+CASES = [
+    ("moveForm", lambda h: smpp_parser._form_inputs_fast(h, "moveForm"), lambda h: smpp_parser._form_inputs_soup(h, "moveForm")),
+    ("기업특징", smpp_parser._feature_rows_fast, smpp_parser._feature_rows_soup),
+]
+
+
+def measure(fn, html, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(html)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SMPP 파서 벤치마크")
+    parser.add_argument("pages", nargs="*", help="저장된 HTML 파일")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    pages = [Path(p) for p in args.pages] or DEFAULT_FIXTURES
+    mismatches = 0
+    for page in pages:
+        html = page.read_text(encoding="utf-8")
+        print(f"{page.name} ({len(html) // 1024} KB)")
+        for name, fast, soup in CASES:
+            fast_ms, fast_result = measure(fast, html, args.repeat)
+            soup_ms, soup_result = measure(soup, html, max(1, args.repeat // 4))
+            same = fast_result == soup_result
+            mismatches += not same
+            print(f"  {name:<10} fast {fast_ms:8.2f} ms   soup {soup_ms:8.2f} ms   x{soup_ms / max(fast_ms, 1e-6):6.1f}"
+                  f"   {'일치' if same else '불일치'}")
+        print(f"  여성기업   {smpp_parser.parse_women_feature(html)}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""
+여러 사업자번호의 여성기업 확인일자/만료일자를 한 번에 조회.
+
+로그인 세션 하나(SmppClient)를 공유하면서 제한된 수의 스레드로 목록→상세 요청을 보내고,
+초당 요청 수 제한 / 재시도(지수 백오프)를 적용한다. 결과는 끝나는 순서대로
+JSON 한 줄씩 출력된다.
+
+    python smpp_batch.py 212-81-96729 216-81-15499
+    python smpp_batch.py --file biznos.txt --workers 4 --rate 2
+    python smpp_batch.py --db ../python/전기.xlsx > women.jsonl
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+
+import smpp_women_test as smpp
+from smpp_cache import DEFAULT_CACHE_PATH, SmppCache
+from smpp_client import DEFAULT_COOKIE_PATH, DEFAULT_TIMEOUT, SessionExpired, SmppClient
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """토큰 버킷: 초당 rate 개, 최대 burst 개까지 몰아서 허용."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def normalize_biz_no(biz_no) -> str:
+    return re.sub(r"\D", "", str(biz_no or ""))
+
+
+def check_one(client, biz_no, limiter, retries=3, backoff=1.0) -> dict:
+    """
+    사업자번호 하나 조회. 네트워크 오류와 429/5xx 는 backoff * 2^n 초 쉬고 재시도.
+    status: women(여성기업), none(해당없음), login(다시 로그인해도 실패), error
+    """
+    result = {"bizNo": biz_no, "digits": normalize_biz_no(biz_no), "status": "error",
+              "confirm": None, "expire": None, "error": None, "attempts": 0, "cached": False}
+    for attempt in range(retries + 1):
+        result["attempts"] = attempt + 1
+        try:
+            confirm, expire = client.lookup(result["digits"], limiter.acquire)
+        except SessionExpired as exc:
+            result.update(status="login", error=str(exc))
+            return result
+        except requests.HTTPError as exc:
+            code = exc.response.status_code if exc.response is not None else None
+            result["error"] = f"HTTP {code}"
+            if code not in RETRY_STATUS:
+                return result
+        except requests.RequestException as exc:
+            result["error"] = type(exc).__name__
+        except RuntimeError as exc:
+            # moveForm/기업특징 구조가 예상과 다름 → 재시도해도 같음
+            result["error"] = str(exc)
+            return result
+        else:
+            result.update(status="women" if (confirm or expire) else "none",
+                          confirm=confirm, expire=expire, error=None)
+            return result
+        if attempt < retries:
+            time.sleep(backoff * (2 ** attempt))
+    return result
+
+
+def verify_many(client, biz_nos, workers=4, rate=2.0, retries=3, backoff=1.0, cache=None, refresh=False,
+                save_every=50):
+    """
+    끝나는 순서대로 결과 dict 를 yield. 같은 번호(숫자 기준)는 한 번만 조회.
+    cache(SmppCache)가 있으면 아직 유효한 번호는 요청 없이 캐시 결과를 먼저 내보내고,
+    새로 조회한 결과는 save_every 건마다/끝날 때 저장. refresh 면 캐시를 읽지 않고 저장만 함.
+    """
+    seen = set()
+    unique = []
+    for biz_no in biz_nos:
+        digits = normalize_biz_no(biz_no)
+        if digits in seen:
+            continue
+        seen.add(digits)
+        if len(digits) != 10:
+            yield {"bizNo": biz_no, "digits": digits, "status": "error", "confirm": None,
+                   "expire": None, "error": "사업자번호 형식 오류", "attempts": 0, "cached": False}
+            continue
+        hit = cache.get(digits) if cache is not None and not refresh else None
+        if hit is not None:
+            yield {"bizNo": biz_no, "digits": digits, "status": hit["status"], "confirm": hit.get("confirm"),
+                   "expire": hit.get("expire"), "error": None, "attempts": 0, "cached": True}
+            continue
+        unique.append(biz_no)
+    if not unique:
+        return
+    limiter = RateLimiter(rate, burst=workers)
+    done = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            futures = [pool.submit(check_one, client, b, limiter, retries, backoff) for b in unique]
+            for future in as_completed(futures):
+                result = future.result()
+                if cache is not None:
+                    cache.put(result)
+                    done += 1
+                    if done % save_every == 0:
+                        cache.save()
+                yield result
+    finally:
+        if cache is not None:
+            cache.save()
+
+
+def biz_nos_from_db(db_path: str):
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "python"))
+    from pathlib import Path
+
+    from db_loader import load_db_cached
+
+    return [b for b in load_db_cached(Path(db_path)).column("bizNo") if b]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SMPP 여성기업 일괄 조회")
+    parser.add_argument("biz_nos", nargs="*", help="사업자번호")
+    parser.add_argument("--file", help="사업자번호 목록 파일 (한 줄에 하나)")
+    parser.add_argument("--db", help="협력업체 DB(.xlsx)의 사업자번호 전체")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rate", type=float, default=2.0, help="초당 요청 수 (0 = 무제한)")
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--backoff", type=float, default=1.0)
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="요청당 응답 대기 시간(초)")
+    parser.add_argument("--base-url", default=None, help="기본값: SMPP_BASE_URL 또는 https://www.smpp.go.kr")
+    parser.add_argument("--user", default=os.environ.get("SMPP_USER_ID", smpp.USER_ID))
+    parser.add_argument("--password", default=os.environ.get("SMPP_USER_PW", smpp.USER_PW))
+    parser.add_argument("--cache", default=str(DEFAULT_CACHE_PATH), help="조회 결과 캐시 파일")
+    parser.add_argument("--no-cache", action="store_true", help="캐시를 읽지도 쓰지도 않음")
+    parser.add_argument("--refresh", action="store_true", help="캐시를 무시하고 모두 다시 조회 (결과는 저장)")
+    parser.add_argument("--margin-days", type=int, default=30, help="만료 며칠 전부터 다시 조회할지")
+    parser.add_argument("--cookies", default=str(DEFAULT_COOKIE_PATH), help="로그인 쿠키 저장 파일 (빈 값 = 저장 안 함)")
+    args = parser.parse_args(argv)
+
+    biz_nos = list(args.biz_nos)
+    if args.file:
+        with open(args.file, encoding="utf-8") as f:
+            biz_nos += [line.strip() for line in f if line.strip()]
+    if args.db:
+        biz_nos += biz_nos_from_db(args.db)
+    if not biz_nos:
+        parser.error("조회할 사업자번호가 없습니다.")
+
+    if args.base_url:
+        smpp.set_base_url(args.base_url)
+    smpp.DEBUG_DUMPS = False
+    smpp.VERBOSE = False
+
+    cache = None if args.no_cache else SmppCache(args.cache, margin_days=args.margin_days)
+
+    client = SmppClient(args.user, args.password, cookie_path=args.cookies or None, pool_size=args.workers,
+                        timeout=args.timeout)
+    valid = [d for d in map(normalize_biz_no, biz_nos) if len(d) == 10]
+    if cache is None or args.refresh or not all(cache.get(d) for d in valid):
+        # 전부 캐시로 끝나면 로그인도 하지 않음. 저장된 쿠키가 있으면 그대로 써 보고,
+        # 만료됐으면 첫 요청에서 다시 로그인함
+        client.ensure_login()
+
+    counts = {}
+    cached = 0
+    started = time.monotonic()
+    for result in verify_many(client, biz_nos, args.workers, args.rate, args.retries, args.backoff,
+                              cache, refresh=args.refresh):
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+        cached += result["cached"]
+        sys.stdout.write(json.dumps(result, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+    elapsed = time.monotonic() - started
+    client.close()
+    summary = ", ".join(f"{k} {v}" for k, v in sorted(counts.items()))
+    print(f"[+] {sum(counts.values())}건 {elapsed:.1f}초 ({summary}, 캐시 {cached}, 로그인 {client.logins}회)",
+          file=sys.stderr)
+    return 0 if not counts.get("login") else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+SMPP 여성기업 조회 결과 캐시 (사업자번호 숫자 → 상태/확인일자/만료일자/조회일시).
+
+- 만료일자가 margin_days 이후인 여성기업: 만료 전까지 캐시만 사용
+- 해당없음: none_ttl_days 동안만 사용 (그 사이 인증받았을 수 있으므로)
+  (기업특징 표를 읽은 결과만 해당없음. 표가 없는 점검/오류 페이지는 클라이언트에서 오류로 처리)
+- 오류/세션만료 결과는 저장하지 않음
+"""
+
+import json
+import os
+import re
+import tempfile
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent / "smpp_cache.json"
+CACHE_FORMAT = 1
+CACHED_STATUSES = {"women", "none"}
+
+
+def parse_date(text):
+    """'2026-06-03', '2026.06.03', '2026/6/3' → date. 못 읽으면 None."""
+    m = re.search(r"(\d{4})\D+(\d{1,2})\D+(\d{1,2})", str(text or ""))
+    if not m:
+        return None
+    try:
+        return date(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+    except ValueError:
+        return None
+
+
+class SmppCache:
+    def __init__(self, path=DEFAULT_CACHE_PATH, margin_days=30, none_ttl_days=30):
+        self.path = Path(path)
+        self.margin_days = margin_days
+        self.none_ttl_days = none_ttl_days
+        self.entries = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        try:
+            payload = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            payload = {}
+        if payload.get("format") == CACHE_FORMAT:
+            self.entries = dict(payload.get("entries") or {})
+
+    def save(self):
+        if not self.dirty:
+            return
+        payload = {"format": CACHE_FORMAT, "entries": self.entries}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".smpp_cache.", dir=str(self.path.parent))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        self.dirty = False
+
+    def is_fresh(self, entry, today=None):
+        today = today or date.today()
+        if entry.get("status") == "women":
+            expire = parse_date(entry.get("expire"))
+            return expire is not None and expire - timedelta(days=self.margin_days) > today
+        if entry.get("status") == "none":
+            checked = parse_date(entry.get("checkedAt"))
+            return checked is not None and today - checked < timedelta(days=self.none_ttl_days)
+        return False
+
+    def get(self, digits, today=None):
+        """재조회가 필요 없으면 캐시된 결과, 아니면 None."""
+        entry = self.entries.get(digits)
+        if entry and self.is_fresh(entry, today):
+            return entry
+        return None
+
+    def put(self, result):
+        if result.get("status") not in CACHED_STATUSES or not result.get("digits"):
+            return
+        self.entries[result["digits"]] = {
+            "status": result["status"],
+            "confirm": result.get("confirm"),
+            "expire": result.get("expire"),
+            "checkedAt": datetime.now().isoformat(timespec="seconds"),
+        }
+        self.dirty = True
@@ -0,0 +1,210 @@
+"""
+SMPP 로그인 세션을 재사용하는 클라이언트.
+
+- 쿠키(JSESSIONID 등)를 smpp_cookies.json 에 저장해 다음 실행에서 그대로 사용
+- 응답이 로그인 페이지일 때만 다시 로그인 (여러 스레드가 동시에 만나도 로그인은 한 번)
+- 동시 조회 수에 맞춰 커넥션 풀 크기를 잡고 keep-alive 로 연결 재사용
+"""
+
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import smpp_parser
+import smpp_women_test as smpp
+
+DEFAULT_COOKIE_PATH = Path(__file__).resolve().parent / "smpp_cookies.json"
+DEFAULT_TIMEOUT = 30.0
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/142.0.0.0 Safari/537.36"
+)
+
+
+class SessionExpired(Exception):
+    pass
+
+
+class _TimeoutAdapter(HTTPAdapter):
+    """smpp_women_test 의 요청들은 timeout 을 주지 않으므로 여기서 기본값을 채움."""
+
+    def __init__(self, timeout, **kwargs):
+        self.timeout = timeout
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+class _RequestGate:
+    """요청은 여러 스레드가 동시에, 쿠키 교체는 진행 중인 요청이 모두 끝난 뒤 혼자서."""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._active = 0
+        self._exclusive = False
+
+    @contextmanager
+    def shared(self):
+        with self._cond:
+            while self._exclusive:
+                self._cond.wait()
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify_all()
+
+    @contextmanager
+    def exclusive(self):
+        with self._cond:
+            while self._exclusive:
+                self._cond.wait()
+            self._exclusive = True
+            while self._active:
+                self._cond.wait()
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._exclusive = False
+                self._cond.notify_all()
+
+
+def _new_session(timeout, pool_size):
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT, "Connection": "keep-alive"})
+    # pool_block: 풀보다 많은 스레드가 와도 연결을 새로 만들었다 버리지 않고 기다림
+    # 응답 없이 멈춘 요청은 timeout 초 뒤 ReadTimeout → smpp_batch 가 재시도
+    adapter = _TimeoutAdapter(timeout, pool_connections=2, pool_maxsize=max(1, pool_size), pool_block=True)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class SmppClient:
+    def __init__(self, user_id, password, cookie_path=DEFAULT_COOKIE_PATH, pool_size=4, timeout=DEFAULT_TIMEOUT):
+        self.user_id = user_id
+        self.password = password
+        self.cookie_path = Path(cookie_path) if cookie_path else None
+        self.timeout = timeout
+        self.session = _new_session(timeout, pool_size)
+        self.logins = 0
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._gate = _RequestGate()
+        self.has_cookies = self.load_cookies()
+
+    def load_cookies(self) -> bool:
+        if not self.cookie_path:
+            return False
+        try:
+            saved = json.loads(self.cookie_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        if saved.get("baseUrl") != smpp.BASE_URL or saved.get("user") != self.user_id:
+            return False
+        for c in saved.get("cookies") or []:
+            self.session.cookies.set(c["name"], c["value"], domain=c.get("domain", ""),
+                                     path=c.get("path", "/"), expires=c.get("expires"), secure=c.get("secure", False))
+        return bool(saved.get("cookies"))
+
+    def save_cookies(self) -> None:
+        if not self.cookie_path:
+            return
+        cookies = [
+            {"name": c.name, "value": c.value, "domain": c.domain, "path": c.path,
+             "expires": c.expires, "secure": c.secure}
+            for c in self.session.cookies
+        ]
+        payload = {"baseUrl": smpp.BASE_URL, "user": self.user_id, "cookies": cookies}
+        self.cookie_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".smpp_cookies.", dir=str(self.cookie_path.parent))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, self.cookie_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def login(self) -> None:
+        # 새 쿠키는 별도 세션에서 받아 두었다가, 공유 세션으로 나간 요청이 모두 돌아온 뒤에
+        # 통째로 바꿔 끼움. 공유 쿠키를 제자리에서 지우면 다른 스레드의 요청이 빈 쿠키로 나가고,
+        # 늦게 돌아온 로그인 페이지 응답의 Set-Cookie 가 새 세션 쿠키를 덮어쓸 수 있음.
+        login_session = _new_session(self.timeout, 1)
+        try:
+            smpp.login(login_session, self.user_id, self.password)
+        finally:
+            login_session.close()
+        with self._gate.exclusive():
+            self.session.cookies = login_session.cookies
+            self._generation += 1
+        self.logins += 1
+        self.has_cookies = True
+        self.save_cookies()
+
+    def ensure_login(self) -> None:
+        """저장된 쿠키가 없을 때만 미리 로그인. 쿠키가 만료됐으면 첫 요청에서 다시 로그인함."""
+        with self._lock:
+            if not self.has_cookies:
+                self.login()
+
+    def _relogin(self, seen_generation) -> None:
+        with self._lock:
+            # 다른 스레드가 이미 다시 로그인했으면 그 세션을 씀
+            if self._generation == seen_generation:
+                self.login()
+
+    def _request(self, fetch, arg):
+        with self._gate.shared():
+            return self._generation, fetch(self.session, arg)
+
+    def _fetch(self, fetch, arg):
+        generation, html = self._request(fetch, arg)
+        if not smpp.looks_like_login_page(html):
+            return html
+        self._relogin(generation)
+        _, html = self._request(fetch, arg)
+        if smpp.looks_like_login_page(html):
+            raise SessionExpired("다시 로그인해도 로그인 페이지가 돌아옴 (계정 확인)")
+        return html
+
+    def fetch_list_html(self, biz_no: str) -> str:
+        return self._fetch(smpp.fetch_list_html, biz_no)
+
+    def fetch_summary_html(self, payload: dict) -> str:
+        return self._fetch(smpp.fetch_summary_html, payload)
+
+    def lookup(self, biz_no: str, before_request=None):
+        """사업자번호 → (확인일자, 만료일자). before_request 는 요청 직전마다 호출 (속도 제한용)."""
+        if before_request:
+            before_request()
+        list_html = self.fetch_list_html(biz_no)
+        payload = smpp.build_move_form_payload_from_list_html(list_html, biz_no)
+        if before_request:
+            before_request()
+        summary_html = self.fetch_summary_html(payload)
+        rows = smpp_parser.feature_rows(summary_html)
+        if rows is None:
+            # 점검/오류 페이지나 화면 구조 변경: 해당없음으로 저장되지 않도록 오류로 넘김
+            raise RuntimeError("상세 페이지에서 기업특징 표를 찾지 못했습니다")
+        return smpp_parser.features_from_rows(rows).get("여성기업", (None, None))
+
+    def close(self) -> None:
+        self.save_cookies()
+        self.session.close()
@@ -0,0 +1,243 @@
+"""
+smpp.go.kr 로그인/목록/상세 페이지를 흉내내는 로컬 HTTP 서버.
+
+배치 조회 스크립트를 실서버에 부담 주지 않고 돌려보기 위한 개발용 도구.
+    python smpp_mock_server.py --port 8765
+    SMPP_BASE_URL=http://127.0.0.1:8765 python smpp_batch.py ...
+    curl -X POST http://127.0.0.1:8765/mock/expireSessions   # 세션 만료 재현
+"""
+
+import argparse
+import random
+import re
+import secrets
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+LOGIN_PAGE_PATH = "/uat/uia/egovLoginUsr.do"
+LOGIN_ACTION_PATH = "/uat/uia/actionLogin.do"
+LIST_PATH = "/cop/registcorp/selectRegistCorpListVw.do"
+SUMMARY_PATH = "/cop/registcorp/selectRegistCorpSumryInfoVw.do"
+EXPIRE_PATH = "/mock/expireSessions"
+
+LOGIN_PAGE = """<html><head><title>로그인</title></head><body>
+<form name="loginForm" id="loginForm" method="post" action="{action}">
+  <input type="hidden" name="userSe" value="GNR"/>
+  <input type="hidden" name="csrfToken" value="{csrf}"/>
+  <input type="text" name="id" title="아이디 입력" value=""/>
+  <input type="password" name="password" value=""/>
+  <button type="submit">로그인</button>
+</form></body></html>"""
+
+MAIN_PAGE = "<html><body><p>메인</p><a href=\"/uat/uia/actionLogout.do\">로그아웃</a></body></html>"
+
+LIST_PAGE = """<html><body>
+<table><tbody>{rows}</tbody></table>
+<form name="moveForm" method="post">
+  <input type="hidden" name="cntrctEsntlNo" value=""/>
+  <input type="hidden" name="menuId" value="5040101"/>
+  <input type="hidden" name="pageIndex" value="1"/>
+  <input type="hidden" name="searchBsnmNo" value="{digits}" title="검색 사업자번호"/>
+  <input type="hidden" name="bsnmNo" value="" title="사업자번호"/>
+</form></body></html>"""
+
+LIST_ROW = """<tr><td><a href="#" class="subject" onClick="javascript:fn_moveDetail('{digits}')">{name}</a></td></tr>"""
+
+SUMMARY_PAGE = """<html><body>
+<div class="tabContent a2">
+  <span class="labelType1">기업특징</span>
+  <div class="tbl_type col"><table>
+    <thead><tr><th scope="col">구분</th><th scope="col">확인기관</th><th scope="col">확인일자</th><th scope="col">만료일자</th></tr></thead>
+    <tbody>
+      <tr><td>중.소기업.소상공인</td><td colspan="3">해당사항 없음</td></tr>
+      {women}
+    </tbody>
+  </table></div>
+</div></body></html>"""
+
+WOMEN_ROW = """<tr><td>여성기업</td><td>지방중소벤처기업청</td><td>
+{confirm}
+</td><td>
+{expire}
+</td></tr>"""
+
+WOMEN_NONE = """<tr><td>여성기업</td><td colspan="3">해당사항 없음</td></tr>"""
+
+MAINTENANCE_PAGE = "<html><body><p>시스템 점검 중입니다. 잠시 후 다시 이용해 주세요.</p></body></html>"
+
+
+class MockSmpp:
+    """
+    서버 상태: 계정, 업체별 여성기업 정보, 유효 세션, 요청 수.
+    - companies: {사업자번호 숫자: (확인일자, 만료일자) 또는 None}
+    - fail_rate: 목록/상세 요청 중 이 비율만큼 503 응답
+    - stall_rate / stall: 목록/상세 요청 중 이 비율만큼 stall 초 동안 응답을 미룸 (타임아웃 재현)
+    - latency: 요청당 지연(초)
+    - maintenance: 상세 요청에 기업특징 표가 없는 점검 페이지를 200 으로 돌려줌
+    """
+
+    def __init__(self, user_id="test", password="test", companies=None, fail_rate=0.0, latency=0.0, seed=7,
+                 stall_rate=0.0, stall=5.0, maintenance=False):
+        self.user_id = user_id
+        self.password = password
+        self.companies = dict(companies or {})
+        self.fail_rate = fail_rate
+        self.latency = latency
+        self.stall_rate = stall_rate
+        self.stall = stall
+        self.maintenance = maintenance
+        self.sessions = set()
+        self.hits = {}
+        self._rnd = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def count(self, path):
+        with self._lock:
+            self.hits[path] = self.hits.get(path, 0) + 1
+
+    def expire_sessions(self):
+        """로그인된 세션을 모두 끊음 (세션 만료 재현용)."""
+        with self._lock:
+            self.sessions.clear()
+
+    def should_fail(self):
+        with self._lock:
+            return self.fail_rate > 0 and self._rnd.random() < self.fail_rate
+
+    def should_stall(self):
+        with self._lock:
+            return self.stall_rate > 0 and self._rnd.random() < self.stall_rate
+
+
+def _handler_for(state):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            pass
+
+        def _session_id(self):
+            cookie = self.headers.get("Cookie") or ""
+            m = re.search(r"JSESSIONID=([0-9a-f]+)", cookie)
+            return m.group(1) if m else None
+
+        def _form(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length).decode("utf-8") if length else ""
+            return {k: v[0] for k, v in parse_qs(body, keep_blank_values=True).items()}
+
+        def _send(self, status, html, cookie=None):
+            body = html.encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "text/html; charset=UTF-8")
+            self.send_header("Content-Length", str(len(body)))
+            if cookie:
+                self.send_header("Set-Cookie", f"JSESSIONID={cookie}; Path=/")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _login_page(self, status=200):
+            sid = secrets.token_hex(8)
+            self._send(status, LOGIN_PAGE.format(action=LOGIN_ACTION_PATH, csrf=secrets.token_hex(4)), cookie=sid)
+
+        def do_GET(self):
+            path = self.path.split("?")[0]
+            state.count(path)
+            if path == LOGIN_PAGE_PATH:
+                self._login_page()
+            else:
+                self._send(404, "not found")
+
+        def do_POST(self):
+            path = self.path.split("?")[0]
+            state.count(path)
+            form = self._form()
+            if state.latency:
+                time.sleep(state.latency)
+            if path == EXPIRE_PATH:
+                state.expire_sessions()
+                self._send(200, "expired")
+                return
+            if path == LOGIN_ACTION_PATH:
+                sid = self._session_id()
+                if sid and form.get("id") == state.user_id and form.get("password") == state.password:
+                    with state._lock:
+                        state.sessions.add(sid)
+                    self._send(200, MAIN_PAGE)
+                else:
+                    self._login_page()
+                return
+            if path not in (LIST_PATH, SUMMARY_PATH):
+                self._send(404, "not found")
+                return
+            if self._session_id() not in state.sessions:
+                # 실서버처럼 세션이 없으면 200 으로 로그인 페이지를 돌려줌
+                self._login_page()
+                return
+            if state.should_stall():
+                time.sleep(state.stall)
+            if state.should_fail():
+                self._send(503, "busy")
+                return
+            if path == LIST_PATH:
+                digits = re.sub(r"\D", "", form.get("searchBsnmNo", ""))
+                rows = LIST_ROW.format(digits=digits, name=f"업체{digits[-4:]}") if digits in state.companies else ""
+                self._send(200, LIST_PAGE.format(rows=rows, digits=digits))
+                return
+            if state.maintenance:
+                self._send(200, MAINTENANCE_PAGE)
+                return
+            info = state.companies.get(re.sub(r"\D", "", form.get("bsnmNo", "")))
+            women = WOMEN_ROW.format(confirm=info[0], expire=info[1]) if info else WOMEN_NONE
+            self._send(200, SUMMARY_PAGE.format(women=women))
+
+    return Handler
+
+
+def start_mock_server(state=None, port=0):
+    """백그라운드 스레드로 서버 시작. (server, state, base_url) 반환."""
+    state = state or MockSmpp()
+    server = ThreadingHTTPServer(("127.0.0.1", port), _handler_for(state))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def sample_companies(count=200, women_ratio=0.3, seed=7):
+    rnd = random.Random(seed)
+    companies = {}
+    for _ in range(count):
+        digits = f"{rnd.randint(100, 999)}{rnd.randint(10, 99)}{rnd.randint(10000, 99999)}"
+        if rnd.random() < women_ratio:
+            year = rnd.randint(2022, 2026)
+            companies[digits] = (f"{year}-{rnd.randint(1, 12):02d}-01", f"{year + 3}-{rnd.randint(1, 12):02d}-28")
+        else:
+            companies[digits] = None
+    return companies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SMPP 모의 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--companies", type=int, default=200)
+    parser.add_argument("--fail-rate", type=float, default=0.0)
+    parser.add_argument("--stall-rate", type=float, default=0.0)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    state = MockSmpp(companies=sample_companies(args.companies), fail_rate=args.fail_rate, latency=args.latency,
+                     stall_rate=args.stall_rate)
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), _handler_for(state))
+    server.daemon_threads = True
+    print(f"[+] 모의 SMPP 서버: http://127.0.0.1:{args.port} (계정 {state.user_id}/{state.password})")
+    print("[+] 사업자번호 예:", ", ".join(list(state.companies)[:5]))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
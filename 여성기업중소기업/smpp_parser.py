@@ -0,0 +1,158 @@
+"""
+SMPP 페이지 파싱.
+
+빠른 경로: 필요한 <form> / 기업특징 <table> 구간만 정규식으로 잘라서 읽음.
+느린 경로: 빠른 경로가 구조를 못 찾을 때만 BeautifulSoup(html.parser)로 전체 트리를 만듦.
+상세 페이지 한 장이 300KB 가까이 되므로 트리 생성을 피하는 것만으로도 대부분의 시간이 줄어듦.
+"""
+
+import html as htmllib
+import re
+
+_ATTR_RE = re.compile(r"""([\w:-]+)\s*(?:=\s*("[^"]*"|'[^']*'|[^\s"'>]+))?""")
+_INPUT_RE = re.compile(r"<input\b([^>]*)>", re.I)
+_FORM_OPEN_RE = re.compile(r"<form\b([^>]*)>", re.I)
+_FORM_CLOSE_RE = re.compile(r"</form\s*>", re.I)
+_LABEL_RE = re.compile(r"<span\b([^>]*)>([^<]*)</span>", re.I)
+_TABLE_RE = re.compile(r"<table\b.*?</table\s*>", re.I | re.S)
+_TBODY_RE = re.compile(r"<tbody\b[^>]*>(.*?)</tbody\s*>", re.I | re.S)
+_TR_RE = re.compile(r"<tr\b[^>]*>(.*?)</tr\s*>", re.I | re.S)
+_TD_RE = re.compile(r"<td\b[^>]*>(.*?)</td\s*>", re.I | re.S)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+NOT_APPLICABLE = "해당사항 없음"
+
+
+def _attrs(text):
+    attrs = {}
+    for m in _ATTR_RE.finditer(text):
+        value = m.group(2)
+        if value is None:
+            value = ""
+        elif value[:1] in "\"'":
+            value = value[1:-1]
+        attrs.setdefault(m.group(1).lower(), htmllib.unescape(value))
+    return attrs
+
+
+def _in_script(html, pos):
+    return html.rfind("<script", 0, pos) > html.rfind("</script", 0, pos)
+
+
+def _cell_text(fragment):
+    # BeautifulSoup get_text(strip=True) 와 같은 결과: 태그 사이 텍스트 조각을 각각 strip 해서
+    # 빈 조각은 버리고 구분자 없이 이어붙임 (조각 안의 공백은 그대로 둠)
+    pieces = (htmllib.unescape(piece).strip() for piece in _TAG_RE.split(fragment))
+    return "".join(piece for piece in pieces if piece)
+
+
+def _form_inputs_fast(html, form_name):
+    for m in _FORM_OPEN_RE.finditer(html):
+        attrs = _attrs(m.group(1))
+        if form_name not in (attrs.get("name"), attrs.get("id")) or _in_script(html, m.start()):
+            continue
+        close = _FORM_CLOSE_RE.search(html, m.end())
+        body = html[m.end():close.start() if close else len(html)]
+        fields = {}
+        for inp in _INPUT_RE.finditer(body):
+            a = _attrs(inp.group(1))
+            if a.get("name"):
+                fields[a["name"]] = a.get("value", "")
+        return fields
+    return None
+
+
+def _form_inputs_soup(html, form_name):
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    form = soup.find("form", attrs={"name": form_name}) or soup.find("form", attrs={"id": form_name})
+    if not form:
+        return None
+    fields = {}
+    for inp in form.find_all("input"):
+        name = inp.get("name")
+        if name:
+            fields[name] = inp.get("value", "")
+    return fields
+
+
+def form_inputs(html, form_name):
+    """form name(또는 id)이 form_name 인 폼의 input name→value. 폼이 없으면 None."""
+    fields = _form_inputs_fast(html, form_name)
+    if fields is None:
+        fields = _form_inputs_soup(html, form_name)
+    return fields
+
+
+def _feature_rows_fast(html):
+    for m in _LABEL_RE.finditer(html):
+        if "기업특징" not in m.group(2) or "labelType1" not in _attrs(m.group(1)).get("class", "").split():
+            continue
+        if _in_script(html, m.start()):
+            continue
+        table = _TABLE_RE.search(html, m.end())
+        if not table:
+            return None
+        body = _TBODY_RE.search(table.group(0))
+        rows = []
+        for tr in _TR_RE.finditer(body.group(1) if body else table.group(0)):
+            cells = [_cell_text(td) for td in _TD_RE.findall(tr.group(1))]
+            if cells:
+                rows.append(cells)
+        return rows
+    return None
+
+
+def _feature_rows_soup(html):
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+    span = soup.find("span", class_="labelType1", string=lambda t: t and "기업특징" in t)
+    table = span.find_next("table") if span else None
+    if not table:
+        return None
+    tbody = table.find("tbody") or table
+    rows = []
+    for tr in tbody.find_all("tr"):
+        cells = [td.get_text(strip=True) for td in tr.find_all("td")]
+        if cells:
+            rows.append(cells)
+    return rows
+
+
+def feature_rows(html):
+    """기업특징 표의 행 목록 [[구분, 확인기관, 확인일자, 만료일자], ...]. 표가 없으면 None."""
+    rows = _feature_rows_fast(html)
+    if rows is None:
+        rows = _feature_rows_soup(html)
+    return rows
+
+
+def parse_features(html):
+    """기업특징 표 → {구분: (확인일자, 만료일자)}. 해당사항 없음이면 (None, None)."""
+    return features_from_rows(feature_rows(html) or [])
+
+
+def features_from_rows(rows):
+    """feature_rows 결과 → parse_features 와 같은 dict."""
+    features = {}
+    for cells in rows:
+        if cells[0] in features:
+            continue
+        if any(NOT_APPLICABLE in c for c in cells[1:]):
+            features[cells[0]] = (None, None)
+            continue
+        confirm = cells[2] if len(cells) > 2 else None
+        expire = cells[3] if len(cells) > 3 else None
+        features[cells[0]] = (confirm or None, expire or None)
+    return features
+
+
+def parse_women_feature(html):
+    return parse_features(html).get("여성기업", (None, None))
+
+
+def looks_like_login_page(html):
+    """응답 HTML이 다시 로그인 페이지인지 대충 판별."""
+    return ('name="loginForm"' in html) and ("로그인" in html or "아이디 입력" in html)
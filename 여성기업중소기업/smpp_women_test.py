@@ -1,6 +1,8 @@
+import os
 import re
 import requests
-from bs4 import BeautifulSoup
+
+import smpp_parser
 
 # ==========================
 # 1. 여기에 네 계정/사업자번호 입력
@@ -10,13 +12,38 @@ USER_PW = "jium2635"      # 예: "abcd1234!"
 BIZ_NO  = "212-81-96729"        # 테스트할 사업자등록번호
 
 
-# 로그인 페이지(폼 있는 곳) & 액션 URL
-LOGIN_PAGE_URL   = "https://www.smpp.go.kr/uat/uia/egovLoginUsr.do"
-LOGIN_ACTION_URL = "https://www.smpp.go.kr/uat/uia/actionLogin.do"
+# 디버그 HTML 저장은 SMPP_DEBUG_DUMPS=1 일 때만, 진행 로그는 배치 조회에서 끔
+DEBUG_DUMPS = os.environ.get("SMPP_DEBUG_DUMPS", "").lower() in {"1", "true", "on"}
+VERBOSE = True
+
+# SMPP_BASE_URL 로 로컬 모의 서버(smpp_mock_server.py) 등을 가리킬 수 있음
+BASE_URL = os.environ.get("SMPP_BASE_URL", "https://www.smpp.go.kr").rstrip("/")
+
+
+def set_base_url(base_url: str) -> None:
+    """로그인/목록/상세 URL을 base_url 기준으로 다시 설정."""
+    global BASE_URL, LOGIN_PAGE_URL, LOGIN_ACTION_URL, LIST_URL, SUMMARY_URL
+    BASE_URL = base_url.rstrip("/")
+    # 로그인 페이지(폼 있는 곳) & 액션 URL
+    LOGIN_PAGE_URL = BASE_URL + "/uat/uia/egovLoginUsr.do"
+    LOGIN_ACTION_URL = BASE_URL + "/uat/uia/actionLogin.do"
+    # 목록 / 상세 URL
+    LIST_URL = BASE_URL + "/cop/registcorp/selectRegistCorpListVw.do"
+    SUMMARY_URL = BASE_URL + "/cop/registcorp/selectRegistCorpSumryInfoVw.do"
+
+
+set_base_url(BASE_URL)
 
-# 목록 / 상세 URL
-LIST_URL    = "https://www.smpp.go.kr/cop/registcorp/selectRegistCorpListVw.do"
-SUMMARY_URL = "https://www.smpp.go.kr/cop/registcorp/selectRegistCorpSumryInfoVw.do"
+
+def _log(*args) -> None:
+    if VERBOSE:
+        print(*args)
+
+
+def _dump(filename: str, html: str) -> None:
+    if DEBUG_DUMPS:
+        with open(filename, "w", encoding="utf-8") as f:
+            f.write(html)
 
 
 def login(session: requests.Session, user_id: str, password: str) -> None:
@@ -36,29 +63,15 @@ def login(session: requests.Session, user_id: str, password: str) -> None:
 
     # 1) 로그인 페이지 GET
     pre = session.get(LOGIN_PAGE_URL, headers=headers)
-    print(f"[+] 로그인 페이지 GET 응답: {pre.status_code}, url={pre.url}")
+    _log(f"[+] 로그인 페이지 GET 응답: {pre.status_code}, url={pre.url}")
 
-    with open("login_page_debug.html", "w", encoding="utf-8") as f:
-        f.write(pre.text)
+    _dump("login_page_debug.html", pre.text)
 
-    soup = BeautifulSoup(pre.text, "html.parser")
-
-    # loginForm 찾기
-    form = soup.find("form", attrs={"name": "loginForm"}) or soup.find(
-        "form", attrs={"id": "loginForm"}
-    )
-    if not form:
+    # loginForm 찾기 + 2) 폼 안의 input들을 dict로 만들기
+    form_data = smpp_parser.form_inputs(pre.text, "loginForm")
+    if form_data is None:
         raise RuntimeError("로그인 폼(loginForm)을 찾지 못했습니다.")
 
-    # 2) 폼 안의 input들을 dict로 만들기
-    form_data = {}
-    for inp in form.find_all("input"):
-        name = inp.get("name")
-        if not name:
-            continue
-        value = inp.get("value", "")
-        form_data[name] = value
-
     # 3) id / password 값 덮어쓰기
     form_data["id"] = user_id
     form_data["password"] = password
@@ -66,17 +79,14 @@ def login(session: requests.Session, user_id: str, password: str) -> None:
     # 4) 실제 로그인 POST
     headers_post = {
         "User-Agent": headers["User-Agent"],
-        "Origin": "https://www.smpp.go.kr",
+        "Origin": BASE_URL,
         "Referer": LOGIN_PAGE_URL,
     }
 
     resp = session.post(LOGIN_ACTION_URL, headers=headers_post, data=form_data)
-    print(f"[+] 로그인 POST 응답: {resp.status_code}, url={resp.url}")
-
-    with open("login_result_debug.html", "w", encoding="utf-8") as f:
-        f.write(resp.text)
+    _log(f"[+] 로그인 POST 응답: {resp.status_code}, url={resp.url}")
 
-    print("[*] 로그인 결과 HTML을 login_result_debug.html 에 저장했습니다.")
+    _dump("login_result_debug.html", resp.text)
 
 
 def fetch_list_html(session: requests.Session, biz_no: str) -> str:
@@ -109,19 +119,18 @@ def fetch_list_html(session: requests.Session, biz_no: str) -> str:
     }
 
     resp = session.post(LIST_URL, data=data)
-    print(f"[+] 목록 조회 응답: {resp.status_code}, url={resp.url}")
+    _log(f"[+] 목록 조회 응답: {resp.status_code}, url={resp.url}")
     resp.raise_for_status()
 
     # 디버그용 저장
-    with open("list_debug.html", "w", encoding="utf-8") as f:
-        f.write(resp.text)
+    _dump("list_debug.html", resp.text)
 
     return resp.text
 
 
 def looks_like_login_page(html: str) -> bool:
     """응답 HTML이 다시 로그인 페이지인지 대충 판별."""
-    return ('name="loginForm"' in html) and ("로그인" in html or "아이디 입력" in html)
+    return smpp_parser.looks_like_login_page(html)
 
 
 def build_move_form_payload_from_list_html(html: str, biz_no: str) -> dict:
@@ -132,20 +141,10 @@ def build_move_form_payload_from_list_html(html: str, biz_no: str) -> dict:
       -> moveForm.bsnmNo = bsnmNo
       -> action = /cop/registcorp/selectRegistCorpSumryInfoVw.do
     """
-    soup = BeautifulSoup(html, "html.parser")
-
-    form = soup.find("form", attrs={"name": "moveForm"})
-    if not form:
+    payload = smpp_parser.form_inputs(html, "moveForm")
+    if payload is None:
         raise RuntimeError("moveForm 폼을 찾지 못했습니다.")
 
-    payload = {}
-    for inp in form.find_all("input"):
-        name = inp.get("name")
-        if not name:
-            continue
-        value = inp.get("value", "")
-        payload[name] = value
-
     # 사업자번호에서 숫자만 추출해서 bsnmNo 에 세팅
     digits = re.sub(r"\D", "", biz_no)
     payload["bsnmNo"] = digits
@@ -160,11 +159,10 @@ def build_move_form_payload_from_list_html(html: str, biz_no: str) -> dict:
 def fetch_summary_html(session: requests.Session, payload: dict) -> str:
     """상세 요약(기업특징) HTML 조회."""
     resp = session.post(SUMMARY_URL, data=payload)
-    print(f"[+] 상세 페이지 응답: {resp.status_code}, url={resp.url}")
+    _log(f"[+] 상세 페이지 응답: {resp.status_code}, url={resp.url}")
     resp.raise_for_status()
 
-    with open("summary_debug.html", "w", encoding="utf-8") as f:
-        f.write(resp.text)
+    _dump("summary_debug.html", resp.text)
 
     return resp.text
 
@@ -174,41 +172,7 @@ def parse_women_feature(summary_html: str):
     상세 요약 HTML에서 '여성기업' 행의 확인일자 / 만료일자를 추출.
     없거나 '해당사항 없음'이면 (None, None) 반환.
     """
-    soup = BeautifulSoup(summary_html, "html.parser")
-
-    # '기업특징' 라벨 span 기준으로 table 찾기 (class 조합에 덜 민감하게)
-    span = soup.find("span", class_="labelType1", string=lambda t: t and "기업특징" in t)
-    if not span:
-        return None, None
-
-    table = span.find_next("table")
-    if not table:
-        return None, None
-
-    tbody = table.find("tbody") or table
-
-    for tr in tbody.find_all("tr"):
-        tds = tr.find_all("td")
-        if not tds:
-            continue
-
-        kind = tds[0].get_text(strip=True)
-        if kind != "여성기업":
-            continue
-
-        # "해당사항 없음" 케이스
-        if any("해당사항 없음" in td.get_text() for td in tds[1:]):
-            return None, None
-
-        confirm = tds[2].get_text(strip=True) if len(tds) > 2 else None
-        expire = tds[3].get_text(strip=True) if len(tds) > 3 else None
-
-        confirm = confirm or None
-        expire = expire or None
-
-        return confirm, expire
-
-    return None, None
+    return smpp_parser.parse_women_feature(summary_html)
 
 
 def main():
@@ -228,7 +192,7 @@ def main():
     # 목록이 다시 로그인 페이지면 로그인 실패로 간주
     if looks_like_login_page(list_html):
         print("[!] 목록 대신 로그인 페이지가 돌아온 것 같습니다.")
-        print("    list_debug.html / login_result_debug.html 을 열어서 실제 내용을 확인해보세요.")
+        print("    SMPP_DEBUG_DUMPS=1 로 다시 실행해서 list_debug.html / login_result_debug.html 을 확인해보세요.")
         return
 
     # 3) moveForm 기반 payload 생성
@@ -0,0 +1,131 @@
+"""
+smpp_batch 를 로컬 모의 서버(smpp_mock_server)에 대고 돌려보는 테스트.
+
+    python -m pytest -q 여성기업중소기업
+"""
+
+import time
+from contextlib import contextmanager
+
+import smpp_women_test as smpp
+from smpp_batch import RateLimiter, check_one, verify_many
+from smpp_client import SmppClient
+from smpp_mock_server import LIST_PATH, SUMMARY_PATH, MockSmpp, sample_companies, start_mock_server
+
+
+@contextmanager
+def mock_client(companies=None, timeout=5.0, workers=4, cookie_path=None, **server_options):
+    state = MockSmpp(companies=companies, **server_options)
+    server, state, base_url = start_mock_server(state)
+    smpp.set_base_url(base_url)
+    smpp.VERBOSE = False
+    smpp.DEBUG_DUMPS = False
+    client = SmppClient(state.user_id, state.password, cookie_path=cookie_path, pool_size=workers, timeout=timeout)
+    try:
+        client.ensure_login()
+        yield client, state
+    finally:
+        client.close()
+        server.shutdown()
+        server.server_close()
+
+
+def expected_status(companies, digits):
+    info = companies.get(digits)
+    if info is None:
+        return "none", None, None
+    return "women", info[0], info[1]
+
+
+def format_biz_no(digits):
+    return f"{digits[:3]}-{digits[3:5]}-{digits[5:]}"
+
+
+def test_rate_limiter_caps_throughput():
+    companies = sample_companies(12, seed=1)
+    rate, workers = 20.0, 4
+    with mock_client(companies, workers=workers) as (client, state):
+        started = time.monotonic()
+        results = list(verify_many(client, list(companies), workers=workers, rate=rate))
+        elapsed = time.monotonic() - started
+        requests_made = state.hits.get(LIST_PATH, 0) + state.hits.get(SUMMARY_PATH, 0)
+    assert len(results) == len(companies)
+    assert requests_made == 2 * len(companies)
+    # 처음 burst(=workers) 개만 바로 나가고 나머지는 초당 rate 개씩
+    assert elapsed >= (requests_made - workers) / rate * 0.9
+
+
+def test_rate_limiter_burst_then_steady():
+    limiter = RateLimiter(50.0, burst=5)
+    started = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+    assert time.monotonic() - started < 0.05
+    for _ in range(10):
+        limiter.acquire()
+    assert time.monotonic() - started >= 10 / 50.0 * 0.9
+
+
+def test_503_is_retried_with_backoff():
+    digits = next(iter(sample_companies(1, seed=2)))
+    with mock_client({digits: None}, fail_rate=1.0) as (client, state):
+        started = time.monotonic()
+        result = check_one(client, digits, RateLimiter(0), retries=3, backoff=0.05)
+        elapsed = time.monotonic() - started
+        list_hits = state.hits.get(LIST_PATH, 0)
+    assert result["status"] == "error"
+    assert result["error"] == "HTTP 503"
+    assert result["attempts"] == 4
+    assert list_hits == 4
+    # 0.05 + 0.1 + 0.2 초를 쉬고 네 번 시도
+    assert elapsed >= 0.35 * 0.9
+
+
+def test_timeout_is_retried_with_backoff():
+    digits = next(iter(sample_companies(1, seed=3)))
+    with mock_client({digits: None}, timeout=0.1, stall_rate=1.0, stall=1.0) as (client, state):
+        started = time.monotonic()
+        result = check_one(client, digits, RateLimiter(0), retries=2, backoff=0.05)
+        elapsed = time.monotonic() - started
+    assert result["status"] == "error"
+    assert result["error"] == "ReadTimeout"
+    assert result["attempts"] == 3
+    # 타임아웃 3번 + 0.05 + 0.1 초 백오프
+    assert elapsed >= (3 * 0.1 + 0.15) * 0.9
+
+
+def test_verify_many_returns_every_number_despite_failures():
+    companies = sample_companies(40, women_ratio=0.4, seed=4)
+    biz_nos = [format_biz_no(d) for d in companies]
+    biz_nos += [biz_nos[0], "12-34", "999-99-99999"]
+    with mock_client(companies, timeout=0.2, workers=6, fail_rate=0.2, stall_rate=0.02, stall=0.5) as (client, _):
+        results = list(verify_many(client, biz_nos, workers=6, rate=0, retries=10, backoff=0.002))
+
+    by_digits = {r["digits"]: r for r in results}
+    # 중복 번호는 한 번만, 형식 오류 번호도 결과는 돌려줌
+    assert len(results) == len(companies) + 2
+    assert by_digits["1234"]["status"] == "error"
+    assert by_digits["9999999999"]["status"] == "none"
+    retried = 0
+    for digits in companies:
+        result = by_digits[digits]
+        status, confirm, expire = expected_status(companies, digits)
+        assert (result["status"], result["confirm"], result["expire"]) == (status, confirm, expire), result
+        retried += result["attempts"] > 1
+    assert retried > 0
+
+
+def test_results_stream_as_they_complete():
+    companies = sample_companies(8, seed=5)
+    with mock_client(companies, workers=2, latency=0.1) as (client, state):
+        started = time.monotonic()
+        arrivals = []
+        summaries_at_first = None
+        for _ in verify_many(client, list(companies), workers=2, rate=0):
+            arrivals.append(time.monotonic() - started)
+            if summaries_at_first is None:
+                summaries_at_first = state.hits.get(SUMMARY_PATH, 0)
+    assert len(arrivals) == len(companies)
+    # 첫 결과는 나머지 조회가 끝나기 전에 나옴
+    assert summaries_at_first < len(companies)
+    assert arrivals[0] < arrivals[-1] / 2
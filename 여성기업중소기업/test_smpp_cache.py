@@ -0,0 +1,55 @@
+"""
+smpp_cache 유효기간 / 저장 테스트와, 표를 못 읽은 결과가 해당없음으로 캐시되지 않는지 확인.
+
+    python -m pytest -q 여성기업중소기업
+"""
+
+from datetime import date, datetime
+
+from smpp_batch import verify_many
+from smpp_cache import SmppCache
+from smpp_mock_server import sample_companies
+from test_smpp_batch import mock_client
+
+
+def test_women_cached_until_margin_before_expire(tmp_path):
+    cache = SmppCache(tmp_path / "cache.json", margin_days=30)
+    cache.put({"digits": "1234567890", "status": "women", "confirm": "2025-01-01", "expire": "2026-12-31"})
+    assert cache.get("1234567890", today=date(2026, 11, 30))["status"] == "women"
+    assert cache.get("1234567890", today=date(2026, 12, 1)) is None
+
+
+def test_none_expires_after_ttl_and_errors_are_not_stored(tmp_path):
+    cache = SmppCache(tmp_path / "cache.json", none_ttl_days=30)
+    cache.put({"digits": "1234567890", "status": "none"})
+    cache.put({"digits": "9876543210", "status": "error", "error": "HTTP 503"})
+    checked = datetime.fromisoformat(cache.entries["1234567890"]["checkedAt"]).date()
+    assert cache.get("1234567890", today=checked)["status"] == "none"
+    assert cache.get("1234567890", today=date.fromordinal(checked.toordinal() + 30)) is None
+    assert "9876543210" not in cache.entries
+
+
+def test_save_and_reload(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = SmppCache(path)
+    cache.put({"digits": "1234567890", "status": "women", "confirm": "2025-01-01", "expire": "2099-01-01"})
+    cache.save()
+    assert SmppCache(path).get("1234567890")["expire"] == "2099-01-01"
+
+
+def test_missing_feature_table_is_an_error_and_not_cached(tmp_path):
+    # 점검/오류 페이지처럼 기업특징 표가 없으면 해당없음이 아니라 오류, 다음 실행에서 다시 조회
+    companies = {digits: None for digits in sample_companies(3, seed=9)}
+    cache = SmppCache(tmp_path / "cache.json")
+    with mock_client(companies, maintenance=True) as (client, _):
+        results = list(verify_many(client, list(companies), workers=2, rate=0, cache=cache))
+    assert len(results) == len(companies)
+    assert all(r["status"] == "error" and "기업특징" in r["error"] for r in results), results
+    assert cache.entries == {}
+    assert not (tmp_path / "cache.json").exists()
+
+    with mock_client(companies) as (client, _):
+        results = list(verify_many(client, list(companies), workers=2, rate=0, cache=cache))
+    assert {r["status"] for r in results} == {"none"}
+    assert not any(r["cached"] for r in results)
+    assert set(cache.entries) == set(companies)
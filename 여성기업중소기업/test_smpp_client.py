@@ -0,0 +1,91 @@
+"""
+SmppClient 세션 재사용/재로그인 테스트 (로컬 모의 서버 사용).
+
+    python -m pytest -q 여성기업중소기업
+"""
+
+import json
+import threading
+
+import requests
+
+import smpp_women_test as smpp
+from smpp_batch import verify_many
+from smpp_client import SmppClient
+from smpp_mock_server import EXPIRE_PATH, LOGIN_ACTION_PATH, sample_companies
+from test_smpp_batch import expected_status, mock_client
+
+
+def test_expired_sessions_relogin_once_during_concurrent_run(tmp_path):
+    companies = sample_companies(60, women_ratio=0.4, seed=6)
+    cookie_path = tmp_path / "cookies.json"
+    with mock_client(companies, workers=8, cookie_path=cookie_path, latency=0.03) as (client, state):
+        assert client.logins == 1
+        results = []
+        for result in verify_many(client, list(companies), workers=8, rate=0, retries=0):
+            results.append(result)
+            if len(results) == 5:
+                # 나머지 조회가 돌고 있는 도중에 서버 쪽 세션을 모두 끊음
+                requests.post(smpp.BASE_URL + EXPIRE_PATH, timeout=5)
+        live_sessions = set(state.sessions)
+        login_posts = state.hits.get(LOGIN_ACTION_PATH, 0)
+
+    # 여러 스레드가 동시에 로그인 페이지를 받아도 다시 로그인은 한 번 (세대 카운터)
+    assert client.logins == 2
+    assert login_posts == 2
+
+    # 새 세션 쿠키가 파일에 저장되고, 그 세션이 서버에서 살아 있음
+    saved = json.loads(cookie_path.read_text(encoding="utf-8"))
+    saved_ids = {c["value"] for c in saved["cookies"] if c["name"] == "JSESSIONID"}
+    assert len(saved_ids) == 1 and saved_ids <= live_sessions
+    assert client.session.cookies.get("JSESSIONID") in saved_ids
+
+    # 재시도 없이(retries=0)도 틀린 결과나 로그인 실패가 없음
+    assert len(results) == len(companies)
+    for result in results:
+        status, confirm, expire = expected_status(companies, result["digits"])
+        assert (result["status"], result["confirm"], result["expire"]) == (status, confirm, expire), result
+
+
+def test_saved_cookies_skip_login(tmp_path):
+    companies = sample_companies(3, seed=8)
+    cookie_path = tmp_path / "cookies.json"
+    with mock_client(companies, cookie_path=cookie_path) as (first, state):
+        assert first.logins == 1
+        first.close()
+        second = SmppClient(state.user_id, state.password, cookie_path=cookie_path)
+        second.ensure_login()
+        results = list(verify_many(second, list(companies), workers=2, rate=0))
+        second.close()
+        login_posts = state.hits.get(LOGIN_ACTION_PATH, 0)
+    assert second.logins == 0
+    assert login_posts == 1
+    assert all(r["status"] in ("women", "none") for r in results)
+
+
+def test_login_swaps_cookies_only_after_in_flight_requests():
+    with mock_client(sample_companies(1, seed=9)) as (client, _):
+        old_jar = client.session.cookies
+        old_id = old_jar.get("JSESSIONID")
+        started, release = threading.Event(), threading.Event()
+
+        def slow_fetch(session, arg):
+            started.set()
+            release.wait(5)
+            return "<html>ok</html>"
+
+        request = threading.Thread(target=client._request, args=(slow_fetch, None))
+        request.start()
+        assert started.wait(5)
+        login = threading.Thread(target=client.login)
+        login.start()
+        login.join(0.5)
+        # 진행 중인 요청이 끝날 때까지 쿠키는 그대로 (제자리에서 지우지도 않음)
+        assert login.is_alive()
+        assert client.session.cookies is old_jar and old_jar.get("JSESSIONID") == old_id
+        release.set()
+        request.join(5)
+        login.join(5)
+        assert client.session.cookies is not old_jar
+        assert client.session.cookies.get("JSESSIONID") not in (None, old_id)
+        assert client.logins == 2